@@ -1,13 +1,23 @@
+import numpy as np
 import pandas as pd
 
-from typing import List, Generator, override
+from typing import Dict, List, Generator, override
 from pathlib import Path
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from threading import RLock
+
+from meta_tuner.data.utils import DATASET_FORMATS, read_dataset, write_dataset
 
 
 class PandasDatasets:
     """
     Wrapper to list of the datasets. Allows to refer to
-    items by slices, list of integers and list of datasets names.
+    items by slices, list of integers and list of datasets names,
+    as well as numpy arrays of positions or names and boolean masks.
+    Names are resolved with hash index, kept up to date when
+    `datasets_names` is set.
     """
 
     def __init__(
@@ -30,45 +40,155 @@ class PandasDatasets:
         if self.datasets_names:
             assert len(self.datasets) == len(self.datasets_names)
 
+    @property
+    def datasets_names(self) -> List[str]:
+        return self._datasets_names
+
+    @datasets_names.setter
+    def datasets_names(self, datasets_names: List[str]) -> None:
+        self._datasets_names = datasets_names
+        self._names_index: Dict[str, int] = {}
+        for i, name in enumerate(datasets_names or []):
+            self._names_index.setdefault(name, i)
+
+    def _resolve_items(
+        self, items: int | str | slice | List[int | str] | np.ndarray
+    ) -> int | slice | List[int]:
+        """
+        Translate names and boolean masks to positions of datasets.
+
+        Args:
+            items (int | str | slice | List[int | str] | np.ndarray): position,
+                name, slice, list or array of positions or names, or boolean mask
+                of length of collection.
+
+        Returns:
+            int | slice | List[int]: position, slice or list of positions.
+        """
+        if isinstance(items, (int, np.integer)) and not isinstance(items, bool):
+            return int(items)
+        elif isinstance(items, str):
+            return self._get_position(items)
+        elif isinstance(items, slice):
+            return items
+        elif isinstance(items, (list, tuple, np.ndarray, pd.Series, pd.Index)):
+            if len(items) == 0:
+                return []
+            array = np.asarray(items)
+            if array.dtype == bool:
+                if array.shape != (len(self),):
+                    raise IndexError("Boolean mask should have length of collection.")
+                return np.flatnonzero(array).tolist()
+            elif array.dtype.kind in "iu":
+                return array.tolist()
+            return [self._get_position(name) for name in items]
+        raise IndexError(f"Datasets cannot be indexed with {type(items).__name__}.")
+
+    def _get_position(self, name: str) -> int:
+        try:
+            return self._names_index[name]
+        except KeyError:
+            raise IndexError("Provided dataset name does not exist.")
+
     def __iter__(self) -> Generator[pd.DataFrame, None, None]:
         for i in range(len(self.datasets)):
             yield self[i]
 
+    def iter_prefetch(
+        self, depth: int = 2, indices: List[int] = None
+    ) -> Generator[pd.DataFrame, None, None]:
+        """
+        Iterate over datasets, reading next `depth` datasets in background
+        thread while the current one is processed. At most `depth` datasets
+        wait in queue, so memory usage is bounded.
+
+        Args:
+            depth (int, optional): Number of datasets read ahead. If 0,
+                datasets are read synchronously. Defaults to 2.
+            indices (List[int], optional): Order of datasets. If None, all
+                datasets in order of collection. Defaults to None.
+
+        Yields:
+            pd.DataFrame: next dataset.
+        """
+        indices = iter(range(len(self)) if indices is None else indices)
+        if depth == 0:
+            for i in indices:
+                yield self[i]
+            return
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = deque(
+                executor.submit(self.__getitem__, i) for i in islice(indices, depth)
+            )
+            while pending:
+                df = pending.popleft().result()
+                pending.extend(
+                    executor.submit(self.__getitem__, i) for i in islice(indices, 1)
+                )
+                yield df
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def __getitem__(
-        self, items: int | str | slice | List[int | str]
+        self, items: int | str | slice | List[int | str] | np.ndarray
     ) -> pd.DataFrame | List[pd.DataFrame]:
+        items = self._resolve_items(items)
         try:
-            if isinstance(items, slice):
-                return self.datasets[items]
-            elif isinstance(items, int):
+            if isinstance(items, (int, slice)):
                 return self.datasets[items]
-            elif isinstance(items, str):
-                return self.datasets[self.datasets_names.index(items)]
-            elif isinstance(items, list):
-                if isinstance(items[0], int):
-                    return [self.datasets[i] for i in items]
-                elif isinstance(items[0], str):
-                    return [self.datasets[self.datasets_names.index(i)] for i in items]
+            return [self.datasets[i] for i in items]
         except IndexError:
             raise IndexError("Provided index is out of range.")
-        except ValueError:
-            raise IndexError("Provided dataset name does not exist.")
 
     def __len__(self):
         return len(self.datasets)
 
-    def to_dir(self, dir_path: str | Path, parents: bool = False) -> None:
+    def get_dataset_size(self, index: int) -> int:
+        """
+        Estimate size of dataset without loading it. Used to balance
+        work between datasets of different size.
+
+        Args:
+            index (int): position of dataset.
+
+        Returns:
+            int: approximate size of dataset in bytes.
+        """
+        return int(self.datasets[index].memory_usage().sum())
+
+    def to_dir(
+        self, dir_path: str | Path, parents: bool = False, dataset_format: str = "csv"
+    ) -> None:
+        """
+        Save datasets to new directory, one file per dataset.
+
+        Args:
+            dir_path (str | Path): path of directory.
+            parents (bool, optional): If True, missing parents of directory
+                are created. Defaults to False.
+            dataset_format (str, optional): Format of files. Valid values:
+                ("csv", "parquet", "feather", "arrow"). Binary formats keep types
+                of columns and are faster to load, "arrow" files can be
+                memory-mapped by LazyPandasDatasets. Defaults to "csv".
+        """
+        if dataset_format not in DATASET_FORMATS:
+            raise ValueError(
+                f'For arg "dataset_format" only {tuple(DATASET_FORMATS)} are allowed. {dataset_format} provided'
+            )
         dir_path = Path(dir_path)
+        suffix = DATASET_FORMATS[dataset_format][0]
 
         dir_path.mkdir(parents=parents, exist_ok=False)
 
         if self.datasets_names is not None:
-            files_names = [f"{name}.csv" for name in self.datasets_names]
+            files_names = [f"{name}{suffix}" for name in self.datasets_names]
         else:
-            files_names = [f"data_{i}.csv" for i in range(len(self.datasets))]
+            files_names = [f"data_{i}{suffix}" for i in range(len(self.datasets))]
 
         for df, name in zip(self, files_names):
-            df.to_csv(dir_path / name)
+            write_dataset(df, dir_path / name)
 
 
 class OpenmlPandasDatasets(PandasDatasets):
@@ -93,6 +213,17 @@ class OpenmlPandasDatasets(PandasDatasets):
         self.openml_ids = openml_ids
         self.__check_init()
 
+    @property
+    def openml_ids(self) -> List[int]:
+        return self._openml_ids
+
+    @openml_ids.setter
+    def openml_ids(self, openml_ids: List[int]) -> None:
+        self._openml_ids = openml_ids
+        self._ids_index: Dict[int, int] = {}
+        for i, openml_id in enumerate(openml_ids):
+            self._ids_index.setdefault(int(openml_id), i)
+
     @override
     def __check_init(self) -> None:
         assert len(self.openml_ids) == len(self.datasets)
@@ -100,7 +231,7 @@ class OpenmlPandasDatasets(PandasDatasets):
             assert len(self.datasets) == len(self.datasets_names)
 
     def __getitem__(
-        self, items: int | str | slice | List[int | str]
+        self, items: int | str | slice | List[int | str] | np.ndarray
     ) -> pd.DataFrame | List[pd.DataFrame]:
         return super().__getitem__(items)
 
@@ -110,18 +241,17 @@ class OpenmlPandasDatasets(PandasDatasets):
         pandas way.
         """
 
-        def __init__(self, obj, openml_ids) -> None:
+        def __init__(self, obj, ids_index) -> None:
             self._obj = obj
-            self._openml_ids = openml_ids
+            self._ids_index = ids_index
 
         def __getitem__(self, items):
             try:
-                if isinstance(items, int):
-                    return self._obj[self._openml_ids.index(items)]
-                elif isinstance(items, list):
-                    if isinstance(items[0], int):
-                        return self._obj[[self._openml_ids.index(i) for i in items]]
-            except ValueError:
+                if isinstance(items, (int, np.integer)):
+                    return self._obj[self._ids_index[int(items)]]
+                elif isinstance(items, (list, tuple, np.ndarray, pd.Series)):
+                    return self._obj[[self._ids_index[int(i)] for i in items]]
+            except KeyError:
                 raise IndexError("Provided index is not in present.")
 
     @property
@@ -133,54 +263,69 @@ class OpenmlPandasDatasets(PandasDatasets):
         Returns:
             List[pd.DataFrame] | pd.DataFrame: subset of datasets.
         """
-        return self._IndexWrapper(self, self.openml_ids)
+        return self._IndexWrapper(self, self._ids_index)
 
 
 class LazyPandasDatasets(PandasDatasets):
     """
     Extension to PandasDatasets. Allows to lazy downloading
     datasets from directory and not storing data in memory.
+    Downloaded datasets can be kept in cache limited by size
+    in bytes, from which the least recently used datasets
+    are removed.
     """
 
     def __init__(
         self,
         datasets_paths: List[str | Path],
         download_datasets: bool = True,
+        memory_map: bool = False,
+        max_cache_size: int = None,
     ) -> None:
         """
         Args:
-            datasets_paths (List[str  |  Path]): path to files
+            datasets_paths (List[str  |  Path]): path to files. Format of
+                each file (csv, parquet, feather, arrow) is chosen by its extension.
             download_datasets (bool, optional): If True, datasets will
                 not be downloaded to object. Defaults to True.
+            memory_map (bool, optional): If True, files are memory-mapped. Numeric
+                columns of "arrow" files are then returned as read-only views of
+                the file, without copying them to memory of process.
+                Defaults to False.
+            max_cache_size (int, optional): Maximal size in bytes (as reported
+                by `memory_usage(deep=True)`) of downloaded datasets. If None,
+                cache is not limited. Defaults to None.
         """
         datasets_path_cls = [Path(path) for path in datasets_paths]
         self.datasets_paths = datasets_path_cls
         self.download_datasets = download_datasets
+        self.memory_map = memory_map
         self.datasets_names = [path.stem for path in self.datasets_paths]
         self.datasets = [None for _ in self.datasets_paths]
 
+        self.max_cache_size = max_cache_size
+        self.cache_size = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache_evictions = 0
+        self.__cached_sizes: OrderedDict[int, int] = OrderedDict()
+        self.__lock = RLock()
+
     @override
     def __getitem__(
-        self, items: int | str | slice | List[int | str]
+        self, items: int | str | slice | List[int | str] | np.ndarray
     ) -> pd.DataFrame | List[pd.DataFrame]:
+        items = self._resolve_items(items)
         try:
-            if isinstance(items, slice):
-                return self.__evaluate_datasets(items)
-            elif isinstance(items, int):
-                return self.__evaluate_datasets(items)
-            elif isinstance(items, str):
-                idx = self.datasets_names.index(items)
-                return self.__evaluate_datasets(idx)
-            elif isinstance(items, list):
-                if isinstance(items[0], int):
-                    return self.__evaluate_datasets(items)
-                elif isinstance(items[0], str):
-                    idxs = [self.datasets_names.index(i) for i in items]
-                    return self.__evaluate_datasets(idxs)
+            return self.__evaluate_datasets(items)
         except IndexError:
             raise IndexError("Provided index is out of range.")
-        except ValueError:
-            raise IndexError("Provided dataset name does not exist.")
+
+    @override
+    def get_dataset_size(self, index: int) -> int:
+        if self.datasets[index] is not None:
+            return super().get_dataset_size(index)
+        return self.datasets_paths[index].stat().st_size
 
     def __evaluate_datasets(
         self, items: List[int] | int | slice
@@ -189,17 +334,64 @@ class LazyPandasDatasets(PandasDatasets):
             return self.__evaluate_dataset(items)
         elif isinstance(items, slice) or isinstance(items, list):
             if isinstance(items, slice):
-                items = list(range(items.stop)[items])
+                items = list(range(len(self.datasets))[items])
             dfs = []
             for item in items:
                 dfs.append(self.__evaluate_dataset(item))
             return dfs
 
     def __evaluate_dataset(self, items: int):
-        if self.datasets[items] is not None:
-            return self.datasets[items]
-        else:
-            df = pd.read_csv(self.datasets_paths[items])
-            if self.download_datasets:
-                self.datasets[items] = df
-            return df
+        with self.__lock:
+            if self.datasets[items] is not None:
+                self.cache_hits += 1
+                self.__cached_sizes.move_to_end(items)
+                return self.datasets[items]
+            self.cache_misses += 1
+
+        df = read_dataset(self.datasets_paths[items], memory_map=self.memory_map)
+        if self.download_datasets:
+            self.__add_to_cache(items, df)
+        return df
+
+    def prefetch(self, indices: List[int | str]) -> None:
+        """
+        Download datasets to cache before they are used, e.g. the next
+        datasets of iteration. Datasets are cached even if `download_datasets`
+        is False. If they do not fit in `max_cache_size`, the least recently
+        used datasets are removed first.
+
+        Args:
+            indices (List[int | str]): positions or names of datasets.
+        """
+        for index in indices:
+            if isinstance(index, str):
+                index = self._get_position(index)
+            if self.datasets[index] is None:
+                df = read_dataset(self.datasets_paths[index], memory_map=self.memory_map)
+                self.__add_to_cache(index, df)
+
+    def clear_cache(self) -> None:
+        with self.__lock:
+            self.datasets = [None for _ in self.datasets_paths]
+            self.__cached_sizes.clear()
+            self.cache_size = 0
+
+    def __add_to_cache(self, index: int, df: pd.DataFrame) -> None:
+        size = int(df.memory_usage(deep=True).sum())
+        if self.max_cache_size is not None and size > self.max_cache_size:
+            return
+
+        with self.__lock:
+            if self.datasets[index] is not None:
+                return
+            self.datasets[index] = df
+            self.__cached_sizes[index] = size
+            self.cache_size += size
+
+            while (
+                self.max_cache_size is not None and self.cache_size > self.max_cache_size
+            ):
+                evicted_index, evicted_size = self.__cached_sizes.popitem(last=False)
+                self.datasets[evicted_index] = None
+                self.cache_size -= evicted_size
+                self.cache_evictions += 1
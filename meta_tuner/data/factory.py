@@ -1,13 +1,44 @@
+import os
+import json
+import time
+import tempfile
+import requests
 import pandas as pd
 
 from pathlib import Path
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 from meta_tuner.data.datasets import (
     PandasDatasets,
     OpenmlPandasDatasets,
     LazyPandasDatasets,
 )
-from typing import List
+from meta_tuner.data.utils import (
+    DATASET_FORMATS,
+    get_dataset_paths,
+    read_dataset,
+    write_dataset,
+)
+from meta_tuner.utils import resolve_n_jobs
+from typing import List, Callable, Optional, Tuple
 from openml import datasets
+from openml.exceptions import (
+    OpenMLHashException,
+    OpenMLServerError,
+    OpenMLServerException,
+)
+
+# errors of connection or of server which could not answer the request; errors
+# reported by server (OpenMLServerException, e.g. unknown dataset) are not retried
+RETRIED_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+    OpenMLServerError,
+    OpenMLHashException,
+)
 
 
 class PandasDatasetsFactory:
@@ -17,42 +48,105 @@ class PandasDatasetsFactory:
     """
 
     @staticmethod
-    def create_from_dir(path: str | Path) -> PandasDatasets:
+    def create_from_dir(path: str | Path, dataset_format: str = None) -> PandasDatasets:
         """
         Args:
-            path (str | Path): directory path from which all *.csv files
-                will be downloaded to PandasDatasets
+            path (str | Path): directory path from which all *.csv, *.parquet,
+                *.feather and *.arrow files will be downloaded to PandasDatasets
+            dataset_format (str, optional): If provided, only files of this format
+                are read. Valid values: ("csv", "parquet", "feather", "arrow").
+                Defaults to None.
 
         Returns:
             PandasDatasets: datasets wrapper with all data from directory.
         """
-        datasets_paths = list(Path.glob(path, "*.csv"))
+        datasets_paths = get_dataset_paths(path, dataset_format)
         data_names = list(map(lambda x: x.stem, datasets_paths))
-        datasets = list(map(lambda x: pd.read_csv(x), datasets_paths))
+        datasets = list(map(read_dataset, datasets_paths))
 
         pandas_datasets = PandasDatasets(datasets, data_names)
 
         return pandas_datasets
 
     @staticmethod
-    def create_from_openml(ids: int | List[int]) -> OpenmlPandasDatasets:
+    def create_from_openml(
+        ids: int | List[int],
+        versions: int | List[int] = None,
+        n_jobs: int = 1,
+        cache_dir: str | Path = None,
+        lazy: bool = False,
+        dataset_format: str = "parquet",
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        loader: Callable[[int], Tuple[pd.DataFrame, str, int]] = None,
+    ) -> OpenmlPandasDatasets | LazyPandasDatasets:
         """
         Args:
             id (int | List[int]): id (or array of ids) refering to
                 datasets from OpenML site (https://www.openml.org/)
+            versions (int | List[int], optional): Expected version of each dataset.
+                If provided, only cached files of this version are used and
+                ValueError is raised if loaded dataset has other version. If None,
+                the latest cached version of each id is used. Defaults to None.
+            n_jobs (int, optional): Number of datasets downloaded concurrently.
+                If -1, one thread per processor is used. Defaults to 1.
+            cache_dir (str | Path, optional): If provided, each dataset is saved
+                once to this directory as "{id}-{version}" file, with its name in
+                json file next to it, and read from there in later calls instead
+                of being downloaded. Defaults to None.
+            lazy (bool, optional): If True, LazyPandasDatasets over files in
+                `cache_dir` is returned, so datasets are not kept in memory.
+                Requires `cache_dir`. Defaults to False.
+            dataset_format (str, optional): Format of files in `cache_dir`. Valid
+                values: ("csv", "parquet", "feather", "arrow"). Defaults to "parquet".
+            max_retries (int, optional): Number of retries of download failed
+                due to connection or server error (see RETRIED_ERRORS). Other
+                errors are raised immediately. Defaults to 3.
+            backoff (float, optional): Seconds to wait before the first retry,
+                doubled for each next one. Defaults to 1.0.
+            loader (Callable[[int], Tuple[pd.DataFrame, str, int]], optional):
+                Function returning data, name and version of dataset with given
+                id. If None, dataset is downloaded from OpenML. Can be replaced
+                e.g. to read datasets from local directory. Defaults to None.
 
         Returns:
-            PandasDatasets: datasets wrapper with all data specified
-            by ids.
+            OpenmlPandasDatasets | LazyPandasDatasets: datasets wrapper with all
+            data specified by ids.
         """
         if isinstance(ids, int):
             ids = [ids]
-
-        openml_datasets = datasets.get_datasets(
-            ids, download_data=True, download_qualities=False
+        if versions is None or isinstance(versions, int):
+            versions = [versions] * len(ids)
+        if len(versions) != len(ids):
+            raise ValueError(
+                f'Arg "versions" should have the same length as "ids". {len(versions)} and {len(ids)} provided'
+            )
+        if lazy and cache_dir is None:
+            raise ValueError('Arg "cache_dir" is required if "lazy" is True.')
+        if dataset_format not in DATASET_FORMATS:
+            raise ValueError(
+                f'For arg "dataset_format" only {tuple(DATASET_FORMATS)} are allowed. {dataset_format} provided'
+            )
+        if cache_dir is not None:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+
+        ingest = partial(
+            PandasDatasetsFactory.__ingest_openml_dataset,
+            cache_dir=cache_dir,
+            dataset_format=dataset_format,
+            load_data=not lazy,
+            max_retries=max_retries,
+            backoff=backoff,
+            loader=loader or _load_openml_dataset,
         )
-        openml_data = list(map(lambda x: x.get_data()[0], openml_datasets))
-        openml_names = list(map(lambda x: x.name, openml_datasets))
+        with ThreadPoolExecutor(max_workers=resolve_n_jobs(n_jobs)) as executor:
+            ingested = list(executor.map(ingest, ids, versions))
+        openml_data, openml_names, openml_paths = map(list, zip(*ingested))
+
+        if lazy:
+            lazy_datasets = LazyPandasDatasets(openml_paths)
+            lazy_datasets.datasets_names = openml_names
+            return lazy_datasets
 
         openml_datasets = OpenmlPandasDatasets(openml_data, ids, openml_names)
 
@@ -60,22 +154,101 @@ class PandasDatasetsFactory:
 
     @staticmethod
     def create_from_dir_lazy(
-        path: str | Path, download_datasets: bool = True
+        path: str | Path,
+        download_datasets: bool = True,
+        dataset_format: str = None,
+        memory_map: bool = False,
     ) -> LazyPandasDatasets:
         """
         Args:
-            path (str | Path): directory path from which all *.csv files
-                will be downloaded to LazyPandasDatasets
+            path (str | Path): directory path from which all *.csv, *.parquet,
+                *.feather and *.arrow files will be downloaded to LazyPandasDatasets
             download_datasets (bool, optional): if True, LazyPandasDatasets will
-                download data while reading from csv, default to True.
+                download data while reading from file, default to True.
+            dataset_format (str, optional): If provided, only files of this format
+                are read. Valid values: ("csv", "parquet", "feather", "arrow").
+                Defaults to None.
+            memory_map (bool, optional): If True, files are memory-mapped, see
+                LazyPandasDatasets. Defaults to False.
 
         Returns:
             LazyPandasDatasets: datasets wrapper with all data from directory.
         """
-        datasets_paths = list(Path.glob(path, "*.csv"))
+        datasets_paths = get_dataset_paths(path, dataset_format)
 
         pandas_datasets = LazyPandasDatasets(
-            datasets_paths, download_datasets=download_datasets
+            datasets_paths, download_datasets=download_datasets, memory_map=memory_map
         )
 
         return pandas_datasets
+
+    @staticmethod
+    def __ingest_openml_dataset(
+        dataset_id: int,
+        expected_version: Optional[int],
+        cache_dir: Optional[str | Path],
+        dataset_format: str,
+        load_data: bool,
+        max_retries: int,
+        backoff: float,
+        loader: Callable[[int], Tuple[pd.DataFrame, str, int]],
+    ) -> Tuple[Optional[pd.DataFrame], str, Optional[Path]]:
+        if cache_dir is not None:
+            version_pattern = "*" if expected_version is None else expected_version
+            cached = sorted(
+                Path(cache_dir).glob(f"{dataset_id}-{version_pattern}.json"),
+                key=lambda path: int(path.stem.split("-")[-1]),
+            )
+            if cached:
+                meta = json.loads(cached[-1].read_text())
+                data_path = cached[-1].with_name(meta["file"])
+                data = read_dataset(data_path) if load_data else None
+                return data, meta["name"], data_path
+
+        for attempt in range(max_retries + 1):
+            try:
+                data, name, version = loader(dataset_id)
+                break
+            except RETRIED_ERRORS as e:
+                if attempt == max_retries or isinstance(e, OpenMLServerException):
+                    raise
+                time.sleep(backoff * 2**attempt)
+        if expected_version is not None and version != expected_version:
+            raise ValueError(
+                f"Dataset {dataset_id} has version {version}, {expected_version} expected."
+            )
+
+        if cache_dir is None:
+            return data, name, None
+
+        stem = f"{dataset_id}-{version}"
+        data_path = Path(cache_dir) / f"{stem}{DATASET_FORMATS[dataset_format][0]}"
+        PandasDatasetsFactory.__write_atomic(
+            data_path, lambda path: write_dataset(data, path)
+        )
+        # metadata is written last, so only complete datasets are found in cache
+        meta = {"id": dataset_id, "version": version, "name": name, "file": data_path.name}
+        PandasDatasetsFactory.__write_atomic(
+            Path(cache_dir) / f"{stem}.json",
+            lambda path: Path(path).write_text(json.dumps(meta)),
+        )
+
+        return (data if load_data else None), name, data_path
+
+    @staticmethod
+    def __write_atomic(path: Path, write: Callable[[str], None]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=path.name)
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+def _load_openml_dataset(dataset_id: int) -> Tuple[pd.DataFrame, str, int]:
+    dataset = datasets.get_dataset(
+        dataset_id, download_data=True, download_qualities=False
+    )
+    return dataset.get_data()[0], dataset.name, dataset.version
@@ -0,0 +1,183 @@
+import pandas as pd
+import pyarrow as pa
+
+from pyarrow import feather, parquet
+from pathlib import Path
+from typing import Dict, Generator, Tuple, List
+
+DATASET_FORMATS = {
+    "csv": [".csv"],
+    "parquet": [".parquet"],
+    "feather": [".feather"],
+    "arrow": [".arrow"],
+}
+
+
+def split_target(
+    df: pd.DataFrame, target: int | str = -1
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split dataset into features and target.
+
+    Args:
+        df (pd.DataFrame): dataset with features and target.
+        target (int | str, optional): position or name of target column.
+            Defaults to -1.
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame]: dataframe with features and
+            single column dataframe with target.
+    """
+    if isinstance(target, str):
+        if target not in df.columns:
+            raise KeyError(f'Target column "{target}" is not present in dataset.')
+        target = df.columns.get_loc(target)
+
+    target = range(df.shape[1])[target]
+    features = [i for i in range(df.shape[1]) if i != target]
+
+    return df.iloc[:, features], df.iloc[:, [target]]
+
+
+def get_dataset_format(path: str | Path) -> str:
+    """
+    Args:
+        path (str | Path): path of dataset file.
+
+    Returns:
+        str: format of file, one of ("csv", "parquet", "feather", "arrow"),
+            chosen by its extension.
+    """
+    suffix = Path(path).suffix.lower()
+    for dataset_format, suffixes in DATASET_FORMATS.items():
+        if suffix in suffixes:
+            return dataset_format
+    raise ValueError(
+        f"For dataset files only {sum(DATASET_FORMATS.values(), [])} extensions are allowed. {suffix} provided"
+    )
+
+
+def get_dataset_paths(dir_path: str | Path, dataset_format: str = None) -> List[Path]:
+    """
+    Args:
+        dir_path (str | Path): directory with datasets.
+        dataset_format (str, optional): If provided, only files of this format
+            are returned. Valid values: ("csv", "parquet", "feather", "arrow").
+            Defaults to None.
+
+    Returns:
+        List[Path]: sorted paths of dataset files.
+    """
+    if dataset_format is None:
+        suffixes = sum(DATASET_FORMATS.values(), [])
+    elif dataset_format in DATASET_FORMATS:
+        suffixes = DATASET_FORMATS[dataset_format]
+    else:
+        raise ValueError(
+            f'For arg "dataset_format" only {tuple(DATASET_FORMATS)} are allowed. {dataset_format} provided'
+        )
+
+    return sorted(
+        path for path in Path(dir_path).iterdir() if path.suffix.lower() in suffixes
+    )
+
+
+def read_dataset(path: str | Path, memory_map: bool = False) -> pd.DataFrame:
+    """
+    Read dataset in format chosen by extension of file.
+
+    Args:
+        path (str | Path): path of dataset file.
+        memory_map (bool, optional): If True, file is memory-mapped instead of
+            read. For uncompressed Arrow IPC files ("arrow" format) numeric
+            columns without missing values are read-only views of the mapped
+            file, so opening is almost free and pages are shared between
+            processes through the OS page cache. Defaults to False.
+
+    Returns:
+        pd.DataFrame: dataset.
+    """
+    dataset_format = get_dataset_format(path)
+    if dataset_format == "parquet":
+        return pd.read_parquet(path, memory_map=memory_map)
+    elif dataset_format in ("feather", "arrow"):
+        table = feather.read_table(path, memory_map=memory_map)
+        return table.to_pandas(split_blocks=True)
+    return pd.read_csv(path, memory_map=memory_map)
+
+
+def iter_dataset_chunks(
+    path: str | Path, chunk_size: int = 100_000
+) -> Generator[pd.DataFrame, None, None]:
+    """
+    Read dataset in chunks of rows, so only one chunk is kept in memory.
+    Parquet files are read by batches, Feather and Arrow files are
+    memory-mapped. Types of csv columns are inferred from the first chunk
+    and used for all chunks (integer and boolean columns as nullable types),
+    so chunks have the same types regardless of missing values.
+
+    Args:
+        path (str | Path): path of dataset file.
+        chunk_size (int, optional): Maximal number of rows of chunk.
+            Defaults to 100_000.
+
+    Yields:
+        Generator[pd.DataFrame, None, None]: consecutive chunks of dataset.
+    """
+    dataset_format = get_dataset_format(path)
+    if dataset_format == "parquet":
+        for batch in parquet.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+    elif dataset_format in ("feather", "arrow"):
+        with pa.memory_map(str(path)) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                for offset in range(0, batch.num_rows, chunk_size):
+                    yield batch.slice(offset, chunk_size).to_pandas()
+    else:
+        dtypes = _get_csv_dtypes(pd.read_csv(path, nrows=chunk_size))
+        try:
+            with pd.read_csv(path, chunksize=chunk_size, dtype=dtypes) as reader:
+                yield from reader
+        except (ValueError, TypeError) as e:
+            raise ValueError(
+                f"Types of columns of {path} differ between chunks. Increase chunk_size."
+            ) from e
+
+
+def _get_csv_dtypes(df: pd.DataFrame) -> Dict[str, str]:
+    dtypes = {}
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_bool_dtype(dtype):
+            dtypes[column] = "boolean"
+        elif pd.api.types.is_integer_dtype(dtype):
+            dtypes[column] = "Int64"
+        elif pd.api.types.is_float_dtype(dtype):
+            dtypes[column] = "float64"
+        else:
+            dtypes[column] = "object"
+
+    return dtypes
+
+
+def write_dataset(df: pd.DataFrame, path: str | Path) -> None:
+    """
+    Write dataset, without index, in format chosen by extension of file.
+    Parquet, Feather and Arrow keep types of columns, including categories.
+    Feather is compressed, Arrow is uncompressed Arrow IPC, which can be
+    memory-mapped without copying.
+
+    Args:
+        df (pd.DataFrame): dataset.
+        path (str | Path): path of dataset file.
+    """
+    dataset_format = get_dataset_format(path)
+    if dataset_format == "parquet":
+        df.to_parquet(path, index=False)
+    elif dataset_format == "feather":
+        df.reset_index(drop=True).to_feather(path)
+    elif dataset_format == "arrow":
+        df.reset_index(drop=True).to_feather(path, compression="uncompressed")
+    else:
+        df.to_csv(path, index=False)
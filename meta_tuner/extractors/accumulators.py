@@ -0,0 +1,237 @@
+import copy
+import numpy as np
+import pandas as pd
+
+from typing import Dict, List, Tuple
+
+from .engine import (
+    get_comoments,
+    get_joint_counts,
+    get_moments,
+    get_numeric_mask,
+    get_target_codes,
+    get_target_counts,
+    get_value_counts,
+)
+
+
+class MetaFeatureAccumulator:
+    """
+    Mergeable statistics of dataset read in chunks of rows: number of
+    instances, null counts, moments (merged with Welford / Chan formulas),
+    co-moments of numeric features, counts of values of categorical features
+    and their contingency tables with target. Finalised statistics are values
+    of default intermediates of MetaFeatureEngine, so default extractors give
+    the same results as on the whole dataset.
+    """
+
+    def __init__(self) -> None:
+        self.n_instances = 0
+        self.columns: List[any] = None
+        self.numeric_mask: np.ndarray = None
+        self.nominal_target: bool = None
+        self.null_counts: np.ndarray = None
+        self.n_instances_with_missing = 0
+        self.moments: Tuple[np.ndarray, ...] = None
+        self.shift: np.ndarray = None
+        self.comoments: Tuple[np.ndarray, ...] = None
+        self.categories: List[Dict[any, int]] = None
+        self.value_counts: List[np.ndarray] = None
+        self.classes: Dict[any, int] = None
+        self.target_counts: np.ndarray = None
+        self.joint_counts: List[np.ndarray] = None
+
+    def update(self, X: pd.DataFrame, y: pd.DataFrame | pd.Series = None) -> None:
+        """
+        Args:
+            X (pd.DataFrame): chunk of features
+            y (pd.DataFrame | pd.Series, optional): chunk of target. Target is
+                treated as nominal unless it has float dtype. Defaults to None.
+        """
+        self.merge(self.__from_chunk(X, y))
+
+    def merge(self, other: "MetaFeatureAccumulator") -> None:
+        """
+        Add statistics of other rows of the same dataset.
+
+        Args:
+            other (MetaFeatureAccumulator): accumulator of other rows.
+        """
+        if other.columns is None:
+            return
+        if self.columns is None:
+            self.__dict__.update(copy.deepcopy(other.__dict__))
+            return
+        if other.columns != self.columns:
+            raise ValueError("Chunks of dataset have different columns.")
+        if not np.array_equal(other.numeric_mask, self.numeric_mask) or (
+            other.nominal_target != self.nominal_target
+        ):
+            raise ValueError("Chunks of dataset have different types of columns.")
+
+        self.n_instances += other.n_instances
+        self.null_counts = self.null_counts + other.null_counts
+        self.n_instances_with_missing += other.n_instances_with_missing
+        self.moments = _merge_moments(self.moments, other.moments)
+        other_comoments = _shift_comoments(other.comoments, other.shift - self.shift)
+        self.comoments = tuple(a + b for a, b in zip(self.comoments, other_comoments))
+
+        class_codes = None
+        if self.nominal_target:
+            class_codes = _merge_categories(self.classes, other.classes)
+            self.target_counts = _add_counts(
+                self.target_counts, other.target_counts, class_codes
+            )
+        for i, categories in enumerate(other.categories):
+            codes = _merge_categories(self.categories[i], categories)
+            self.value_counts[i] = _add_counts(
+                self.value_counts[i], other.value_counts[i], codes
+            )
+            if self.nominal_target:
+                self.joint_counts[i] = _add_counts(
+                    self.joint_counts[i], other.joint_counts[i], codes, class_codes
+                )
+
+    def get_values(self) -> Dict[str, any]:
+        """
+        Returns:
+            Dict[str, any]: values of intermediates, to be passed to
+                MetaFeatureEngine as `values`.
+        """
+        if self.columns is None:
+            raise ValueError("No rows were added to accumulator.")
+        return {
+            "n_instances": self.n_instances,
+            "sample_size": self.n_instances,
+            "n_features": len(self.columns),
+            "numeric_mask": self.numeric_mask,
+            "null_counts": self.null_counts,
+            "n_instances_with_missing": self.n_instances_with_missing,
+            "moments": self.moments,
+            "comoments": self.comoments,
+            "value_counts": list(self.value_counts),
+            "target_counts": self.target_counts if self.nominal_target else None,
+            "joint_counts": list(self.joint_counts) if self.nominal_target else None,
+        }
+
+    @staticmethod
+    def __from_chunk(
+        X: pd.DataFrame, y: pd.DataFrame | pd.Series
+    ) -> "MetaFeatureAccumulator":
+        y = y.iloc[:, 0] if isinstance(y, pd.DataFrame) else y
+        accumulator = MetaFeatureAccumulator()
+        accumulator.n_instances = X.shape[0]
+        accumulator.columns = list(X.columns)
+        accumulator.numeric_mask = get_numeric_mask(X)
+
+        null_mask = X.isna().to_numpy()
+        accumulator.null_counts = null_mask.sum(axis=0)
+        accumulator.n_instances_with_missing = int(null_mask.any(axis=1).sum())
+
+        numeric = X.iloc[:, accumulator.numeric_mask].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        accumulator.moments = get_moments(numeric)
+        accumulator.shift = np.nan_to_num(accumulator.moments[1])
+        accumulator.comoments = get_comoments(numeric, accumulator.shift)
+
+        codes = []
+        accumulator.categories = []
+        for i in np.flatnonzero(~accumulator.numeric_mask):
+            column_codes, uniques = pd.factorize(X.iloc[:, i])
+            codes.append((column_codes, len(uniques)))
+            accumulator.categories.append(_enumerate(uniques))
+        accumulator.value_counts = get_value_counts(codes)
+
+        target_codes = get_target_codes(y)
+        accumulator.nominal_target = target_codes is not None
+        if accumulator.nominal_target:
+            accumulator.classes = _enumerate(pd.factorize(y)[1])
+            accumulator.target_counts = get_target_counts(target_codes)
+            accumulator.joint_counts = get_joint_counts(codes, target_codes)
+
+        return accumulator
+
+
+def _enumerate(uniques: pd.Index | np.ndarray) -> Dict[any, int]:
+    return {value: code for code, value in enumerate(uniques)}
+
+
+def _merge_categories(categories: Dict[any, int], other: Dict[any, int]) -> np.ndarray:
+    """
+    Add categories of other to categories, in place.
+
+    Returns:
+        np.ndarray: code in categories of each category of other.
+    """
+    codes = np.empty(len(other), dtype=np.intp)
+    for value, code in other.items():
+        codes[code] = categories.setdefault(value, len(categories))
+
+    return codes
+
+
+def _add_counts(
+    counts: np.ndarray, other: np.ndarray, *codes: np.ndarray
+) -> np.ndarray:
+    shape = tuple(
+        max(size, int(axis_codes.max()) + 1 if len(axis_codes) else 0)
+        for size, axis_codes in zip(counts.shape, codes)
+    )
+    result = np.zeros(shape, dtype=counts.dtype)
+    result[tuple(slice(size) for size in counts.shape)] = counts
+    # codes of other are distinct, so each cell is added once
+    result[np.ix_(*codes)] += other
+
+    return result
+
+
+def _merge_moments(
+    a: Tuple[np.ndarray, ...], b: Tuple[np.ndarray, ...]
+) -> Tuple[np.ndarray, ...]:
+    count_a, mean_a, m2_a, m3_a, m4_a = a
+    count_b, mean_b, m2_b, m3_b, m4_b = b
+    count = count_a + count_b
+    n_a, n_b, n = (np.asarray(c, dtype=np.float64) for c in (count_a, count_b, count))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta**2 * n_a * n_b / n
+        m3 = (
+            m3_a
+            + m3_b
+            + delta**3 * n_a * n_b * (n_a - n_b) / n**2
+            + 3 * delta * (n_a * m2_b - n_b * m2_a) / n
+        )
+        m4 = (
+            m4_a
+            + m4_b
+            + delta**4 * n_a * n_b * (n_a**2 - n_a * n_b + n_b**2) / n**3
+            + 6 * delta**2 * (n_a**2 * m2_b + n_b**2 * m2_a) / n**2
+            + 4 * delta * (n_a * m3_b - n_b * m3_a) / n
+        )
+
+    merged = [count]
+    for value, value_a, value_b in zip((mean, m2, m3, m4), a[1:], b[1:]):
+        merged.append(np.where(n_a == 0, value_b, np.where(n_b == 0, value_a, value)))
+
+    return tuple(merged)
+
+
+def _shift_comoments(
+    comoments: Tuple[np.ndarray, ...], delta: np.ndarray
+) -> Tuple[np.ndarray, ...]:
+    """
+    Express co-moments of features shifted by s as co-moments of features
+    shifted by s - delta.
+    """
+    count, sum_x, sum_xx, sum_xy = comoments
+    d_i, d_j = delta[:, None], delta[None, :]
+
+    return (
+        count,
+        sum_x + d_i * count,
+        sum_xx + 2 * d_i * sum_x + d_i**2 * count,
+        sum_xy + d_j * sum_x + d_i * sum_x.T + d_i * d_j * count,
+    )
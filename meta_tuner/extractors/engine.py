@@ -0,0 +1,504 @@
+import sys
+import numpy as np
+import pandas as pd
+
+from collections import Counter
+from functools import update_wrapper
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from .sketches import ReservoirSample, hoeffding_sample_size
+
+INPUTS = ("X", "y")
+
+
+class MetaFeatureEngine:
+    """
+    Evaluates extractors over a graph of named intermediate results. Each
+    extractor and intermediate declares names of values it requires ("X",
+    "y" or other intermediates). Intermediates are computed at most once per
+    dataset and, in `extract_all`, released as soon as all extractors and
+    intermediates depending on them are computed. Default intermediates split
+    the dataset once into numeric and categorical blocks and reduce them to
+    sums (moments, value counts, contingency tables, co-moments), so the same
+    extractors can be finalised from statistics merged over chunks.
+    """
+
+    def __init__(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame | pd.Series = None,
+        intermediates: Dict[str, Tuple[Callable[..., any], Tuple[str, ...]]] = None,
+        values: Dict[str, any] = None,
+    ) -> None:
+        """
+        Args:
+            X (pd.DataFrame): dataframe with features
+            y (pd.DataFrame | pd.Series, optional): dataframe or series with
+                target value. Target is treated as nominal unless it has float
+                dtype. Defaults to None.
+            intermediates (Dict[str, Tuple[Callable[..., any], Tuple[str, ...]]], optional):
+                functions computing intermediates and names of their arguments.
+                Defaults to meta_intermediates.
+            values (Dict[str, any], optional): already known values of
+                intermediates, which are not computed. Defaults to None.
+        """
+        self.intermediates = (
+            meta_intermediates if intermediates is None else intermediates
+        )
+        y = y.iloc[:, 0] if isinstance(y, pd.DataFrame) else y
+        self.__values: Dict[str, any] = {"X": X, "y": y, **(values or {})}
+
+    @classmethod
+    def approximate(
+        cls,
+        X: pd.DataFrame,
+        y: pd.DataFrame | pd.Series = None,
+        intermediates: Dict[str, Tuple[Callable[..., any], Tuple[str, ...]]] = None,
+        max_error: float = 0.01,
+        confidence: float = 0.95,
+        random_state: int = None,
+    ) -> "MetaFeatureEngine":
+        """
+        Engine over uniform sample of rows. Sample size is chosen with
+        Hoeffding's inequality, so proportions of missing values are estimated
+        with absolute error at most `max_error` with probability `confidence`;
+        if dataset is not larger, all rows are used. Numbers of missing values
+        are scaled to all rows. Moments and correlations of numeric features
+        are computed from sample and the bound does not cover them. Counts of
+        values of nominal features and of target are computed from all rows,
+        because plug-in entropy and mutual information of sample are biased
+        by a term growing with number of values divided by sample size, so
+        number of instances, class and nominal meta-features stay exact. Size
+        of sample is available as "sample_size" intermediate.
+
+        Args:
+            X (pd.DataFrame): dataframe with features
+            y (pd.DataFrame | pd.Series, optional): dataframe or series with
+                target value. Defaults to None.
+            intermediates (Dict[str, Tuple[Callable[..., any], Tuple[str, ...]]], optional):
+                functions computing intermediates and names of their arguments.
+                Defaults to meta_intermediates.
+            max_error (float, optional): Maximal absolute error of estimated
+                proportions. Defaults to 0.01.
+            confidence (float, optional): Probability that error is below
+                `max_error`. Defaults to 0.95.
+            random_state (int, optional): Seed of sample. Defaults to None.
+
+        Returns:
+            MetaFeatureEngine: engine over sample.
+        """
+        intermediates = meta_intermediates if intermediates is None else intermediates
+        n_instances = X.shape[0]
+        sample_size = hoeffding_sample_size(max_error, confidence)
+        if sample_size >= n_instances:
+            return cls(X, y, intermediates)
+
+        reservoir = ReservoirSample(sample_size, random_state)
+        reservoir.update(np.arange(n_instances))
+        rows = np.sort(reservoir.sample)
+
+        y = y.iloc[:, 0] if isinstance(y, pd.DataFrame) else y
+        intermediates = {
+            **intermediates,
+            "codes": (_codes, ("all_X", "numeric_mask")),
+            "target_codes": (get_target_codes, ("all_y",)),
+            "null_counts": (
+                _scaled_null_counts,
+                ("null_mask", "n_instances", "sample_size"),
+            ),
+            "n_instances_with_missing": (
+                _scaled_n_instances_with_missing,
+                ("null_mask", "n_instances", "sample_size"),
+            ),
+        }
+        values = {
+            "all_X": X,
+            "all_y": y,
+            "n_instances": n_instances,
+            "numeric_mask": get_numeric_mask(X),
+        }
+        sample_y = y.iloc[rows] if y is not None else None
+
+        return cls(X.iloc[rows], sample_y, intermediates, values)
+
+    def extract(self, extractor: Callable[..., float]) -> float:
+        """
+        Evaluate single extractor. Computed intermediates are kept for
+        next calls.
+
+        Args:
+            extractor (Callable[..., float]): extractor created with
+                `depends_on` or any function of (X, y).
+
+        Returns:
+            float: value of meta-feature.
+        """
+        func, requires = get_requirements(extractor)
+        return func(*self.__resolve(requires, None))
+
+    def extract_all(
+        self, extractors: Dict[str, Callable[..., float]]
+    ) -> Dict[str, float]:
+        """
+        Evaluate extractors, releasing each intermediate after its last use.
+
+        Args:
+            extractors (Dict[str, Callable[..., float]]): extractors by name.
+
+        Returns:
+            Dict[str, float]: metadata
+        """
+        consumers = Counter()
+        visited = set()
+        for extractor in extractors.values():
+            _, requires = get_requirements(extractor)
+            self.__count_consumers(requires, consumers, visited, ())
+
+        metadata = {}
+        for extractor_name, extractor in extractors.items():
+            func, requires = get_requirements(extractor)
+            metadata[extractor_name] = func(*self.__resolve(requires, consumers))
+
+        return metadata
+
+    def __count_consumers(
+        self,
+        requires: Sequence[str],
+        consumers: Counter,
+        visited: set,
+        path: Tuple[str, ...],
+    ) -> None:
+        for name in requires:
+            consumers[name] += 1
+            if name in path:
+                cycle = " -> ".join(path + (name,))
+                raise ValueError(f"Intermediates have circular dependency: {cycle}.")
+            if name == "X" and self.__values["X"] is None:
+                path = " -> ".join(path) or "extractor"
+                raise ValueError(f'"X" required by {path} is not available.')
+            if name in visited or name in self.__values:
+                continue
+            visited.add(name)
+            _, node_requires = self.__get_intermediate(name)
+            self.__count_consumers(node_requires, consumers, visited, path + (name,))
+
+    def __resolve(
+        self, requires: Sequence[str], consumers: Counter | None
+    ) -> List[any]:
+        args = [self.__get(name, consumers) for name in requires]
+        if consumers is not None:
+            for name in requires:
+                consumers[name] -= 1
+                if consumers[name] == 0 and name not in INPUTS:
+                    self.__values.pop(name, None)
+
+        return args
+
+    def __get(self, name: str, consumers: Counter | None) -> any:
+        if name not in self.__values:
+            func, requires = self.__get_intermediate(name)
+            self.__values[name] = func(*self.__resolve(requires, consumers))
+
+        return self.__values[name]
+
+    def __get_intermediate(
+        self, name: str
+    ) -> Tuple[Callable[..., any], Tuple[str, ...]]:
+        try:
+            return self.intermediates[name]
+        except KeyError:
+            raise ValueError(f'Intermediate "{name}" is not defined.')
+
+
+def depends_on(
+    *requires: str,
+) -> Callable[[Callable[..., float]], Callable[..., float]]:
+    """
+    Declare names of intermediates required by extractor. Decorated
+    extractor is called with their values, while it can be still called
+    directly with (X, y), which computes only the required intermediates.
+
+    Args:
+        *requires (str): names of intermediates (or "X", "y").
+
+    Returns:
+        Callable[[Callable[..., float]], Callable[..., float]]: decorator.
+    """
+
+    def decorator(func: Callable[..., float]) -> Callable[..., float]:
+        return _DependentExtractor(func, tuple(requires))
+
+    return decorator
+
+
+class _DependentExtractor:
+    """
+    Extractor with declared requirements. Unlike closure, it can be sent
+    to process pool: as module attribute if it was created with decorator
+    at module level, otherwise together with its function.
+    """
+
+    def __init__(self, func: Callable[..., float], requires: Tuple[str, ...]) -> None:
+        update_wrapper(self, func)
+        self.func = func
+        self.requires = requires
+
+    def __call__(self, X: pd.DataFrame, y: pd.DataFrame | pd.Series = None) -> float:
+        return MetaFeatureEngine(X, y).extract(self)
+
+    def __reduce__(self) -> str | Tuple:
+        module = sys.modules.get(self.__module__)
+        if getattr(module, self.__qualname__, None) is self:
+            return self.__qualname__
+        return type(self), (self.func, self.requires)
+
+
+def get_requirements(
+    extractor: Callable[..., any]
+) -> Tuple[Callable[..., any], Tuple[str, ...]]:
+    """
+    Args:
+        extractor (Callable[..., any]): extractor created with `depends_on`
+            or any function of (X, y).
+
+    Returns:
+        Tuple[Callable[..., any], Tuple[str, ...]]: function and names of
+            its arguments.
+    """
+    if hasattr(extractor, "requires"):
+        return extractor.func, extractor.requires
+    return extractor, INPUTS
+
+
+def _n_instances(X: pd.DataFrame) -> int:
+    return X.shape[0]
+
+
+def _n_features(X: pd.DataFrame) -> int:
+    return X.shape[1]
+
+
+def _n_numeric(numeric_mask: np.ndarray) -> int:
+    return int(numeric_mask.sum())
+
+
+def _null_mask(X: pd.DataFrame) -> np.ndarray:
+    return X.isna().to_numpy()
+
+
+def _null_counts(null_mask: np.ndarray) -> np.ndarray:
+    return null_mask.sum(axis=0)
+
+
+def _n_instances_with_missing(null_mask: np.ndarray) -> int:
+    return int(null_mask.any(axis=1).sum())
+
+
+def _scaled_null_counts(
+    null_mask: np.ndarray, n_instances: int, sample_size: int
+) -> np.ndarray:
+    return np.rint(null_mask.sum(axis=0) * n_instances / sample_size)
+
+
+def _scaled_n_instances_with_missing(
+    null_mask: np.ndarray, n_instances: int, sample_size: int
+) -> int:
+    return int(np.rint(null_mask.any(axis=1).sum() * n_instances / sample_size))
+
+
+def get_numeric_mask(X: pd.DataFrame) -> np.ndarray:
+    numeric_columns = set(X.select_dtypes(include=np.number).columns)
+    return np.array([column in numeric_columns for column in X.columns], bool)
+
+
+def _numeric(X: pd.DataFrame, numeric_mask: np.ndarray) -> np.ndarray:
+    return X.iloc[:, numeric_mask].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _codes(X: pd.DataFrame, numeric_mask: np.ndarray) -> List[Tuple[np.ndarray, int]]:
+    categorical = X.iloc[:, ~numeric_mask]
+    codes = []
+    for i in range(categorical.shape[1]):
+        column_codes, uniques = pd.factorize(categorical.iloc[:, i])
+        codes.append((column_codes, len(uniques)))
+
+    return codes
+
+
+def get_target_codes(y: pd.Series) -> Tuple[np.ndarray, int] | None:
+    if y is None or pd.api.types.is_float_dtype(y.dtype):
+        return None
+    codes, uniques = pd.factorize(y)
+    return codes, len(uniques)
+
+
+def get_moments(numeric: np.ndarray) -> Tuple[np.ndarray, ...]:
+    count = (~np.isnan(numeric)).sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.nansum(numeric, axis=0) / count
+    deviation = numeric - mean
+    deviation_2 = deviation**2
+    m2 = np.nansum(deviation_2, axis=0)
+    m3 = np.nansum(deviation_2 * deviation, axis=0)
+    m4 = np.nansum(deviation_2**2, axis=0)
+
+    return count, mean, m2, m3, m4
+
+
+def _comoments(
+    numeric: np.ndarray, moments: Tuple[np.ndarray, ...]
+) -> Tuple[np.ndarray, ...]:
+    # correlation does not depend on shift, centering improves precision
+    return get_comoments(numeric, np.nan_to_num(moments[1]))
+
+
+def get_comoments(numeric: np.ndarray, shift: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Args:
+        numeric (np.ndarray): numeric features, with NaN for missing values.
+        shift (np.ndarray): value subtracted from each feature.
+
+    Returns:
+        Tuple[np.ndarray, ...]: for each pair of shifted features, number of
+            rows where both are present, sums of first feature, its squares
+            and products of both features over these rows.
+    """
+    present = ~np.isnan(numeric)
+    values = np.where(present, numeric - shift, 0.0)
+    present = present.astype(np.float64)
+
+    count = present.T @ present
+    sum_x = values.T @ present
+    sum_xx = (values**2).T @ present
+    sum_xy = values.T @ values
+
+    return count, sum_x, sum_xx, sum_xy
+
+
+def get_value_counts(codes: List[Tuple[np.ndarray, int]]) -> List[np.ndarray]:
+    return [np.bincount(column[column >= 0], minlength=n) for column, n in codes]
+
+
+def get_target_counts(
+    target_codes: Tuple[np.ndarray, int] | None,
+) -> np.ndarray | None:
+    if target_codes is None:
+        return None
+    codes, n = target_codes
+    return np.bincount(codes[codes >= 0], minlength=n)
+
+
+def _distinct_counts(value_counts: List[np.ndarray]) -> np.ndarray:
+    return np.array([np.count_nonzero(counts) for counts in value_counts])
+
+
+def get_joint_counts(
+    codes: List[Tuple[np.ndarray, int]], target_codes: Tuple[np.ndarray, int] | None
+) -> List[np.ndarray] | None:
+    if target_codes is None:
+        return None
+    target, n_classes = target_codes
+    tables = []
+    for column, n in codes:
+        present = (column >= 0) & (target >= 0)
+        joint = column[present] * n_classes + target[present]
+        tables.append(np.bincount(joint, minlength=n * n_classes).reshape(n, n_classes))
+
+    return tables
+
+
+# name: (function, names of its arguments)
+# moments: count, mean and sums of 2nd, 3rd and 4th powers of deviations
+#   from mean of each numeric feature
+# comoments: for each pair of numeric features, number of rows where both
+#   are present, sums of first feature, its squares and products of both
+# value_counts, joint_counts: counts of values of each categorical feature
+#   and their contingency tables with target (None if target is not nominal)
+# sample_size: number of rows used, lower than n_instances in approximate mode
+meta_intermediates: Dict[str, Tuple[Callable[..., any], Tuple[str, ...]]] = {
+    "n_instances": (_n_instances, ("X",)),
+    "n_features": (_n_features, ("X",)),
+    "sample_size": (_n_instances, ("X",)),
+    "numeric_mask": (get_numeric_mask, ("X",)),
+    "n_numeric": (_n_numeric, ("numeric_mask",)),
+    "null_mask": (_null_mask, ("X",)),
+    "null_counts": (_null_counts, ("null_mask",)),
+    "n_instances_with_missing": (_n_instances_with_missing, ("null_mask",)),
+    "numeric": (_numeric, ("X", "numeric_mask")),
+    "codes": (_codes, ("X", "numeric_mask")),
+    "target_codes": (get_target_codes, ("y",)),
+    "moments": (get_moments, ("numeric",)),
+    "comoments": (_comoments, ("numeric", "moments")),
+    "value_counts": (get_value_counts, ("codes",)),
+    "distinct_counts": (_distinct_counts, ("value_counts",)),
+    "target_counts": (get_target_counts, ("target_codes",)),
+    "joint_counts": (get_joint_counts, ("codes", "target_codes")),
+}
+
+
+def entropy(counts: np.ndarray) -> float:
+    """
+    Args:
+        counts (np.ndarray): counts of values.
+
+    Returns:
+        float: entropy in bits.
+    """
+    total = counts.sum()
+    if total == 0:
+        return np.nan
+    p = counts[counts > 0] / total
+    return float(-(p * np.log2(p)).sum())
+
+
+def mutual_information(joint: np.ndarray) -> float:
+    """
+    Args:
+        joint (np.ndarray): contingency table of two nominal variables.
+
+    Returns:
+        float: mutual information in bits.
+    """
+    total = joint.sum()
+    if total == 0:
+        return np.nan
+    p = joint / total
+    expected = np.outer(p.sum(axis=1), p.sum(axis=0))
+    nonzero = p > 0
+    return float((p[nonzero] * np.log2(p[nonzero] / expected[nonzero])).sum())
+
+
+def skewness(count: np.ndarray, m2: np.ndarray, m3: np.ndarray) -> np.ndarray:
+    """
+    Sample skewness with the same bias correction as `pd.DataFrame.skew`.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        g1 = np.sqrt(count) * m3 / m2**1.5
+        result = g1 * np.sqrt(count * (count - 1)) / (count - 2)
+    return np.where((count > 2) & (m2 > 0), result, np.nan)
+
+
+def kurtosis(count: np.ndarray, m2: np.ndarray, m4: np.ndarray) -> np.ndarray:
+    """
+    Sample excess kurtosis with the same bias correction as `pd.DataFrame.kurt`.
+    """
+    n = count.astype(np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        adjusted = (n + 1) * n * (n - 1) / ((n - 2) * (n - 3)) * m4 / m2**2
+        result = adjusted - 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+    return np.where((count > 3) & (m2 > 0), result, np.nan)
+
+
+def correlations(
+    count: np.ndarray, sum_x: np.ndarray, sum_xx: np.ndarray, sum_xy: np.ndarray
+) -> np.ndarray:
+    """
+    Pearson correlations of pairs of features over pairwise complete rows.
+
+    Returns:
+        np.ndarray: correlation matrix, NaN where undefined.
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        covariance = count * sum_xy - sum_x * sum_x.T
+        variance = count * sum_xx - sum_x**2
+        return covariance / np.sqrt(variance * variance.T)
@@ -1,25 +1,88 @@
 import pandas as pd
 
+from concurrent.futures import wait, FIRST_COMPLETED
+from functools import partial
+from itertools import islice
 from openml import datasets
-from typing import List, Dict, Callable
+from typing import List, Dict, Callable, Sequence, Tuple
 
-from .utils import meta_extractors
+from pathlib import Path
+
+from meta_tuner.data.datasets import PandasDatasets, LazyPandasDatasets
+from meta_tuner.data.utils import iter_dataset_chunks, split_target
+from meta_tuner.utils import get_executor, resolve_n_jobs
+from .accumulators import MetaFeatureAccumulator
+from .engine import INPUTS, MetaFeatureEngine, depends_on, meta_intermediates
+from .utils import SampleSize, extended_meta_extractors, meta_extractors
 
 
 class MetaDataExtractor:
-    __slots__ = {"meta_extractors"}
+    __slots__ = {"meta_extractors", "meta_intermediates"}
 
-    def __init__(self, load_default: bool = True) -> None:
-        if load_default:
-            self.meta_extractors = meta_extractors
+    def __init__(self, load_default: bool = True, load_extended: bool = False) -> None:
+        """
+        Args:
+            load_default (bool, optional): If True, extractors from
+                `meta_extractors` are loaded. Defaults to True.
+            load_extended (bool, optional): If True, extractors from
+                `extended_meta_extractors` (OpenML qualities computed from
+                shared intermediates, e.g. class entropy or mean skewness)
+                are loaded. It adds columns to results of `get_metadata` and
+                `get_datasets_metadata`. Defaults to False.
+        """
+        if load_extended:
+            self.meta_extractors = dict(extended_meta_extractors)
+        elif load_default:
+            self.meta_extractors = dict(meta_extractors)
         else:
             self.meta_extractors = {}
+        self.meta_intermediates: Dict[
+            str, Tuple[Callable[..., any], Tuple[str, ...]]
+        ] = dict(meta_intermediates)
 
     def add_extractor(
-        self, extractor_name: str, extractor: Callable[..., float]
+        self,
+        extractor_name: str,
+        extractor: Callable[..., float],
+        requires: Sequence[str] = None,
     ) -> None:
+        """
+        Args:
+            extractor_name (str): name of metadata.
+            extractor (Callable[..., float]): function of (X, y) or, if
+                `requires` is provided, of required intermediates.
+            requires (Sequence[str], optional): names of intermediates passed
+                to extractor, see `add_intermediate`. Defaults to None.
+        """
+        if requires is not None:
+            extractor = depends_on(*requires)(extractor)
         self.meta_extractors[extractor_name] = extractor
 
+    def add_intermediate(
+        self,
+        intermediate_name: str,
+        intermediate: Callable[..., any],
+        requires: Sequence[str] = INPUTS,
+    ) -> None:
+        """
+        Declare intermediate result shared by extractors, e.g. encoded
+        matrix or correlation matrix. It is computed at most once per
+        dataset and released when no remaining extractor needs it.
+        Default intermediates are listed in `meta_intermediates`.
+
+        Args:
+            intermediate_name (str): name of intermediate.
+            intermediate (Callable[..., any]): function of required values.
+            requires (Sequence[str], optional): names of values passed to
+                intermediate: "X", "y" or other intermediates. Defaults to
+                ("X", "y").
+        """
+        if intermediate_name in INPUTS:
+            raise ValueError(
+                f'For arg "intermediate_name" {INPUTS} are not allowed. {intermediate_name} provided'
+            )
+        self.meta_intermediates[intermediate_name] = (intermediate, tuple(requires))
+
     def get_from_openml(self, ids: int | List[int]) -> Dict[str, float]:
         """
         Download available metadata from OpenML. Filter out
@@ -50,27 +113,192 @@ class MetaDataExtractor:
         return qualities
 
     def get_metadata(
-        self, X: pd.DataFrame, y: pd.DataFrame | pd.Series
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame | pd.Series,
+        approximate: bool = False,
+        max_error: float = 0.01,
+        confidence: float = 0.95,
+        random_state: int = None,
     ) -> Dict[str, float]:
         """
         Extract metadata from pandas dataframe. Metadata
-        is specified in meta_extractors dictionary.
+        is specified in meta_extractors dictionary. Intermediate
+        results (e.g. moments, value counts) are computed once
+        and shared by extractors, see MetaFeatureEngine.
 
         Args:
             X (pd.DataFrame): dataframe with features
             y (pd.DataFrame | pd.Series): dataframe or series with target value
+            approximate (bool, optional): If True, metadata is extracted from
+                sample of rows, with size depending on `max_error` and
+                `confidence`, see MetaFeatureEngine.approximate. Counts of
+                nominal features and target (entropies, mutual information,
+                class percentages) are still computed from all rows.
+                `max_error` bounds only proportions of missing values; means,
+                deviations, skewness, kurtosis and correlations of numeric
+                features are estimated from sample without that bound. Number
+                of rows used is added to metadata as "SampleSize". Defaults
+                to False.
+            max_error (float, optional): Maximal absolute error of proportions
+                of missing values estimated from sample. Defaults to 0.01.
+            confidence (float, optional): Probability that error is below
+                `max_error`. Defaults to 0.95.
+            random_state (int, optional): Seed of sample. Defaults to None.
 
         Returns:
             Dict[str, float]: metadata
         """
+        if not approximate:
+            engine = MetaFeatureEngine(X, y, self.meta_intermediates)
+            return engine.extract_all(self.meta_extractors)
 
-        metadata = {}
-
-        for extractor_name, extractor in self.meta_extractors.items():
-            metadata[extractor_name] = extractor(X, y)
+        engine = MetaFeatureEngine.approximate(
+            X, y, self.meta_intermediates, max_error, confidence, random_state
+        )
+        metadata = engine.extract_all(self.meta_extractors)
+        metadata["SampleSize"] = engine.extract(SampleSize)
 
         return metadata
 
+    def get_metadata_from_file(
+        self, path: str | Path, target: int | str = -1, chunk_size: int = 100_000
+    ) -> Dict[str, float]:
+        """
+        Extract metadata from dataset file read in chunks of rows, so memory
+        usage depends on `chunk_size` instead of size of dataset. Statistics
+        of chunks are merged with MetaFeatureAccumulator, so default
+        extractors give the same results as `get_metadata`. Extractors and
+        intermediates requiring "X" (e.g. plain functions of (X, y)) are not
+        supported and raise ValueError.
+
+        Args:
+            path (str | Path): path of dataset file (csv, parquet, feather or
+                arrow).
+            target (int | str, optional): position or name of target column.
+                Defaults to -1.
+            chunk_size (int, optional): Maximal number of rows read at once.
+                Defaults to 100_000.
+
+        Returns:
+            Dict[str, float]: metadata
+        """
+        accumulator = MetaFeatureAccumulator()
+        for chunk in iter_dataset_chunks(path, chunk_size):
+            accumulator.update(*split_target(chunk, target))
+
+        engine = MetaFeatureEngine(
+            None, None, self.meta_intermediates, accumulator.get_values()
+        )
+
+        return engine.extract_all(self.meta_extractors)
+
+    def get_datasets_metadata(
+        self,
+        pandas_datasets: PandasDatasets,
+        target: int | str | List[int | str] = -1,
+        n_jobs: int = -1,
+        backend: str = "process",
+        prefetch: int = 1,
+        approximate: bool = False,
+        max_error: float = 0.01,
+        confidence: float = 0.95,
+        random_state: int = None,
+        chunk_size: int = None,
+    ) -> pd.DataFrame:
+        """
+        Extract metadata from every dataset of collection. Datasets are read
+        in background (see `PandasDatasets.iter_prefetch`) and at most
+        2 * `n_jobs` of them wait in pool at once, so lazy collections are
+        streamed instead of loaded as a whole. With "process" backend,
+        extractors and intermediates have to be picklable (e.g. defined at
+        module level, not lambdas).
+
+        Args:
+            pandas_datasets (PandasDatasets): collection of datasets.
+            target (int | str | List[int | str], optional): position or name
+                of target column, or list with one for each dataset.
+                Defaults to -1.
+            n_jobs (int, optional): Number of workers. If -1, all processors
+                are used. Defaults to -1.
+            backend (str, optional): Type of pool. Valid values: ("process",
+                "thread"). Defaults to "process".
+            prefetch (int, optional): Number of datasets read ahead of
+                the one submitted to pool. Defaults to 1.
+            approximate (bool, optional): If True, metadata is extracted from
+                sample of rows, see `get_metadata`, and "SampleSize" column is
+                added. Defaults to False.
+            max_error (float, optional): Maximal absolute error of proportions
+                estimated from sample. Defaults to 0.01.
+            confidence (float, optional): Probability that error is below
+                `max_error`. Defaults to 0.95.
+            random_state (int, optional): Seed of samples. Defaults to None.
+            chunk_size (int, optional): If provided, files of LazyPandasDatasets
+                are read in chunks of that many rows instead of as a whole, see
+                `get_metadata_from_file`. Approximation arguments are then
+                ignored. Defaults to None.
+
+        Returns:
+            pd.DataFrame: metadata with one row for each dataset, in order of
+                collection and indexed by datasets names (or positions), and
+                one column for each extractor.
+        """
+        n_datasets = len(pandas_datasets)
+        if not isinstance(target, list):
+            target = [target] * n_datasets
+        if len(target) != n_datasets:
+            raise ValueError(
+                f'Arg "target" should have one item for each dataset. {len(target)} provided'
+            )
+
+        if chunk_size is not None:
+            if not isinstance(pandas_datasets, LazyPandasDatasets):
+                raise ValueError(
+                    'Arg "chunk_size" is allowed only for LazyPandasDatasets.'
+                )
+            tasks = zip(range(n_datasets), pandas_datasets.datasets_paths, target)
+            extract = partial(_extract_metadata_from_file, self, chunk_size=chunk_size)
+        else:
+            tasks = zip(
+                range(n_datasets), pandas_datasets.iter_prefetch(prefetch), target
+            )
+            extract = partial(
+                _extract_metadata,
+                self,
+                approximate=approximate,
+                max_error=max_error,
+                confidence=confidence,
+                random_state=random_state,
+            )
+
+        metadata: List[Dict[str, float]] = [None] * n_datasets
+
+        if resolve_n_jobs(n_jobs) == 1:
+            for idx, data, target_ in tasks:
+                metadata[idx] = extract(data, target_)
+        else:
+            max_pending = 2 * resolve_n_jobs(n_jobs)
+            with get_executor(backend, n_jobs) as executor:
+                pending = {
+                    executor.submit(extract, data, target_): idx
+                    for idx, data, target_ in islice(tasks, max_pending)
+                }
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        metadata[pending.pop(future)] = future.result()
+                    for idx, data, target_ in islice(tasks, max_pending - len(pending)):
+                        pending[executor.submit(extract, data, target_)] = idx
+
+        columns = list(self.meta_extractors)
+        if approximate and chunk_size is None:
+            columns.append("SampleSize")
+        index = pandas_datasets.datasets_names or list(range(n_datasets))
+        metadata_df = pd.DataFrame.from_records(metadata, index=index, columns=columns)
+        metadata_df.index.name = "dataset"
+
+        return metadata_df
+
     def get_missing_metadata(
         self, X: pd.DataFrame, y: pd.DataFrame | pd.Series, metadata: Dict[str, float]
     ) -> Dict[str, float]:
@@ -87,22 +315,24 @@ class MetaDataExtractor:
             Dict[str, float]: _description_
         """
         filled_metadata = {}
+        to_extract = {}
 
         for metadata_name, metadata_value in metadata.items():
             if metadata_name in set(self.meta_extractors.keys()):
                 if metadata_value is None:
-                    extractor = self.meta_extractors[metadata_name]
-                    extracted_metadata_value = extractor(X, y)
-                    filled_metadata[metadata_name] = extracted_metadata_value
+                    to_extract[metadata_name] = self.meta_extractors[metadata_name]
                 else:
                     filled_metadata[metadata_name] = metadata_value
 
         missing_metadata = set(self.meta_extractors.keys()) - set(metadata.keys())
 
         for missing_metadata_name in missing_metadata:
-            extractor = self.meta_extractors[missing_metadata_name]
-            extracted_metadata_value = extractor(X, y)
-            filled_metadata[missing_metadata_name] = extracted_metadata_value
+            to_extract[missing_metadata_name] = self.meta_extractors[
+                missing_metadata_name
+            ]
+
+        engine = MetaFeatureEngine(X, y, self.meta_intermediates)
+        filled_metadata.update(engine.extract_all(to_extract))
 
         return filled_metadata
 
@@ -117,3 +347,19 @@ class MetaDataExtractor:
             metadata.pop(quality)
 
         return metadata
+
+
+def _extract_metadata(
+    extractor: MetaDataExtractor,
+    df: pd.DataFrame,
+    target: int | str,
+    **kwargs,
+) -> Dict[str, float]:
+    X, y = split_target(df, target)
+    return extractor.get_metadata(X, y, **kwargs)
+
+
+def _extract_metadata_from_file(
+    extractor: MetaDataExtractor, path: Path, target: int | str, chunk_size: int
+) -> Dict[str, float]:
+    return extractor.get_metadata_from_file(path, target, chunk_size)
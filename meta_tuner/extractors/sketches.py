@@ -0,0 +1,64 @@
+import numpy as np
+
+
+def hoeffding_sample_size(max_error: float, confidence: float) -> int:
+    """
+    Number of rows needed to estimate a mean of values bounded in [0, 1]
+    (e.g. class or missing values proportion) with absolute error at most
+    `max_error` with probability `confidence`, by Hoeffding's inequality.
+
+    Args:
+        max_error (float): maximal absolute error, in (0, 1).
+        confidence (float): probability of error below `max_error`, in (0, 1).
+
+    Returns:
+        int: sample size.
+    """
+    if not 0 < max_error < 1:
+        raise ValueError(f'Arg "max_error" should be in (0, 1). {max_error} provided')
+    if not 0 < confidence < 1:
+        raise ValueError(f'Arg "confidence" should be in (0, 1). {confidence} provided')
+    return int(np.ceil(np.log(2 / (1 - confidence)) / (2 * max_error**2)))
+
+
+class ReservoirSample:
+    """
+    Uniform sample without replacement of fixed size from stream of
+    values. Each value gets random key and values with the smallest keys
+    are kept, so samples of parts of stream can be merged.
+    """
+
+    def __init__(self, size: int, random_state: int = None) -> None:
+        """
+        Args:
+            size (int): maximal number of sampled values.
+            random_state (int, optional): Seed of random keys. Defaults to None.
+        """
+        self.size = size
+        self.n_seen = 0
+        self.__rng = np.random.default_rng(random_state)
+        self.__keys = np.empty(0)
+        self.__values: np.ndarray = None
+
+    @property
+    def sample(self) -> np.ndarray:
+        return self.__values
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values)
+        self.n_seen += len(values)
+        self.__keep(self.__rng.random(len(values)), values)
+
+    def merge(self, other: "ReservoirSample") -> None:
+        self.n_seen += other.n_seen
+        if other.sample is not None:
+            self.__keep(other.__keys, other.sample)
+
+    def __keep(self, keys: np.ndarray, values: np.ndarray) -> None:
+        if self.__values is not None:
+            keys = np.concatenate([self.__keys, keys])
+            values = np.concatenate([self.__values, values])
+        if len(keys) > self.size:
+            kept = np.argpartition(keys, self.size)[: self.size]
+            keys, values = keys[kept], values[kept]
+        self.__keys, self.__values = keys, values
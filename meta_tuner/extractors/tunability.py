@@ -1,7 +1,10 @@
 import numpy as np
+import warnings
 
 from typing import List, Dict, Callable
 
+from meta_tuner.searchers.search_grid import get_hpo_key
+
 
 class TunabilityExtractor:
     def __init__(
@@ -9,7 +12,27 @@ class TunabilityExtractor:
         search_results: List[Dict[str, List]],
         lowest_best: bool,
         aggregation_func: Callable[..., float] = np.mean,
+        budget: float = None,
     ) -> None:
+        """
+        Args:
+            search_results (List[Dict[str, List]]): search results for each dataset.
+            lowest_best (bool): If True, the lowest score is the best one.
+            aggregation_func (Callable[..., float], optional): Function aggregating
+                scores of configuration between datasets. Defaults to np.mean.
+            budget (float, optional): If provided, only evaluations with that
+                value in "budget" column are used, e.g. 1.0 to use full-budget
+                evaluations from SuccessiveHalvingSearch. Configurations which
+                reach that budget differ between datasets, so only those which
+                reached it on every dataset are used, in order of the first
+                dataset. Defaults to None.
+        """
+        if budget is not None:
+            search_results = [
+                self.__select_budget(search_result, budget)
+                for search_result in search_results
+            ]
+            search_results = self.__align_configurations(search_results, budget)
         self.__check_results(search_results)
         self.search_results = search_results
         self.lowest_best = lowest_best
@@ -30,6 +53,56 @@ class TunabilityExtractor:
             for search_result in search_results:
                 assert len(search_result[key]) == len_
 
+        first_hpos = list(map(get_hpo_key, first_seach_results["hpo"]))
+        for search_result in search_results:
+            hpos = list(map(get_hpo_key, search_result["hpo"]))
+            if hpos != first_hpos:
+                raise ValueError(
+                    "Configurations are not aligned between datasets. "
+                    "Evaluate the same configurations on each dataset, e.g. with FixedGrid."
+                )
+
+    def __align_configurations(
+        self, search_results: List[Dict[str, List]], budget: float
+    ) -> List[Dict[str, List]]:
+        positions = []
+        for search_result in search_results:
+            # first evaluation of configuration is used
+            result_positions = {}
+            for i, hpo in enumerate(search_result["hpo"]):
+                result_positions.setdefault(get_hpo_key(hpo), i)
+            positions.append(result_positions)
+
+        common_keys = [
+            key
+            for key in positions[0]
+            if all(key in result_positions for result_positions in positions[1:])
+        ]
+        if not common_keys:
+            raise ValueError(
+                f"No configuration was evaluated with budget {budget} on every dataset. "
+                "Evaluate the same configurations on each dataset, e.g. with FixedGrid."
+            )
+        if any(len(result_positions) > len(common_keys) for result_positions in positions):
+            warnings.warn(
+                f"Only {len(common_keys)} configurations were evaluated with budget "
+                f"{budget} on every dataset, other configurations are skipped."
+            )
+
+        return [
+            {
+                name: [values[result_positions[key]] for key in common_keys]
+                for name, values in result.items()
+            }
+            for result, result_positions in zip(search_results, positions)
+        ]
+
+    def __select_budget(
+        self, search_result: Dict[str, List], budget: float
+    ) -> Dict[str, List]:
+        idxs = [i for i, budget_ in enumerate(search_result["budget"]) if budget_ == budget]
+        return {key: [values[i] for i in idxs] for key, values in search_result.items()}
+
     def extract_default_hpo(self) -> Dict[str, any]:
         n_iter = len(self.search_results[0]["hpo"])
         n_datasets = len(self.search_results)
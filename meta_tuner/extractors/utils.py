@@ -1,18 +1,139 @@
 import numpy as np
 
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Tuple
 
+from .engine import (
+    depends_on,
+    entropy,
+    mutual_information,
+    skewness,
+    kurtosis,
+    correlations,
+)
 
-def NumberOfFeatures(X, y=None) -> float:
-    return X.shape[1]
 
+@depends_on("n_features")
+def NumberOfFeatures(n_features: int) -> float:
+    return n_features
 
-def NumberOfInstances(X, y=None) -> float:
-    return X.shape[0]
 
+@depends_on("n_instances")
+def NumberOfInstances(n_instances: int) -> float:
+    return n_instances
 
-def NumberOfNumericFeatures(X, y=None) -> float:
-    return X.select_dtypes(include=np.number).shape[1]
+
+@depends_on("sample_size")
+def SampleSize(sample_size: int) -> float:
+    return sample_size
+
+
+@depends_on("n_numeric")
+def NumberOfNumericFeatures(n_numeric: int) -> float:
+    return n_numeric
+
+
+@depends_on("n_features", "n_numeric")
+def NumberOfSymbolicFeatures(n_features: int, n_numeric: int) -> float:
+    return n_features - n_numeric
+
+
+@depends_on("null_counts")
+def NumberOfMissingValues(null_counts: np.ndarray) -> float:
+    return int(null_counts.sum())
+
+
+@depends_on("n_instances_with_missing")
+def NumberOfInstancesWithMissingValues(n_instances_with_missing: int) -> float:
+    return n_instances_with_missing
+
+
+@depends_on("null_counts", "n_instances", "n_features")
+def PercentageOfMissingValues(
+    null_counts: np.ndarray, n_instances: int, n_features: int
+) -> float:
+    n_values = n_instances * n_features
+    return 100 * float(null_counts.sum()) / n_values if n_values else np.nan
+
+
+@depends_on("target_counts")
+def NumberOfClasses(target_counts: np.ndarray | None) -> float:
+    if target_counts is None:
+        return np.nan
+    return len(target_counts)
+
+
+@depends_on("target_counts")
+def ClassEntropy(target_counts: np.ndarray | None) -> float:
+    if target_counts is None:
+        return np.nan
+    return entropy(target_counts)
+
+
+@depends_on("target_counts")
+def MajorityClassPercentage(target_counts: np.ndarray | None) -> float:
+    if target_counts is None or target_counts.sum() == 0:
+        return np.nan
+    return 100 * float(target_counts.max() / target_counts.sum())
+
+
+@depends_on("target_counts")
+def MinorityClassPercentage(target_counts: np.ndarray | None) -> float:
+    if target_counts is None or target_counts.sum() == 0:
+        return np.nan
+    return 100 * float(target_counts.min() / target_counts.sum())
+
+
+@depends_on("moments")
+def MeanMeansOfNumericAtts(moments: Tuple[np.ndarray, ...]) -> float:
+    return _nanmean(moments[1])
+
+
+@depends_on("moments")
+def MeanStdDevOfNumericAtts(moments: Tuple[np.ndarray, ...]) -> float:
+    count, _, m2, _, _ = moments
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return _nanmean(np.sqrt(m2 / (count - 1)))
+
+
+@depends_on("moments")
+def MeanSkewnessOfNumericAtts(moments: Tuple[np.ndarray, ...]) -> float:
+    count, _, m2, m3, _ = moments
+    return _nanmean(skewness(count, m2, m3))
+
+
+@depends_on("moments")
+def MeanKurtosisOfNumericAtts(moments: Tuple[np.ndarray, ...]) -> float:
+    count, _, m2, _, m4 = moments
+    return _nanmean(kurtosis(count, m2, m4))
+
+
+@depends_on("value_counts")
+def MeanAttributeEntropy(value_counts: List[np.ndarray]) -> float:
+    return _nanmean([entropy(counts) for counts in value_counts])
+
+
+@depends_on("distinct_counts")
+def MeanNominalAttDistinctValues(distinct_counts: np.ndarray) -> float:
+    return _nanmean(distinct_counts)
+
+
+@depends_on("joint_counts")
+def MeanMutualInformation(joint_counts: List[np.ndarray] | None) -> float:
+    if joint_counts is None:
+        return np.nan
+    return _nanmean([mutual_information(joint) for joint in joint_counts])
+
+
+@depends_on("comoments")
+def MeanAbsoluteCorrelation(comoments: Tuple[np.ndarray, ...]) -> float:
+    correlation = correlations(*comoments)
+    return _nanmean(np.abs(correlation[np.triu_indices_from(correlation, k=1)]))
+
+
+def _nanmean(values: np.ndarray) -> float:
+    values = np.asarray(values, dtype=np.float64)
+    values = values[~np.isnan(values)]
+    return float(values.mean()) if len(values) else np.nan
 
 
 meta_extractors: Dict[str, Callable[..., float]] = {
@@ -20,3 +141,23 @@ meta_extractors: Dict[str, Callable[..., float]] = {
     "NumberOfInstances": NumberOfInstances,
     "NumberOfNumericFeatures": NumberOfNumericFeatures,
 }
+
+extended_meta_extractors: Dict[str, Callable[..., float]] = {
+    **meta_extractors,
+    "NumberOfSymbolicFeatures": NumberOfSymbolicFeatures,
+    "NumberOfMissingValues": NumberOfMissingValues,
+    "NumberOfInstancesWithMissingValues": NumberOfInstancesWithMissingValues,
+    "PercentageOfMissingValues": PercentageOfMissingValues,
+    "NumberOfClasses": NumberOfClasses,
+    "ClassEntropy": ClassEntropy,
+    "MajorityClassPercentage": MajorityClassPercentage,
+    "MinorityClassPercentage": MinorityClassPercentage,
+    "MeanMeansOfNumericAtts": MeanMeansOfNumericAtts,
+    "MeanStdDevOfNumericAtts": MeanStdDevOfNumericAtts,
+    "MeanSkewnessOfNumericAtts": MeanSkewnessOfNumericAtts,
+    "MeanKurtosisOfNumericAtts": MeanKurtosisOfNumericAtts,
+    "MeanAttributeEntropy": MeanAttributeEntropy,
+    "MeanNominalAttDistinctValues": MeanNominalAttDistinctValues,
+    "MeanMutualInformation": MeanMutualInformation,
+    "MeanAbsoluteCorrelation": MeanAbsoluteCorrelation,
+}
@@ -0,0 +1,94 @@
+import time
+
+
+class SearchBudget:
+    """
+    Limits search by wall-clock time, CPU time and number of fits. Before a
+    trial is started, its cost is predicted from already finished trials,
+    so the search stops before the trial that would exceed the budget
+    instead of after it. CPU time is counted as the sum of fit and predict
+    durations measured in workers.
+    """
+
+    def __init__(
+        self,
+        max_time: float = None,
+        max_cpu_time: float = None,
+        max_fits: int = None,
+    ) -> None:
+        """
+        Args:
+            max_time (float, optional): Wall-clock budget in seconds.
+                Defaults to None.
+            max_cpu_time (float, optional): Budget of summed fit and predict
+                time of all workers, in seconds. Defaults to None.
+            max_fits (int, optional): Maximal number of fitted models. Results
+                read from TrialCache are not counted. Defaults to None.
+        """
+        self.max_time = max_time
+        self.max_cpu_time = max_cpu_time
+        self.max_fits = max_fits
+        self.start()
+
+    def start(self) -> None:
+        """
+        Start measuring time and clear counters. Called by searchers when
+        search starts.
+        """
+        self.start_time = time.perf_counter()
+        self.last_finish_time = 0.0
+        self.cpu_time = 0.0
+        self.n_started_fits = 0
+        self.n_started = 0
+        self.n_finished = 0
+
+    @property
+    def elapsed_time(self) -> float:
+        return time.perf_counter() - self.start_time
+
+    def can_start(self, n_fits: int) -> bool:
+        """
+        Check whether trial with `n_fits` fits is expected to end within budget.
+        Trials which are still running are included in the prediction.
+
+        Args:
+            n_fits (int): number of fits of trial, e.g. number of folds.
+
+        Returns:
+            bool: True if trial should be started.
+        """
+        if self.max_fits is not None and self.n_started_fits + n_fits > self.max_fits:
+            return False
+        if self.n_finished == 0:
+            return not self.is_exhausted()
+
+        n_expected = self.n_started - self.n_finished + 1
+        if self.max_time is not None:
+            time_per_trial = self.last_finish_time / self.n_finished
+            if self.elapsed_time + n_expected * time_per_trial > self.max_time:
+                return False
+        if self.max_cpu_time is not None:
+            cpu_per_trial = self.cpu_time / self.n_finished
+            if self.cpu_time + n_expected * cpu_per_trial > self.max_cpu_time:
+                return False
+
+        return True
+
+    def start_trial(self, n_fits: int) -> None:
+        self.n_started += 1
+        self.n_started_fits += n_fits
+
+    def finish_trial(self, cpu_time: float) -> None:
+        """
+        Args:
+            cpu_time (float): summed fit and predict time of trial.
+        """
+        self.n_finished += 1
+        self.cpu_time += cpu_time
+        self.last_finish_time = self.elapsed_time
+
+    def is_exhausted(self) -> bool:
+        return bool(
+            (self.max_time is not None and self.elapsed_time >= self.max_time)
+            or (self.max_cpu_time is not None and self.cpu_time >= self.max_cpu_time)
+        )
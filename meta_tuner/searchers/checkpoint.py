@@ -0,0 +1,98 @@
+import os
+import pickle
+
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from meta_tuner.searchers.splits import CVSplitPlan
+
+
+class SearchCheckpoint:
+    """
+    Append-only log of search state in local file. File starts with header
+    (plan of folds and state of grid) followed by one record per finished
+    trial (its results and state of grid after it was picked). Records are
+    pickled one after another, so saving a trial never rewrites the file and
+    a record torn by a crash is discarded on load.
+    """
+
+    def __init__(self, path: str | Path, every: int = 1) -> None:
+        """
+        Args:
+            path (str | Path): path of checkpoint file.
+            every (int, optional): Number of trials kept in memory before
+                they are written to the file. Defaults to 1.
+        """
+        self.path = Path(path)
+        self.every = every
+        self.__records: List[Dict[str, any]] = []
+
+    def create(self, split_plan: CVSplitPlan, grid_state: Dict[str, any]) -> None:
+        """
+        Start new checkpoint. Existing file is overwritten.
+
+        Args:
+            split_plan (CVSplitPlan): folds used by the search.
+            grid_state (Dict[str, any]): state of grid before the first pick.
+        """
+        self.__records = []
+        with open(self.path, "wb") as f:
+            pickle.dump(
+                {"type": "header", "split_plan": split_plan, "grid_state": grid_state}, f
+            )
+            f.flush()
+            os.fsync(f.fileno())
+
+    def add_trial(self, results: Dict[str, any], grid_state: Dict[str, any]) -> None:
+        """
+        Args:
+            results (Dict[str, any]): results of trial, one value per column.
+            grid_state (Dict[str, any]): state of grid after the trial was picked.
+        """
+        self.__records.append(
+            {"type": "trial", "results": results, "grid_state": grid_state}
+        )
+        if len(self.__records) >= self.every:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Append buffered trials to the file.
+        """
+        if not self.__records:
+            return
+        with open(self.path, "ab") as f:
+            for record in self.__records:
+                pickle.dump(record, f)
+            f.flush()
+            os.fsync(f.fileno())
+        self.__records = []
+
+    def load(self) -> Tuple[CVSplitPlan, Dict[str, any], List[Dict[str, any]]]:
+        """
+        Read checkpoint. Incomplete record at the end of the file is
+        truncated, so new trials can be appended after the last complete one.
+
+        Returns:
+            Tuple[CVSplitPlan, Dict[str, any], List[Dict[str, any]]]: plan of
+                folds, state of grid after the last saved trial and results of
+                saved trials.
+        """
+        records = []
+        with open(self.path, "rb") as f:
+            offset = 0
+            while True:
+                try:
+                    records.append(pickle.load(f))
+                except (EOFError, pickle.UnpicklingError):
+                    break
+                offset = f.tell()
+
+        if not records or records[0]["type"] != "header":
+            raise ValueError(f"File {self.path} is not a search checkpoint.")
+        os.truncate(self.path, offset)
+
+        header, trials = records[0], records[1:]
+        grid_state = trials[-1]["grid_state"] if trials else header["grid_state"]
+
+        return header["split_plan"], grid_state, [trial["results"] for trial in trials]
@@ -1,4 +1,4 @@
-import numpy as np
+import time
 
 from abc import ABC, abstractmethod
 from typing import Dict, List
@@ -9,27 +9,137 @@ class GenericEarlyStopping(ABC):
     def is_stop(self, values: Dict[str, List]) -> bool:
         ...
 
+    def reset(self) -> None:
+        """
+        Forget state of previous search. Called by searchers when search starts.
+        """
+        ...
+
 
 class DummyEarlyStopping(GenericEarlyStopping):
     def is_stop(self, values: Dict[str, List]) -> bool:
         return False
 
 
-class NoImprovementEarlyStopping(GenericEarlyStopping):
+class _IncrementalEarlyStopping(GenericEarlyStopping):
+    """
+    Tracks best score and iteration in which it was found, processing
+    only scores added since previous call. Search is stopped if there
+    was no improvement in last `n_iteration - 1` iterations. If history
+    of scores does not continue previously seen one (e.g. new search),
+    state is computed from scratch.
+    """
+
     def __init__(self, n_iteration: int = 100, lowest_best: bool = True) -> None:
         super().__init__()
         self.n_iteration = n_iteration
         self.lowest_best = lowest_best
+        self.reset()
+
+    def reset(self) -> None:
+        self.best_score = None
+        self.best_iter = None
+        self.n_seen = 0
+        self.__first_score = None
+        self.__last_score = None
 
     def is_stop(self, values: Dict[str, List]) -> bool:
         scores = values["mean_score"]
 
+        if not self.__is_continued(scores):
+            self.reset()
+        for i in range(self.n_seen, len(scores)):
+            score = -scores[i] if self.lowest_best else scores[i]
+            if self.best_score is None or self._is_improvement(score, self.best_score):
+                self.best_score = score
+                self.best_iter = i
+        if len(scores) > self.n_seen:
+            self.n_seen = len(scores)
+            self.__first_score = scores[0]
+            self.__last_score = scores[-1]
+
         if len(scores) < self.n_iteration:
             return False
 
-        best_score = np.max(scores)
-        best_from_last_n = np.max(scores[-1 : -self.n_iteration : -1])
+        return self.best_iter < len(scores) - self.n_iteration + 1
+
+    @abstractmethod
+    def _is_improvement(self, score: float, best_score: float) -> bool:
+        """
+        Args:
+            score (float): new score, higher is better.
+            best_score (float): best score so far, higher is better.
+        """
+        ...
+
+    def __is_continued(self, scores: List[float]) -> bool:
+        if self.n_seen == 0:
+            return True
+        if len(scores) < self.n_seen:
+            return False
+
+        return self.__is_same(scores[0], self.__first_score) and self.__is_same(
+            scores[self.n_seen - 1], self.__last_score
+        )
+
+    @staticmethod
+    def __is_same(value_1: float, value_2: float) -> bool:
+        return value_1 == value_2 or (value_1 != value_1 and value_2 != value_2)
+
 
-        is_improvement = best_score == best_from_last_n
+class NoImprovementEarlyStopping(_IncrementalEarlyStopping):
+    """
+    Stops search if the best score was not found in last `n_iteration - 1`
+    iterations. Costs O(1) per iteration.
+    """
+
+    def _is_improvement(self, score: float, best_score: float) -> bool:
+        return score >= best_score
+
+
+class RelativeImprovementEarlyStopping(_IncrementalEarlyStopping):
+    """
+    Stops search if score was not improved by more than `min_delta` (relative
+    to the best score) in last `n_iteration - 1` iterations.
+    """
+
+    def __init__(
+        self, n_iteration: int = 100, lowest_best: bool = True, min_delta: float = 1e-3
+    ) -> None:
+        """
+        Args:
+            n_iteration (int, optional): Patience in iterations. Defaults to 100.
+            lowest_best (bool, optional): If True, lower score is better.
+                Defaults to True.
+            min_delta (float, optional): Minimal relative improvement of best
+                score. Defaults to 1e-3.
+        """
+        super().__init__(n_iteration, lowest_best)
+        self.min_delta = min_delta
+
+    def _is_improvement(self, score: float, best_score: float) -> bool:
+        return score - best_score > self.min_delta * abs(best_score)
+
+
+class TimeBudgetEarlyStopping(GenericEarlyStopping):
+    """
+    Stops search when given wall-clock time has passed since its start.
+    """
+
+    def __init__(self, max_time: float) -> None:
+        """
+        Args:
+            max_time (float): time budget in seconds.
+        """
+        super().__init__()
+        self.max_time = max_time
+        self.start_time = None
+
+    def reset(self) -> None:
+        self.start_time = time.perf_counter()
+
+    def is_stop(self, values: Dict[str, List]) -> bool:
+        if self.start_time is None:
+            self.reset()
 
-        return not is_improvement
+        return time.perf_counter() - self.start_time >= self.max_time
@@ -3,13 +3,26 @@ import pandas as pd
 import warnings
 
 from abc import ABC, abstractmethod
-from typing import Dict, Tuple, List, Callable, Optional
+from typing import Dict, Tuple, List, Callable, Optional, Iterator, Generator
 from copy import deepcopy
 from functools import partial
+from collections import deque
+from concurrent.futures import Future
+from itertools import islice
+from pathlib import Path
+
+from sklearn.base import clone
 
 from meta_tuner.searchers.search_grid import RandomGrid
 from meta_tuner.searchers.early_stopping import GenericEarlyStopping, DummyEarlyStopping
 from meta_tuner.searchers.search_results import _SearchResults
+from meta_tuner.searchers.preprocessors import PreprocessingCache
+from meta_tuner.searchers.splits import CVSplitPlan
+from meta_tuner.searchers.budget import SearchBudget
+from meta_tuner.searchers.checkpoint import SearchCheckpoint
+from meta_tuner.searchers.trial_cache import TrialCache
+from meta_tuner.searchers.utils import fit_and_score
+from meta_tuner.utils import get_executor, resolve_n_jobs
 
 
 class GenericHPOSearch(ABC):
@@ -18,11 +31,20 @@ class GenericHPOSearch(ABC):
         model: any,
         random_grid: RandomGrid,
         early_stopping: Optional[GenericEarlyStopping] = None,
+        model_init: str = "deepcopy",
     ) -> None:
+        if model_init not in ("deepcopy", "clone", "factory"):
+            raise ValueError(
+                f'For arg "model_init" only "deepcopy", "clone", "factory" are allowed. {model_init} provided'
+            )
         self.model = model
+        self.model_init = model_init
         self.random_grid = random_grid
         self.early_stopping = early_stopping or DummyEarlyStopping()
         self._search_results = _SearchResults()
+        self._preprocessing_cache: Optional[PreprocessingCache] = None
+        self._trial_cache: Optional[TrialCache] = None
+        self.split_plan: Optional[CVSplitPlan] = None
 
     @property
     def search_results(self):
@@ -41,21 +63,206 @@ class GenericHPOSearch(ABC):
     ) -> Dict[str, any]:
         ...
 
-    def _get_cv_indexes(
-        self, size: int, cv: int
-    ) -> List[Tuple[np.ndarray, np.ndarray]]:
-        all_indexes = np.arange(size)
-        fold_size = size // cv
-        folds = []
+    def _get_split_plan(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        cv: int,
+        split_plan: Optional[CVSplitPlan],
+        stratify: bool,
+    ) -> CVSplitPlan:
+        if split_plan is not None:
+            if split_plan.bounds[-1] != X.shape[0]:
+                raise ValueError(
+                    f"Split plan is defined for {split_plan.bounds[-1]} rows, dataset has {X.shape[0]}."
+                )
+            return split_plan
+        return CVSplitPlan.create(X.shape[0], cv, y if stratify else None)
+
+    def _split_fold(
+        self, X: pd.DataFrame, y: pd.DataFrame, fold: Tuple[np.ndarray, np.ndarray]
+    ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        train_X, test_X = X.iloc[fold[0], :], X.iloc[fold[1], :]
+        train_y, test_y = y.iloc[fold[0], :], y.iloc[fold[1], :]
+
+        return train_X, train_y, test_X, test_y
+
+    def _get_fold_args(
+        self,
+        hpo: Dict[str, any],
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        fold: Tuple[np.ndarray, np.ndarray],
+    ) -> Tuple:
+        """
+        Prepare model and data of one fold for `fit_and_score`. If preprocessing
+        cache is used, preprocessing steps of pipeline are taken from cache and
+        only the final model is fitted.
+        """
+        model = self._override_model_hpo(hpo)
+        if self._preprocessing_cache is not None and PreprocessingCache.is_cacheable(
+            model, hpo
+        ):
+            train_X, test_X = self._preprocessing_cache.fit_transform(
+                model[:-1], X, y, fold[0], fold[1]
+            )
+            train_y, test_y = y.iloc[fold[0], :], y.iloc[fold[1], :]
+            return model[-1], train_X, train_y, test_X, test_y
+
+        return model, *self._split_fold(X, y, fold)
+
+    def _evaluate_trials(
+        self,
+        trials: Iterator[Tuple[Dict[str, any], List[Tuple[np.ndarray, np.ndarray]]]],
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        n_jobs: int = 1,
+        backend: str = "process",
+    ) -> Generator[
+        Tuple[Dict[str, any], List[float], List[float], List[float]], None, None
+    ]:
+        """
+        Evaluate trials and yield their scores in the order of `trials`.
+        If `n_jobs` is greater than one, folds of at most `n_jobs` trials
+        are evaluated concurrently. Closing the generator cancels trials
+        that were not started yet.
+
+        Args:
+            trials (Iterator[Tuple[Dict[str, any], List[Tuple[np.ndarray, np.ndarray]]]]):
+                iterator over pairs (hyperparameters, folds).
+            X (pd.DataFrame): dataframe with features.
+            y (pd.DataFrame): dataframe with target.
+            scoring (Callable[..., float]): scoring function.
+            n_jobs (int, optional): Number of workers. Defaults to 1.
+            backend (str, optional): Type of pool. Valid values: ("process",
+                "thread"). Defaults to "process".
+
+        Yields:
+            Tuple[Dict[str, any], List[float], List[float], List[float]]:
+                hyperparameters, scores, fit times and predict times on
+                each fold.
+        """
+        if n_jobs == 1:
+            for hpo, folds in trials:
+                results = []
+                for fold in folds:
+                    key, result = self.__get_cached_result(hpo, fold, scoring)
+                    if result is None:
+                        result = fit_and_score(
+                            *self._get_fold_args(hpo, X, y, fold), scoring
+                        )
+                        self.__put_cached_result(key, result)
+                    results.append(result)
+                yield hpo, *self.__unzip_results(results)
+            return
+
+        def submit(hpo, folds):
+            keys, futures = [], []
+            for fold in folds:
+                key, result = self.__get_cached_result(hpo, fold, scoring)
+                if result is None:
+                    future = executor.submit(
+                        fit_and_score, *self._get_fold_args(hpo, X, y, fold), scoring
+                    )
+                else:
+                    key, future = None, Future()
+                    future.set_result(result)
+                keys.append(key)
+                futures.append(future)
+            return hpo, keys, futures
+
+        trials = iter(trials)
+        executor = get_executor(backend, n_jobs)
+        try:
+            pending = deque(
+                submit(hpo, folds)
+                for hpo, folds in islice(trials, resolve_n_jobs(n_jobs))
+            )
+            while pending:
+                hpo, keys, futures = pending.popleft()
+                results = [future.result() for future in futures]
+                for key, result in zip(keys, results):
+                    self.__put_cached_result(key, result)
+                yield hpo, *self.__unzip_results(results)
+                pending.extend(submit(hpo, folds) for hpo, folds in islice(trials, 1))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _set_trial_cache(
+        self,
+        trial_cache: Optional[TrialCache],
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+    ) -> None:
+        if trial_cache is not None and trial_cache.describe_callable(scoring) is None:
+            warnings.warn(
+                f"Scoring function {scoring!r} cannot be identified between runs, "
+                "so trial cache is not used. Use function defined in module or "
+                "partial of it."
+            )
+            trial_cache = None
+        self._trial_cache = trial_cache
+        if trial_cache is not None:
+            self._trial_cache_fingerprint = trial_cache.get_fingerprint(X, y)
+            self._trial_cache_model = (
+                self.model() if self.model_init == "factory" else self.model
+            )
+
+    def _count_fits(
+        self,
+        hpo: Dict[str, any],
+        folds: List[Tuple[np.ndarray, np.ndarray]],
+        scoring: Callable[..., float],
+    ) -> int:
+        """
+        Number of folds of trial which have to be fitted, i.e. which are
+        not in trial cache.
+        """
+        if self._trial_cache is None:
+            return len(folds)
+        return sum(
+            self.__get_cache_key(hpo, fold, scoring) not in self._trial_cache
+            for fold in folds
+        )
+
+    def __get_cache_key(
+        self,
+        hpo: Dict[str, any],
+        fold: Tuple[np.ndarray, np.ndarray],
+        scoring: Callable[..., float],
+    ) -> str:
+        return self._trial_cache.get_key(
+            self._trial_cache_fingerprint, self._trial_cache_model, hpo, fold, scoring
+        )
+
+    def __get_cached_result(
+        self,
+        hpo: Dict[str, any],
+        fold: Tuple[np.ndarray, np.ndarray],
+        scoring: Callable[..., float],
+    ) -> Tuple[Optional[str], Optional[Tuple[float, float, float]]]:
+        if self._trial_cache is None:
+            return None, None
+        key = self.__get_cache_key(hpo, fold, scoring)
+        return key, self._trial_cache.get(key)
 
-        remain_indexes = np.copy(all_indexes)
+    def __put_cached_result(
+        self, key: Optional[str], result: Tuple[float, float, float]
+    ) -> None:
+        if key is not None:
+            self._trial_cache.put(key, result)
 
-        for _ in range(cv):
-            fold = np.random.choice(remain_indexes, fold_size, replace=False)
-            remain_indexes = np.setdiff1d(remain_indexes, fold)
-            folds.append((fold, np.delete(all_indexes, fold)))
+    @staticmethod
+    def __unzip_results(
+        results: List[Tuple[float, float, float]]
+    ) -> Tuple[List[float], List[float], List[float]]:
+        scores = [score for score, _, _ in results]
+        fit_times = [fit_time for _, fit_time, _ in results]
+        predict_times = [predict_time for _, _, predict_time in results]
 
-        return folds
+        return scores, fit_times, predict_times
 
     def _encode_y(self, y: pd.Series) -> pd.DataFrame:
         y = y.astype("category")
@@ -64,12 +271,31 @@ class GenericHPOSearch(ABC):
         return y
 
     def _override_model_hpo(self, hpo: Dict[str, any]) -> None:
-        model_ = deepcopy(self.model)
+        if self.model_init == "clone":
+            model_ = clone(self.model)
+        elif self.model_init == "factory":
+            model_ = self.model()
+        else:
+            model_ = deepcopy(self.model)
+
         for key, value in hpo.items():
-            setattr(model_, key, value)
+            self.__set_hpo(model_, key, value)
 
         return model_
 
+    def __set_hpo(self, model: any, key: str, value: any) -> None:
+        """
+        Set hyperparameter of model. Nested names (`step__param`) refer to
+        parameters of model's components, e.g. steps of pipeline.
+        """
+        if hasattr(model, "set_params") and key in model.get_params(deep="__" in key):
+            model.set_params(**{key: value})
+        elif "__" in key:
+            name, sub_key = key.split("__", 1)
+            self.__set_hpo(getattr(model, name), sub_key, value)
+        else:
+            setattr(model, key, value)
+
 
 class RandomSearch(GenericHPOSearch):
     """
@@ -83,8 +309,21 @@ class RandomSearch(GenericHPOSearch):
         model: any,
         random_grid: RandomGrid,
         early_stopping: Optional[GenericEarlyStopping] = None,
+        model_init: str = "deepcopy",
     ) -> None:
-        super().__init__(model, random_grid, early_stopping)
+        """
+        Args:
+            model (any): model to evaluate, or callable returning new model
+                if `model_init` is "factory".
+            random_grid (RandomGrid): grid from which hyperparameters are picked.
+            early_stopping (Optional[GenericEarlyStopping], optional): early
+                stopping criterion. Defaults to None.
+            model_init (str, optional): How new model is created for each fold.
+                Valid values: ("deepcopy", "clone", "factory"). "clone" uses
+                sklearn's `clone`, which copies only unfitted parameters of
+                estimator, "factory" calls `model()`. Defaults to "deepcopy".
+        """
+        super().__init__(model, random_grid, early_stopping, model_init)
 
     def search(
         self,
@@ -94,10 +333,20 @@ class RandomSearch(GenericHPOSearch):
         n_iter: int = 100,
         cv: int = 5,
         encode_y: bool = False,
+        n_jobs: int = 1,
+        backend: str = "process",
+        cache_preprocessing: bool = False,
+        split_plan: Optional[CVSplitPlan] = None,
+        stratify: bool = False,
+        budget: Optional[SearchBudget] = None,
+        checkpoint: Optional[str | Path] = None,
+        checkpoint_every: int = 1,
+        trial_cache: Optional[TrialCache] = None,
     ) -> None:
         """
         Evaluate model on provided data with randomly
-        selected hyperparameters.
+        selected hyperparameters. Besides scores, total fit and predict
+        time of each trial are stored in "fit_time" and "predict_time".
 
         Args:
             X (pd.DataFrame): dataframe with features.
@@ -114,32 +363,496 @@ class RandomSearch(GenericHPOSearch):
                 functions. Defaults to None. Defaults to None.
             encode_y (bool, optional): if set as true, y will be hot-one
                 encoded before all operations. Defaults to False.
+            n_jobs (int, optional): Number of workers evaluating trials and
+                their folds concurrently. If -1, all processors are used.
+                Results are stored in the same order as in serial run.
+                Defaults to 1.
+            backend (str, optional): Type of pool used if `n_jobs` is not 1.
+                Valid values: ("process", "thread"). With "process", model
+                and scoring function have to be picklable. Defaults to "process".
+            cache_preprocessing (bool, optional): If True, preprocessing steps
+                of pipeline model (e.g. from `wrap_model_with_preprocessing`) are
+                fitted once per fold instead of once per trial and fold. Not used
+                for trials whose hyperparameters refer to preprocessing steps.
+                Defaults to False.
+            split_plan (CVSplitPlan, optional): Folds used by every trial. If None,
+                plan with `cv` folds is created once per call. Defaults to None.
+            stratify (bool, optional): If True and plan is not provided, folds
+                are stratified by y. Defaults to False.
+            budget (SearchBudget, optional): Time and fits budget. Search ends
+                before `n_iter` trials if next trial is not expected to fit
+                in the remaining budget. Folds read from `trial_cache` are not
+                counted as fits. Defaults to None.
+            checkpoint (str | Path, optional): If provided, plan of folds, state
+                of grid and results of finished trials are appended to this
+                file, so the search can be continued with `resume`. Existing
+                file is overwritten. Defaults to None.
+            checkpoint_every (int, optional): Number of trials after which
+                checkpoint is written to disk. Defaults to 1.
+            trial_cache (TrialCache, optional): On-disk cache of fold results.
+                Folds already evaluated with the same data, model,
+                hyperparameters, indices and scoring are read from it instead
+                of being fitted again. Not used, with warning, if scoring
+                function cannot be described by `TrialCache.describe_callable`.
+                Defaults to None.
         """
+        self.split_plan = super()._get_split_plan(X, y, cv, split_plan, stratify)
         if encode_y:
             y = super()._encode_y(y)
-        for i in range(n_iter):
-            hpo = self.random_grid.pick()
-            folds = super()._get_cv_indexes(X.shape[0], cv)
-            scores = []
-            for fold in folds:
-                train_X, test_X = X.iloc[fold[0], :], X.iloc[fold[1], :]
-                train_y, test_y = y.iloc[fold[0], :], y.iloc[fold[1], :]
 
-                model = self._override_model_hpo(hpo)
-                model.fit(train_X, train_y)
-                pred_y = model.predict(test_X)
+        search_checkpoint = None
+        if checkpoint is not None:
+            search_checkpoint = SearchCheckpoint(checkpoint, checkpoint_every)
+            search_checkpoint.create(self.split_plan, self.random_grid.get_state())
 
-                score = scoring(test_y, pred_y)
-                scores.append(score)
+        self.__run(
+            X,
+            y,
+            scoring,
+            n_iter,
+            n_jobs,
+            backend,
+            cache_preprocessing,
+            budget,
+            search_checkpoint,
+            trial_cache,
+        )
 
-            self._search_results.add("scores", scores)
-            self._search_results.add("hpo", hpo)
-            self._search_results.add("mean_score", np.mean(scores))
-            self._search_results.add("std_score", np.std(scores))
+    def resume(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        checkpoint: str | Path,
+        n_iter: int = 100,
+        encode_y: bool = False,
+        n_jobs: int = 1,
+        backend: str = "process",
+        cache_preprocessing: bool = False,
+        budget: Optional[SearchBudget] = None,
+        checkpoint_every: int = 1,
+        trial_cache: Optional[TrialCache] = None,
+    ) -> None:
+        """
+        Continue search saved with `checkpoint` argument of `search`. Results
+        are replaced with the saved ones, plan of folds and state of grid are
+        restored and the remaining trials are evaluated, so the results are the
+        same as of search that was not interrupted. New trials are appended to
+        the same file.
 
-            is_stop = self.early_stopping.is_stop(self.search_results)
-            if is_stop:
+        Args:
+            X (pd.DataFrame): dataframe with features, the same as in `search`.
+            y (pd.DataFrame): dataframe with target, the same as in `search`.
+            scoring (Callable[..., float]): scoring function.
+            checkpoint (str | Path): path of checkpoint file.
+            n_iter (int, optional): Total number of iterations, including the
+                saved ones. Defaults to 100.
+            encode_y (bool, optional): if set as true, y will be hot-one
+                encoded before all operations. Defaults to False.
+            n_jobs (int, optional): Number of workers. Defaults to 1.
+            backend (str, optional): Type of pool used if `n_jobs` is not 1.
+                Valid values: ("process", "thread"). Defaults to "process".
+            cache_preprocessing (bool, optional): See `search`. Defaults to False.
+            budget (SearchBudget, optional): Budget of the resumed part of
+                search. Defaults to None.
+            checkpoint_every (int, optional): Number of trials after which
+                checkpoint is written to disk. Defaults to 1.
+            trial_cache (TrialCache, optional): See `search`. Defaults to None.
+        """
+        search_checkpoint = SearchCheckpoint(checkpoint, checkpoint_every)
+        split_plan, grid_state, trials_results = search_checkpoint.load()
+
+        self.split_plan = super()._get_split_plan(X, y, len(split_plan), split_plan, False)
+        if encode_y:
+            y = super()._encode_y(y)
+        self.random_grid.set_state(grid_state)
+        self._search_results = _SearchResults()
+        for results in trials_results:
+            for name, value in results.items():
+                self._search_results.add(name, value)
+
+        self.__run(
+            X,
+            y,
+            scoring,
+            n_iter - len(trials_results),
+            n_jobs,
+            backend,
+            cache_preprocessing,
+            budget,
+            search_checkpoint,
+            trial_cache,
+        )
+
+    def __run(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        n_iter: int,
+        n_jobs: int,
+        backend: str,
+        cache_preprocessing: bool,
+        budget: Optional[SearchBudget],
+        search_checkpoint: Optional[SearchCheckpoint],
+        trial_cache: Optional[TrialCache],
+    ) -> None:
+        if budget is not None:
+            budget.start()
+        self._preprocessing_cache = PreprocessingCache() if cache_preprocessing else None
+        self._set_trial_cache(trial_cache, X, y, scoring)
+        self._search_results.reserve(len(self._search_results) + max(n_iter, 0))
+        self.early_stopping.reset()
+        grid_states = deque()
+        trials = self.__draw_trials(
+            n_iter,
+            list(self.split_plan),
+            scoring,
+            budget,
+            grid_states if search_checkpoint is not None else None,
+        )
+        evaluated_trials = self._evaluate_trials(
+            trials, X, y, scoring, n_jobs=n_jobs, backend=backend
+        )
+        try:
+            for i, (hpo, scores, fit_times, predict_times) in enumerate(evaluated_trials):
+                results = {
+                    "scores": scores,
+                    "hpo": hpo,
+                    "mean_score": np.mean(scores),
+                    "std_score": np.std(scores),
+                    "fit_time": np.sum(fit_times),
+                    "predict_time": np.sum(predict_times),
+                }
+                for name, value in results.items():
+                    self._search_results.add(name, value)
+                if search_checkpoint is not None:
+                    search_checkpoint.add_trial(results, grid_states.popleft())
+
+                if budget is not None:
+                    budget.finish_trial(results["fit_time"] + results["predict_time"])
+                    if budget.is_exhausted():
+                        warnings.warn(
+                            f"Searching ended after {i+1} iteration due to budget."
+                        )
+                        evaluated_trials.close()
+                        break
+
+                is_stop = self.early_stopping.is_stop(self.search_results)
+                if is_stop:
+                    warnings.warn(
+                        f"Searching ended after {i+1} iteration due to early stopping."
+                    )
+                    evaluated_trials.close()
+                    break
+        finally:
+            if search_checkpoint is not None:
+                search_checkpoint.flush()
+
+    def __draw_trials(
+        self,
+        n_iter: int,
+        folds: List[Tuple[np.ndarray, np.ndarray]],
+        scoring: Callable[..., float],
+        budget: Optional[SearchBudget] = None,
+        grid_states: Optional[deque] = None,
+    ) -> Generator[Tuple[Dict[str, any], List[Tuple[np.ndarray, np.ndarray]]], None, None]:
+        for _ in range(n_iter):
+            if budget is None:
+                hpo = self.random_grid.pick()
+            elif self._trial_cache is None:
+                if not budget.can_start(len(folds)):
+                    return
+                budget.start_trial(len(folds))
+                hpo = self.random_grid.pick()
+            else:
+                # folds read from trial cache are not fitted, so they are not counted
+                hpo = self.random_grid.pick()
+                n_fits = self._count_fits(hpo, folds, scoring)
+                if not budget.can_start(n_fits):
+                    return
+                budget.start_trial(n_fits)
+            if grid_states is not None:
+                grid_states.append(self.random_grid.get_state())
+            yield hpo, folds
+
+
+class SuccessiveHalvingSearch(GenericHPOSearch):
+    """
+    Implementation of successive halving. All configurations are evaluated
+    with small budget (number of folds or fraction of training data) and
+    only the best 1/eta of them are evaluated with eta times bigger budget,
+    until full budget is reached. Every evaluation is stored in `search results`
+    with its budget (fraction of full budget) in "budget" column and time of
+    fits made for it in "fit_time" and "predict_time". Early stopping is
+    checked after each budget (rung), on results of all evaluations so far.
+    """
+
+    def __init__(
+        self,
+        model: any,
+        random_grid: RandomGrid,
+        early_stopping: Optional[GenericEarlyStopping] = None,
+        model_init: str = "deepcopy",
+    ) -> None:
+        """
+        Args:
+            model (any): model to evaluate, or callable returning new model
+                if `model_init` is "factory".
+            random_grid (RandomGrid): grid from which hyperparameters are picked.
+            early_stopping (Optional[GenericEarlyStopping], optional): early
+                stopping criterion, checked after each rung. Defaults to None.
+            model_init (str, optional): How new model is created for each fold.
+                Valid values: ("deepcopy", "clone", "factory"). "clone" uses
+                sklearn's `clone`, which copies only unfitted parameters of
+                estimator, "factory" calls `model()`. Defaults to "deepcopy".
+        """
+        super().__init__(model, random_grid, early_stopping, model_init)
+
+    def search(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        n_iter: int = 81,
+        cv: int = 5,
+        encode_y: bool = False,
+        lowest_best: bool = False,
+        eta: int = 3,
+        min_budget: float = None,
+        resource: str = "folds",
+        n_jobs: int = 1,
+        backend: str = "process",
+        split_plan: Optional[CVSplitPlan] = None,
+        stratify: bool = False,
+    ) -> None:
+        """
+        Evaluate model on provided data with randomly selected
+        hyperparameters, discarding the worst ones after each budget.
+
+        Args:
+            X (pd.DataFrame): dataframe with features.
+            y (pd.DataFrame): dataframe with target.
+            scoring (Callable[..., float]): scoring function. Should take
+                array of y_hat, y as input and return single value.
+            n_iter (int, optional): Number of configurations evaluated with
+                the smallest budget. Defaults to 81.
+            cv (int, optional): Number of cross validaiton folds. Defaults to 5.
+            encode_y (bool, optional): if set as true, y will be hot-one
+                encoded before all operations. Defaults to False.
+            lowest_best (bool, optional): If True, configurations with the
+                lowest scores are kept. Defaults to False.
+            eta (int, optional): Budget multiplier and inverse of fraction
+                of configurations kept after each budget. Defaults to 3.
+            min_budget (float, optional): The smallest budget as fraction of full
+                budget. Defaults to one fold for "folds" resource and to the
+                smallest budget that leaves one configuration for "samples".
+            resource (str, optional): What is limited by budget. Valid values:
+                ("folds", "samples"). "folds" evaluates only part of folds and
+                reuses their scores for bigger budgets, "samples" fits model on
+                part of training data of every fold. Defaults to "folds".
+            n_jobs (int, optional): Number of workers. If -1, all processors
+                are used. Defaults to 1.
+            backend (str, optional): Type of pool used if `n_jobs` is not 1.
+                Valid values: ("process", "thread"). Defaults to "process".
+            split_plan (CVSplitPlan, optional): Folds used by every configuration.
+                If None, plan with `cv` folds is created. Defaults to None.
+            stratify (bool, optional): If True and plan is not provided, folds
+                are stratified by y. Defaults to False.
+        """
+        self.split_plan = super()._get_split_plan(X, y, cv, split_plan, stratify)
+        if encode_y:
+            y = super()._encode_y(y)
+        budgets = self._get_budgets(n_iter, len(self.split_plan), eta, min_budget, resource)
+        hpos = [self.random_grid.pick() for _ in range(n_iter)]
+        self.early_stopping.reset()
+
+        self._successive_halving(
+            X, y, scoring, hpos, budgets, lowest_best, eta, resource, n_jobs, backend
+        )
+
+    def _get_budgets(
+        self,
+        n_configs: int | None,
+        cv: int,
+        eta: int,
+        min_budget: float | None,
+        resource: str,
+    ) -> List[float]:
+        """
+        Budgets of consecutive rungs, from `min_budget` to 1. If `n_configs` is
+        provided, only the last rungs which leave at least one of `n_configs`
+        configurations are returned.
+        """
+        if resource not in ("folds", "samples"):
+            raise ValueError(
+                f'For arg "resource" only "folds", "samples" are allowed. {resource} provided'
+            )
+        max_rungs = None
+        if n_configs is not None:
+            max_rungs = int(np.floor(np.log(n_configs) / np.log(eta) + 1e-9)) + 1
+
+        if min_budget is None:
+            min_budget = 1 / cv if resource == "folds" else eta ** (1 - max_rungs)
+        if not 0 < min_budget <= 1:
+            raise ValueError(f'Arg "min_budget" should be in (0, 1]. {min_budget} provided')
+
+        n_rungs = int(np.floor(np.log(1 / min_budget) / np.log(eta) + 1e-9)) + 1
+        budgets = [min_budget * eta**i for i in range(n_rungs - 1)] + [1.0]
+
+        return budgets if max_rungs is None else budgets[-max_rungs:]
+
+    def _successive_halving(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        hpos: List[Dict[str, any]],
+        budgets: List[float],
+        lowest_best: bool,
+        eta: int,
+        resource: str,
+        n_jobs: int,
+        backend: str,
+    ) -> bool:
+        """
+        Returns:
+            bool: True if search was stopped by early stopping.
+        """
+        folds = list(self.split_plan)
+        subsample_orders = [np.random.permutation(fold[0].shape[0]) for fold in folds]
+        trials = [(hpo, []) for hpo in hpos]
+
+        for budget in budgets:
+            if resource == "folds":
+                n_folds = max(1, int(round(budget * len(folds))))
+                rung_trials = [(hpo, folds[len(scores) : n_folds]) for hpo, scores in trials]
+            else:
+                rung_folds = [
+                    self.__subsample_fold(fold, order, budget)
+                    for fold, order in zip(folds, subsample_orders)
+                ]
+                rung_trials = [(hpo, rung_folds) for hpo, _ in trials]
+
+            evaluated_trials = self._evaluate_trials(
+                rung_trials, X, y, scoring, n_jobs=n_jobs, backend=backend
+            )
+            for (hpo, scores), (_, new_scores, fit_times, predict_times) in zip(
+                trials, evaluated_trials
+            ):
+                if resource == "samples":
+                    scores.clear()
+                scores.extend(new_scores)
+
+                self._search_results.add("scores", list(scores))
+                self._search_results.add("hpo", hpo)
+                self._search_results.add("mean_score", np.mean(scores))
+                self._search_results.add("std_score", np.std(scores))
+                self._search_results.add("fit_time", np.sum(fit_times))
+                self._search_results.add("predict_time", np.sum(predict_times))
+                self._search_results.add("budget", budget)
+
+            if self.early_stopping.is_stop(self.search_results):
                 warnings.warn(
-                    f"Searching ended after {i+1} iteration due to early stopping."
+                    f"Searching ended after budget {budget:.3g} due to early stopping."
                 )
+                return True
+
+            n_kept = max(1, len(trials) // eta)
+            order = np.argsort([np.mean(scores) for _, scores in trials], kind="stable")
+            if not lowest_best:
+                order = order[::-1]
+            trials = [trials[i] for i in sorted(order[:n_kept])]
+
+        return False
+
+    def __subsample_fold(
+        self, fold: Tuple[np.ndarray, np.ndarray], order: np.ndarray, budget: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        n_samples = max(1, int(round(budget * fold[0].shape[0])))
+        return np.sort(fold[0][order[:n_samples]]), fold[1]
+
+
+class HyperbandSearch(SuccessiveHalvingSearch):
+    """
+    Implementation of Hyperband. Runs successive halving in brackets which
+    start from different budgets, from many configurations with the smallest
+    budget to few configurations with full budget.
+    """
+
+    def search(
+        self,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        scoring: Callable[..., float],
+        cv: int = 5,
+        encode_y: bool = False,
+        lowest_best: bool = False,
+        eta: int = 3,
+        min_budget: float = None,
+        resource: str = "folds",
+        n_jobs: int = 1,
+        backend: str = "process",
+        split_plan: Optional[CVSplitPlan] = None,
+        stratify: bool = False,
+    ) -> None:
+        """
+        Evaluate model on provided data with randomly selected
+        hyperparameters in all Hyperband brackets.
+
+        Args:
+            X (pd.DataFrame): dataframe with features.
+            y (pd.DataFrame): dataframe with target.
+            scoring (Callable[..., float]): scoring function. Should take
+                array of y_hat, y as input and return single value.
+            cv (int, optional): Number of cross validaiton folds. Defaults to 5.
+            encode_y (bool, optional): if set as true, y will be hot-one
+                encoded before all operations. Defaults to False.
+            lowest_best (bool, optional): If True, configurations with the
+                lowest scores are kept. Defaults to False.
+            eta (int, optional): Budget multiplier and inverse of fraction
+                of configurations kept after each budget. Defaults to 3.
+            min_budget (float, optional): The smallest budget as fraction of full
+                budget. It determines the number of brackets, one per rung of
+                budgets from `min_budget` to full budget. Defaults to one fold
+                for "folds" resource and to 1/eta^3 for "samples".
+            resource (str, optional): What is limited by budget. Valid values:
+                ("folds", "samples"). Defaults to "folds".
+            n_jobs (int, optional): Number of workers. If -1, all processors
+                are used. Defaults to 1.
+            backend (str, optional): Type of pool used if `n_jobs` is not 1.
+                Valid values: ("process", "thread"). Defaults to "process".
+            split_plan (CVSplitPlan, optional): Folds used by every configuration.
+                If None, plan with `cv` folds is created. Defaults to None.
+            stratify (bool, optional): If True and plan is not provided, folds
+                are stratified by y. Defaults to False.
+        """
+        self.split_plan = super()._get_split_plan(X, y, cv, split_plan, stratify)
+        if encode_y:
+            y = super()._encode_y(y)
+        if min_budget is None and resource == "samples":
+            min_budget = eta**-3
+        all_budgets = self._get_budgets(
+            None, len(self.split_plan), eta, min_budget, resource
+        )
+        s_max = len(all_budgets) - 1
+        self.early_stopping.reset()
+
+        for s in range(s_max, -1, -1):
+            n_configs = int(np.ceil((s_max + 1) / (s + 1) * eta**s))
+            hpos = [self.random_grid.pick() for _ in range(n_configs)]
+
+            is_stop = self._successive_halving(
+                X,
+                y,
+                scoring,
+                hpos,
+                all_budgets[s_max - s :],
+                lowest_best,
+                eta,
+                resource,
+                n_jobs,
+                backend,
+            )
+            if is_stop:
                 break
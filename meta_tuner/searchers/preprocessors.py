@@ -1,5 +1,8 @@
 import numpy as np
+import pandas as pd
+import hashlib
 
+from typing import Dict, Tuple
 from sklearn.pipeline import Pipeline
 from sklearn.compose import make_column_transformer, make_column_selector
 from sklearn.impute import SimpleImputer
@@ -36,8 +39,74 @@ def get_generic_preprocessing() -> Pipeline:
     return pipeline
 
 
-def wrap_model_with_preprocessing(
-    model: any, preprocessing: Pipeline = get_generic_preprocessing()
-) -> Pipeline:
+def wrap_model_with_preprocessing(model: any, preprocessing: Pipeline = None) -> Pipeline:
+    preprocessing = preprocessing if preprocessing is not None else get_generic_preprocessing()
     pipeline = Pipeline([("preprocessing", preprocessing), ("model", model)])
     return pipeline
+
+
+class PreprocessingCache:
+    """
+    Cache of preprocessing fitted on folds. Preprocessing is fitted once
+    per (dataset, fold) and transformed train and test matrices are reused
+    by every trial which differs only in hyperparameters of the final model.
+    """
+
+    def __init__(self) -> None:
+        self.__cache: Dict[Tuple, Tuple[Pipeline, np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__cache)
+
+    @staticmethod
+    def is_cacheable(model: any, hpo: Dict[str, any]) -> bool:
+        """
+        Check if preprocessing of model does not depend on hyperparameters.
+
+        Args:
+            model (any): model with already set hyperparameters.
+            hpo (Dict[str, any]): hyperparameters of the model.
+
+        Returns:
+            bool: True if model is a pipeline with preprocessing steps
+                and none of hyperparameters refers to them.
+        """
+        if not isinstance(model, Pipeline) or len(model.steps) < 2:
+            return False
+        preprocessing_steps = {name for name, _ in model.steps[:-1]}
+        return not any(key.split("__")[0] in preprocessing_steps for key in hpo)
+
+    def fit_transform(
+        self,
+        preprocessing: Pipeline,
+        X: pd.DataFrame,
+        y: pd.DataFrame,
+        train_idx: np.ndarray,
+        test_idx: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return train and test features transformed by preprocessing fitted
+        on train part of the fold. Preprocessing is fitted only if given
+        dataset and fold are not in cache yet.
+
+        Args:
+            preprocessing (Pipeline): unfitted preprocessing.
+            X (pd.DataFrame): dataframe with features.
+            y (pd.DataFrame): dataframe with target.
+            train_idx (np.ndarray): positions of train rows.
+            test_idx (np.ndarray): positions of test rows.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: transformed train and test features.
+        """
+        key = (id(X), X.shape, self.__digest(train_idx), self.__digest(test_idx))
+        if key not in self.__cache:
+            train_X = preprocessing.fit_transform(X.iloc[train_idx], y.iloc[train_idx])
+            test_X = preprocessing.transform(X.iloc[test_idx])
+            self.__cache[key] = (preprocessing, train_X, test_X)
+
+        _, train_X, test_X = self.__cache[key]
+        return train_X, test_X
+
+    def __digest(self, idx: np.ndarray) -> str:
+        return hashlib.blake2b(np.ascontiguousarray(idx).tobytes()).hexdigest()
@@ -1,8 +1,36 @@
 import numpy as np
+import pandas as pd
+import warnings
 
 from typing import Dict, Tuple, List, Callable
+from copy import deepcopy
 from functools import partial
 from abc import ABC, abstractmethod
+from scipy.stats import qmc
+
+
+def get_hpo_key(hpo: Dict[str, any]) -> Tuple:
+    """
+    Canonical, hashable representation of hyperparameters. Does not
+    depend on order of keys and on type of numbers (python or numpy).
+
+    Args:
+        hpo (Dict[str, any]): hyperparameters.
+
+    Returns:
+        Tuple: pairs (name, value) sorted by name.
+    """
+    key = []
+    for name, value in sorted(hpo.items()):
+        if isinstance(value, np.generic):
+            value = value.item()
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append((name, value))
+
+    return tuple(key)
 
 
 class RandomGrid(ABC):
@@ -10,6 +38,27 @@ class RandomGrid(ABC):
     def pick() -> Dict[str, any]:
         ...
 
+    def get_state(self) -> Dict[str, any]:
+        """
+        Snapshot of random state, which allows to continue picking
+        from the same point with `set_state`.
+
+        Returns:
+            Dict[str, any]: picklable state of grid.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support saving its state."
+        )
+
+    def set_state(self, state: Dict[str, any]) -> None:
+        """
+        Args:
+            state (Dict[str, any]): state returned by `get_state`.
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support restoring its state."
+        )
+
 
 class CubeGrid(RandomGrid):
     """
@@ -27,6 +76,7 @@ class CubeGrid(RandomGrid):
 
         self.names: List[str] = []
         self.rngs: List[Callable[..., np.ndarray]] = []
+        self.batch_rngs: List[Callable[..., np.ndarray]] = []
         self.rng = np.random.default_rng(self.init_seed)
 
     def add(
@@ -50,25 +100,41 @@ class CubeGrid(RandomGrid):
         """
 
         rng_len = len(self.rngs)
+        lognuniform = self.__lognuniform
 
         if space == "real":
             if isinstance(values, int):
-                self.rngs.append(lambda: values)
+                self.rngs.append(lambda rng: values)
+                self.batch_rngs.append(lambda rng, n: np.full(n, values))
             if isinstance(values, list):
                 if distribution == "uniform":
-                    self.rngs.append(lambda: self.rng.uniform(values[0], values[1]))
+                    self.rngs.append(lambda rng: rng.uniform(values[0], values[1]))
+                    self.batch_rngs.append(
+                        lambda rng, n: rng.uniform(values[0], values[1], size=n)
+                    )
                 elif distribution == "loguniform":
-                    self.rngs.append(lambda: self.__lognuniform(values[0], values[1]))
+                    self.rngs.append(lambda rng: lognuniform(rng, values[0], values[1]))
+                    self.batch_rngs.append(
+                        lambda rng, n: lognuniform(rng, values[0], values[1], size=n)
+                    )
         elif space == "int":
             if isinstance(values, int):
-                self.rngs.append(lambda: values)
+                self.rngs.append(lambda rng: values)
+                self.batch_rngs.append(lambda rng, n: np.full(n, values))
             if isinstance(values, list):
-                self.rngs.append(lambda: self.rng.integers(values[0], values[1] + 1))
+                self.rngs.append(lambda rng: rng.integers(values[0], values[1] + 1))
+                self.batch_rngs.append(
+                    lambda rng, n: rng.integers(values[0], values[1] + 1, size=n)
+                )
         elif space == "cat":
             if isinstance(values, str):
-                self.rngs.append(lambda: values)
+                self.rngs.append(lambda rng: values)
+                self.batch_rngs.append(lambda rng, n: np.full(n, values, dtype=object))
             if isinstance(values, (list, tuple)):
-                self.rngs.append(lambda: self.rng.choice(values, replace=True))
+                self.rngs.append(lambda rng: rng.choice(values, replace=True))
+                self.batch_rngs.append(
+                    lambda rng, n: rng.choice(np.array(values, dtype=object), size=n)
+                )
         else:
             raise ValueError(
                 f'For arg "values" only "real", "int", "cat" are allowed. {values} provided'
@@ -86,15 +152,33 @@ class CubeGrid(RandomGrid):
         Returns:
             Dict[str, any]: List of points from grid.
         """
-        random_coordinates = [rng() for rng in self.rngs]
+        random_coordinates = [rng(self.rng) for rng in self.rngs]
         dict_coordinates = {
             name: coordinates
             for name, coordinates in zip(self.names, random_coordinates)
         }
         return dict_coordinates
 
-    def __lognuniform(self, low=0, high=1, base=np.e):
-        rng_ = partial(self.rng.uniform, low=0, high=1)
+    def pick_batch(self, n: int) -> pd.DataFrame:
+        """
+        Generate n random points from the grid. Values of each
+        dimension are drawn with a single numpy call.
+
+        Args:
+            n (int): number of points.
+
+        Returns:
+            pd.DataFrame: points from grid, one row per point and
+                one column per dimension.
+        """
+        return pd.DataFrame(
+            {name: rng(self.rng, n) for name, rng in zip(self.names, self.batch_rngs)},
+            index=range(n),
+        )
+
+    @staticmethod
+    def __lognuniform(rng, low=0, high=1, base=np.e, size=None):
+        rng_ = partial(rng.uniform, low=0, high=1, size=size)
         range_ = high - low
 
         return (np.power(base, rng_()) - 1) / (base - 1) * range_ + low
@@ -103,6 +187,153 @@ class CubeGrid(RandomGrid):
         new_seed = seed if seed is not None else self.init_seed
         self.rng = np.random.default_rng(new_seed)
 
+    def get_state(self) -> Dict[str, any]:
+        return {"rng": deepcopy(self.rng.bit_generator.state)}
+
+    def set_state(self, state: Dict[str, any]) -> None:
+        self.rng.bit_generator.state = state["rng"]
+
+
+class QuasiRandomGrid(CubeGrid):
+    """
+    Interface to generate points from cube with low-discrepancy
+    (quasi-random) sequences, which cover the cube more evenly
+    than random points. Single picks are served from blocks of
+    points, so e.g. each block of Latin hypercube is stratified.
+    """
+
+    samplers = {
+        "sobol": partial(qmc.Sobol, scramble=True),
+        "halton": partial(qmc.Halton, scramble=True),
+        "lhs": qmc.LatinHypercube,
+    }
+
+    def __init__(
+        self, init_seed: int = None, sampler: str = "sobol", block_size: int = 128
+    ) -> None:
+        """
+        Args:
+            init_seed (int, optional): Random seed used to scramble
+                the sequence. Defaults to None.
+            sampler (str, optional): Type of sequence. Valid values:
+                ("sobol", "halton", "lhs"). Defaults to "sobol".
+            block_size (int, optional): Number of points generated at once
+                for single picks. For "sobol" power of 2 is recommended.
+                Defaults to 128.
+        """
+        if sampler not in self.samplers:
+            raise ValueError(
+                f'For arg "sampler" only {tuple(self.samplers)} are allowed. {sampler} provided'
+            )
+        super().__init__(init_seed)
+        self.sampler = sampler
+        self.block_size = block_size
+
+        self.transforms: List[Callable[..., np.ndarray]] = []
+        self.engine: qmc.QMCEngine = None
+        self.buffer: np.ndarray = None
+
+    def add(
+        self,
+        name: str,
+        values: int | str | Tuple[int | str],
+        space: str = None,
+        distribution: str = "uniform",
+    ) -> None:
+        """
+        Add new dimension to cube. Arguments are the same as in CubeGrid.
+        Each dimension is mapped from one coordinate of unit cube.
+        """
+        super().add(name, values, space, distribution)
+
+        if isinstance(values, (int, str)):
+            dtype = object if isinstance(values, str) else None
+            self.transforms.append(lambda u: np.full(u.shape[0], values, dtype=dtype))
+        elif space == "real" and distribution == "uniform":
+            self.transforms.append(lambda u: values[0] + u * (values[1] - values[0]))
+        elif space == "real" and distribution == "loguniform":
+            self.transforms.append(
+                lambda u: (np.exp(u) - 1) / (np.e - 1) * (values[1] - values[0])
+                + values[0]
+            )
+        elif space == "int":
+            self.transforms.append(
+                lambda u: np.minimum(
+                    values[0] + np.floor(u * (values[1] - values[0] + 1)), values[1]
+                ).astype(np.int64)
+            )
+        elif space == "cat":
+            self.transforms.append(
+                lambda u: np.array(values, dtype=object)[
+                    np.minimum(np.floor(u * len(values)), len(values) - 1).astype(int)
+                ]
+            )
+
+        self.engine = None
+
+    def pick(self) -> Dict[str, any]:
+        """
+        Generate next point of the sequence.
+
+        Returns:
+            Dict[str, any]: List of points from grid.
+        """
+        if self.engine is None or self.buffer.shape[0] == 0:
+            self.buffer = self.__get_engine().random(self.block_size)
+        point, self.buffer = self.buffer[:1], self.buffer[1:]
+
+        return {
+            name: transform(point[:, i])[0]
+            for i, (name, transform) in enumerate(zip(self.names, self.transforms))
+        }
+
+    def pick_batch(self, n: int) -> pd.DataFrame:
+        """
+        Generate next n points of the sequence.
+
+        Args:
+            n (int): number of points.
+
+        Returns:
+            pd.DataFrame: points from grid, one row per point and
+                one column per dimension.
+        """
+        engine = self.__get_engine()
+        points, self.buffer = self.buffer[:n], self.buffer[n:]
+        if points.shape[0] < n:
+            points = np.concatenate([points, engine.random(n - points.shape[0])])
+
+        return pd.DataFrame(
+            {
+                name: transform(points[:, i])
+                for i, (name, transform) in enumerate(zip(self.names, self.transforms))
+            },
+            index=range(n),
+        )
+
+    def reset_seed(self, seed: int = None) -> None:
+        super().reset_seed(seed)
+        self.engine = None
+
+    def get_state(self) -> Dict[str, any]:
+        rng, engine = deepcopy((self.rng, self.engine))
+        buffer = None if self.buffer is None else self.buffer.copy()
+
+        return {"rng": rng, "engine": engine, "buffer": buffer}
+
+    def set_state(self, state: Dict[str, any]) -> None:
+        self.rng, self.engine = deepcopy((state["rng"], state["engine"]))
+        self.buffer = None if state["buffer"] is None else state["buffer"].copy()
+
+    def __get_engine(self) -> qmc.QMCEngine:
+        if self.engine is None:
+            # scipy reseeds from OS entropy when given copied (or unpickled)
+            # Generator, so engine gets integer seed drawn from the grid
+            seed = int(self.rng.integers(np.iinfo(np.int64).max))
+            self.engine = self.samplers[self.sampler](d=len(self.names), seed=seed)
+            self.buffer = np.empty((0, len(self.names)))
+        return self.engine
+
 
 class ConditionalGrid(RandomGrid):
     """
@@ -136,11 +367,10 @@ class ConditionalGrid(RandomGrid):
                 multiple cubes that meet their conditions, param from latest cube will
                 be returned. Defaults to lambda_:True.
         """
-        if self.init_seed:
-            cube_ = cube
-            cube_.init_seed = self.init_seed
-            cube_.reset_seed()
-        self.cubes.append(cube_)
+        if self.init_seed is not None:
+            cube.init_seed = self.init_seed
+            cube.reset_seed()
+        self.cubes.append(cube)
         self.conditions.append(condition)
 
     def pick(self) -> Dict[str, any]:
@@ -163,7 +393,175 @@ class ConditionalGrid(RandomGrid):
 
         return pick
 
+    def pick_batch(self, n: int) -> pd.DataFrame:
+        """
+        Generate n random points from the conditional grid. Conditions
+        are evaluated once on the whole batch, so they should work on
+        dataframe as well as on dictionary (e.g. `hpo["a"] == "b"`).
+        Conditions that cannot be evaluated on dataframe or which do not
+        return one value per row (e.g. `"a" in hpo`) are evaluated row by row.
+
+        Args:
+            n (int): number of points.
+
+        Returns:
+            pd.DataFrame: points from grid, one row per point. Parameters
+                which were not picked for given point are missing (NaN/None).
+        """
+        pick = pd.DataFrame(index=range(n))
+
+        for cube, condition in zip(self.cubes, self.conditions):
+            try:
+                mask = self.__evaluate_condition(condition, pick)
+            except KeyError as e:
+                raise KeyError(
+                    f'In condition, key "{e.args[0]}" was used but not present in previous cubes.'
+                )
+            if not mask.any():
+                continue
+
+            cube_pick = cube.pick_batch(int(mask.sum()))
+            for name, values in cube_pick.items():
+                if mask.all():
+                    pick[name] = values.to_numpy()
+                else:
+                    column = (
+                        pick[name].astype(object)
+                        if name in pick.columns
+                        else pd.Series(None, index=pick.index, dtype=object)
+                    )
+                    column[mask] = values.to_numpy()
+                    pick[name] = column.infer_objects()
+
+        return pick
+
+    def __evaluate_condition(
+        self, condition: Callable[..., bool], pick: pd.DataFrame
+    ) -> np.ndarray:
+        n = pick.shape[0]
+        try:
+            mask = np.asarray(condition(pick), dtype=bool)
+            # scalar result (e.g. `"a" in hpo`) does not describe single rows
+            if mask.shape == (n,):
+                return mask
+        except (ValueError, TypeError):
+            pass
+
+        # records of frame without columns are empty
+        rows = pick.to_dict("records") if pick.shape[1] else [{}] * n
+        return np.array(
+            [
+                condition({key: value for key, value in row.items() if not pd.isna(value)})
+                for row in rows
+            ],
+            dtype=bool,
+        )
+
     def reset_seed(self, seed: int = None) -> None:
         new_seed = seed if seed is not None else self.init_seed
         for cube in self.cubes:
             cube.reset_seed(new_seed)
+
+    def get_state(self) -> Dict[str, any]:
+        return {"cubes": [cube.get_state() for cube in self.cubes]}
+
+    def set_state(self, state: Dict[str, any]) -> None:
+        for cube, cube_state in zip(self.cubes, state["cubes"], strict=True):
+            cube.set_state(cube_state)
+
+
+class FixedGrid(RandomGrid):
+    """
+    Interface to return configurations from fixed list, in
+    order of the list. Allows to evaluate the same configurations
+    on many datasets (common random numbers).
+    """
+
+    def __init__(self, configurations: List[Dict[str, any]]) -> None:
+        """
+        Args:
+            configurations (List[Dict[str, any]]): configurations returned
+                by consecutive picks.
+        """
+        self.configurations = configurations
+        self.position = 0
+
+    @classmethod
+    def from_grid(
+        cls, grid: RandomGrid, n: int, deduplicate: bool = True
+    ) -> "FixedGrid":
+        """
+        Sample fixed batch of configurations from other grid.
+
+        Args:
+            grid (RandomGrid): grid from which configurations are picked.
+            n (int): number of configurations.
+            deduplicate (bool, optional): If True, repeated configurations are
+                skipped and picking is continued. For small discrete grids fewer
+                than n configurations may be returned. Defaults to True.
+
+        Returns:
+            FixedGrid: grid with sampled configurations.
+        """
+        if not deduplicate:
+            return cls([grid.pick() for _ in range(n)])
+
+        configurations = {}
+        for _ in range(10 * n):
+            hpo = grid.pick()
+            configurations.setdefault(get_hpo_key(hpo), hpo)
+            if len(configurations) == n:
+                break
+        else:
+            warnings.warn(
+                f"Only {len(configurations)} distinct configurations out of {n} were sampled."
+            )
+
+        return cls(list(configurations.values()))
+
+    def __len__(self) -> int:
+        return len(self.configurations)
+
+    def pick(self) -> Dict[str, any]:
+        """
+        Return next configuration from the list.
+
+        Returns:
+            Dict[str, any]: configuration.
+        """
+        if self.position >= len(self.configurations):
+            raise IndexError(
+                f"All {len(self.configurations)} configurations were already picked."
+            )
+        hpo = self.configurations[self.position]
+        self.position += 1
+
+        return hpo
+
+    def pick_batch(self, n: int) -> pd.DataFrame:
+        """
+        Return next n configurations from the list.
+
+        Args:
+            n (int): number of configurations.
+
+        Returns:
+            pd.DataFrame: configurations, one row per configuration.
+        """
+        if self.position + n > len(self.configurations):
+            raise IndexError(
+                f"Only {len(self.configurations) - self.position} configurations left to pick."
+            )
+        configurations = self.configurations[self.position : self.position + n]
+        self.position += n
+
+        return pd.DataFrame(configurations, index=range(n))
+
+    def reset_seed(self, seed: int = None) -> None:
+        self.position = 0
+
+    def get_state(self) -> Dict[str, any]:
+        return {"position": self.position}
+
+    def set_state(self, state: Dict[str, any]) -> None:
+        self.position = state["position"]
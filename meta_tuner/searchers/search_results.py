@@ -1,15 +1,262 @@
-from typing import Dict, List
+import numpy as np
+import pandas as pd
+
+from collections.abc import Mapping
+from typing import Dict, List, Iterator
+
+
+def _get_dtype(value: any) -> np.dtype:
+    if np.ndim(value) == 0:
+        dtype = np.asarray(value).dtype
+        if dtype.kind in "biuf":
+            return dtype
+    return np.dtype(object)
+
+
+def _merge_dtypes(dtype_1: np.dtype, dtype_2: np.dtype) -> np.dtype:
+    # e.g. int and float are promoted to float64
+    if dtype_1.kind in "biuf" and dtype_2.kind in "biuf":
+        return np.result_type(dtype_1, dtype_2)
+    return np.dtype(object)
+
+
+class _ScalarColumn:
+    """
+    Column of scalar values stored in growing numpy array with
+    amortized O(1) append. Numeric values are stored with their
+    numpy dtype, other values as objects.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.data: np.ndarray = None
+        self.size = 0
+        self.capacity = capacity
+
+    def append(self, value: any) -> None:
+        dtype = _get_dtype(value)
+        if self.data is None:
+            self.data = np.empty(self.capacity, dtype=dtype)
+        elif dtype != self.data.dtype:
+            self.data = self.data.astype(_merge_dtypes(self.data.dtype, dtype))
+
+        self.reserve(self.size + 1)
+        self.data[self.size] = value
+        self.size += 1
+
+    def reserve(self, n: int) -> None:
+        self.capacity = max(self.capacity, n)
+        if self.data is not None and self.data.shape[0] < n:
+            data = np.empty(max(n, 2 * self.data.shape[0]), dtype=self.data.dtype)
+            data[: self.size] = self.data[: self.size]
+            self.data = data
+
+    def to_numpy(self) -> np.ndarray:
+        if self.data is None:
+            return np.empty(0)
+        return self.data[: self.size]
+
+    def view(self) -> np.ndarray:
+        return self.to_numpy()
+
+
+class _VectorColumn:
+    """
+    Column of float vectors (e.g. scores on folds) stored in growing
+    2D float64 array. Shorter vectors are padded with NaN.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.data = np.full((capacity, 0), np.nan)
+        self.lengths = _ScalarColumn(capacity)
+        self.size = 0
+        self.__rows: List[np.ndarray] = []
+
+    def append(self, value: any) -> None:
+        value = np.asarray(value, dtype=np.float64).ravel()
+        self.reserve(self.size + 1, value.shape[0])
+        self.data[self.size, : value.shape[0]] = value
+        self.lengths.append(value.shape[0])
+        self.size += 1
+
+    def reserve(self, n: int, width: int = 0) -> None:
+        capacity, width_ = self.data.shape
+        if capacity < n or width_ < width:
+            data = np.full(
+                (max(n, 2 * capacity) if capacity < n else capacity, max(width, width_)),
+                np.nan,
+            )
+            data[: self.size, :width_] = self.data[: self.size]
+            self.data = data
+        self.lengths.reserve(n)
+
+    def to_numpy(self) -> np.ndarray:
+        return self.data[: self.size]
+
+    def view(self) -> List[np.ndarray]:
+        lengths = self.lengths.to_numpy()
+        for i in range(len(self.__rows), self.size):
+            self.__rows.append(self.data[i, : lengths[i]])
+        return self.__rows
+
+
+class _RecordColumn:
+    """
+    Column of dictionaries (e.g. hyperparameters) stored as one typed
+    column per key and mask of keys present in each row.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self.columns: Dict[str, _ScalarColumn] = {}
+        self.present: Dict[str, _ScalarColumn] = {}
+        self.size = 0
+        self.capacity = capacity
+        self.__records: List[Dict[str, any]] = []
+
+    def append(self, value: Dict[str, any]) -> None:
+        for name in value:
+            if name not in self.columns:
+                self.columns[name] = _ScalarColumn(self.capacity)
+                self.present[name] = _ScalarColumn(self.capacity)
+                for _ in range(self.size):
+                    self.columns[name].append(value[name])
+                    self.present[name].append(False)
+
+        for name, column in self.columns.items():
+            if name in value:
+                column.append(value[name])
+                self.present[name].append(True)
+            else:
+                column.append(column.to_numpy()[0])
+                self.present[name].append(False)
+        self.size += 1
+
+    def reserve(self, n: int) -> None:
+        self.capacity = max(self.capacity, n)
+        for name in self.columns:
+            self.columns[name].reserve(n)
+            self.present[name].reserve(n)
+
+    def to_numpy(self) -> Dict[str, np.ma.MaskedArray]:
+        return {
+            name: np.ma.masked_array(
+                column.to_numpy(), mask=~self.present[name].to_numpy(), copy=False
+            )
+            for name, column in self.columns.items()
+        }
+
+    def view(self) -> List[Dict[str, any]]:
+        columns = {name: column.to_numpy() for name, column in self.columns.items()}
+        present = {name: column.to_numpy() for name, column in self.present.items()}
+        for i in range(len(self.__records), self.size):
+            self.__records.append(
+                {
+                    name: values[i] if values.dtype == object else values[i].item()
+                    for name, values in columns.items()
+                    if present[name][i]
+                }
+            )
+        return self.__records
+
+
+class _ResultsView(Mapping):
+    """
+    Read-only, dictionary-like view of search results. Numeric columns
+    are returned as numpy arrays, vectors as list of arrays and
+    dictionaries as list of dictionaries.
+    """
+
+    def __init__(self, columns: Dict[str, any]) -> None:
+        self.__columns = columns
+
+    def __getitem__(self, name: str) -> any:
+        return self.__columns[name].view()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__columns)
+
+    def __len__(self) -> int:
+        return len(self.__columns)
 
 
 class _SearchResults:
-    def __init__(self) -> None:
-        self.__results: Dict[str, List] = {}
+    """
+    Columnar storage of search results. Type of column is chosen by the
+    first added value: dictionaries (e.g. "hpo") are stored as typed
+    column per key, lists (e.g. "scores") as 2D float64 array and
+    other values as 1D arrays.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        """
+        Args:
+            capacity (int, optional): Number of rows preallocated for
+                each column. Defaults to 16.
+        """
+        self.capacity = capacity
+        self.__columns: Dict[str, any] = {}
+        self.__view = _ResultsView(self.__columns)
+
+    def __len__(self) -> int:
+        return max((column.size for column in self.__columns.values()), default=0)
 
     def add(self, name: str, value: any) -> None:
-        if self.__results.get(name) is None:
-            self.__results[name] = [value]
-        else:
-            self.__results[name].append(value)
+        if self.__columns.get(name) is None:
+            if isinstance(value, dict):
+                self.__columns[name] = _RecordColumn(self.capacity)
+            elif isinstance(value, (list, tuple, np.ndarray)):
+                self.__columns[name] = _VectorColumn(self.capacity)
+            else:
+                self.__columns[name] = _ScalarColumn(self.capacity)
+        self.__columns[name].append(value)
+
+    def reserve(self, n: int) -> None:
+        """
+        Preallocate memory for n rows in total.
+
+        Args:
+            n (int): number of rows.
+        """
+        self.capacity = max(self.capacity, n)
+        for column in self.__columns.values():
+            column.reserve(n)
 
     def get_results(self) -> Dict[str, any]:
-        return self.__results
+        return self.__view
+
+    def to_numpy(self, name: str) -> np.ndarray | Dict[str, np.ma.MaskedArray]:
+        """
+        Zero-copy access to column.
+
+        Args:
+            name (str): name of column.
+
+        Returns:
+            np.ndarray | Dict[str, np.ma.MaskedArray]: 1D array for scalar columns,
+                2D array (rows padded with NaN) for vectors and masked array
+                for each key for dictionaries.
+        """
+        return self.__columns[name].to_numpy()
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Results as dataframe. Vectors are split into columns with
+        suffix `_{i}`, keys of dictionaries become separate columns.
+        Columns without missing values share memory with results.
+
+        Returns:
+            pd.DataFrame: one row per added row.
+        """
+        frame_columns = {}
+        for name, column in self.__columns.items():
+            if isinstance(column, _VectorColumn):
+                for i, values in enumerate(column.to_numpy().T):
+                    frame_columns[f"{name}_{i}"] = values
+            elif isinstance(column, _RecordColumn):
+                for key, values in column.to_numpy().items():
+                    if values.mask.any():
+                        values = pd.Series(values.data).where(~values.mask)
+                    frame_columns[key] = values.data if np.ma.isMaskedArray(values) else values
+            else:
+                frame_columns[name] = column.to_numpy()
+
+        return pd.DataFrame(frame_columns, copy=False)
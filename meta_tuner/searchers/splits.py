@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+from typing import Generator, Tuple
+
+
+class CVSplitPlan:
+    """
+    Cross-validation folds computed once per dataset from a single
+    permutation of rows. Stored as two compact index arrays: order of
+    rows grouped by test fold and bounds of the folds. Can be reused by
+    every trial, so each configuration is scored on the same splits.
+    """
+
+    def __init__(self, order: np.ndarray, bounds: np.ndarray) -> None:
+        """
+        Args:
+            order (np.ndarray): positions of rows, grouped by test fold.
+            bounds (np.ndarray): start of each test fold in `order`
+                and its total length, i.e. array of size cv + 1.
+        """
+        self.order = order
+        self.bounds = bounds
+
+    @classmethod
+    def create(
+        cls,
+        size: int,
+        cv: int = 5,
+        y: pd.DataFrame | pd.Series | np.ndarray = None,
+        seed: int = None,
+    ) -> "CVSplitPlan":
+        """
+        Args:
+            size (int): number of rows in dataset.
+            cv (int, optional): Number of folds. Defaults to 5.
+            y (pd.DataFrame | pd.Series | np.ndarray, optional): If provided,
+                folds are stratified by its values. Defaults to None.
+            seed (int, optional): Random seed. If None, global numpy random
+                state is used. Defaults to None.
+
+        Returns:
+            CVSplitPlan: plan of folds.
+        """
+        rng = np.random.default_rng(seed) if seed is not None else np.random
+        dtype = np.int32 if size < np.iinfo(np.int32).max else np.int64
+        permutation = rng.permutation(size).astype(dtype)
+
+        if y is not None:
+            labels = pd.factorize(np.asarray(y).reshape(size, -1)[:, 0])[0]
+            permutation = permutation[np.argsort(labels[permutation], kind="stable")]
+
+        fold_of_row = np.arange(size) % cv
+        fold_order = np.argsort(fold_of_row, kind="stable")
+        bounds = np.concatenate([[0], np.cumsum(np.bincount(fold_of_row, minlength=cv))])
+        order = permutation[fold_order]
+        for i in range(cv):
+            order[bounds[i] : bounds[i + 1]].sort()
+
+        return cls(order, bounds)
+
+    def __len__(self) -> int:
+        return len(self.bounds) - 1
+
+    def __getitem__(self, fold: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Args:
+            fold (int): number of fold.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: positions of train and test rows.
+        """
+        fold = range(len(self))[fold]
+        start, end = self.bounds[fold], self.bounds[fold + 1]
+        train = np.concatenate([self.order[:start], self.order[end:]])
+        test = self.order[start:end]
+
+        return train, test
+
+    def __iter__(self) -> Generator[Tuple[np.ndarray, np.ndarray], None, None]:
+        for fold in range(len(self)):
+            yield self[fold]
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save plan as single .npy file.
+
+        Args:
+            path (str | Path): path of file.
+        """
+        np.save(
+            path,
+            np.concatenate([[len(self)], self.bounds, self.order]).astype(np.int64),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path, mmap_mode: str = "r") -> "CVSplitPlan":
+        """
+        Load plan saved with `save`. By default the file is memory-mapped,
+        so worker processes loading the same plan share its pages
+        instead of copying it.
+
+        Args:
+            path (str | Path): path of file.
+            mmap_mode (str, optional): Mode of np.load. If None, plan is read
+                to memory. Defaults to "r".
+
+        Returns:
+            CVSplitPlan: plan of folds.
+        """
+        data = np.load(path, mmap_mode=mmap_mode)
+        cv = int(data[0])
+
+        return cls(data[cv + 2 :], data[1 : cv + 2])
@@ -0,0 +1,182 @@
+import numpy as np
+
+from typing import Dict, List, Callable, Generator, Tuple
+from concurrent.futures import wait, FIRST_COMPLETED
+from itertools import islice
+
+from meta_tuner.data.datasets import PandasDatasets
+from meta_tuner.data.utils import split_target
+from meta_tuner.searchers.search_grid import RandomGrid, FixedGrid
+from meta_tuner.searchers.hpo_searchers import RandomSearch
+from meta_tuner.searchers.utils import fit_and_score
+from meta_tuner.utils import get_executor, resolve_n_jobs
+
+
+class TunabilitySweep:
+    """
+    Runs random search on every dataset from collection. Work is split into
+    (dataset, trial, fold) units which are evaluated by one shared pool of
+    workers. Units of the largest datasets are scheduled first and idle
+    workers take next unit from common queue, so one big dataset does not
+    leave the pool idle at the end of the sweep. One batch of configurations
+    is sampled per run and evaluated on every dataset, so results have the
+    same structure as expected by TunabilityExtractor.
+    """
+
+    def __init__(
+        self, model: any, random_grid: RandomGrid, model_init: str = "deepcopy"
+    ) -> None:
+        """
+        Args:
+            model (any): model to evaluate. Copied for each fold.
+            random_grid (RandomGrid): grid from which hyperparameters are
+                picked. If it is FixedGrid, its configurations are used as they
+                are, otherwise `n_iter` distinct configurations are sampled.
+            model_init (str, optional): How new model is created for each fold.
+                Valid values: ("deepcopy", "clone", "factory"), see RandomSearch.
+                Defaults to "deepcopy".
+        """
+        self.model = model
+        self.model_init = model_init
+        self.random_grid = random_grid
+        self.fixed_grid: FixedGrid = None
+        self.searches: List[RandomSearch] = []
+
+    @property
+    def search_results(self) -> List[Dict[str, List]]:
+        return [search.search_results for search in self.searches]
+
+    def run(
+        self,
+        datasets: PandasDatasets,
+        scoring: Callable[..., float],
+        n_iter: int = 100,
+        cv: int = 5,
+        target: int | str = -1,
+        encode_y: bool = False,
+        n_jobs: int = -1,
+        backend: str = "process",
+        stratify: bool = False,
+        prefetch: int = 1,
+    ) -> List[Dict[str, List]]:
+        """
+        Evaluate model on every dataset from collection.
+
+        Args:
+            datasets (PandasDatasets): collection of datasets. Lazy collections
+                are loaded one dataset at a time, when its units are scheduled.
+            scoring (Callable[..., float]): scoring function. Should take
+                array of y_hat, y as input and return single value.
+            n_iter (int, optional): Number of configurations evaluated on each
+                dataset. Ignored if grid is FixedGrid. Defaults to 100.
+            cv (int, optional): Number of cross validaiton folds. Defaults to 5.
+            target (int | str, optional): position or name of target column.
+                Defaults to -1.
+            encode_y (bool, optional): if set as true, y will be hot-one
+                encoded before all operations. Defaults to False.
+            n_jobs (int, optional): Number of workers. If -1, all processors
+                are used. Defaults to -1.
+            backend (str, optional): Type of pool. Valid values: ("process",
+                "thread"). Defaults to "process".
+            stratify (bool, optional): If True, folds are stratified by target.
+                One plan of folds is used by all configurations of dataset.
+                Defaults to False.
+            prefetch (int, optional): Number of datasets read in background
+                thread ahead of the dataset whose units are scheduled. If 0,
+                datasets are read synchronously. Defaults to 1.
+
+        Returns:
+            List[Dict[str, List]]: search results for each dataset, in order
+                of collection.
+        """
+        if isinstance(self.random_grid, FixedGrid):
+            self.fixed_grid = self.random_grid
+        else:
+            self.fixed_grid = FixedGrid.from_grid(self.random_grid, n_iter)
+        self.searches = [
+            RandomSearch(self.model, self.fixed_grid, model_init=self.model_init)
+            for _ in range(len(datasets))
+        ]
+        self.__scores: Dict[int, np.ndarray] = {}
+        self.__times: Dict[int, np.ndarray] = {}
+        self.__remaining: Dict[int, int] = {}
+
+        order = sorted(
+            range(len(datasets)), key=datasets.get_dataset_size, reverse=True
+        )
+        units = self.__generate_units(
+            datasets, order, cv, target, encode_y, stratify, prefetch
+        )
+
+        if resolve_n_jobs(n_jobs) == 1:
+            for unit, args in units:
+                self.__record(unit, fit_and_score(*args, scoring))
+            return self.search_results
+
+        max_pending = 2 * resolve_n_jobs(n_jobs)
+        with get_executor(backend, n_jobs) as executor:
+            pending = {
+                executor.submit(fit_and_score, *args, scoring): unit
+                for unit, args in islice(units, max_pending)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self.__record(pending.pop(future), future.result())
+                for unit, args in islice(units, max_pending - len(pending)):
+                    pending[executor.submit(fit_and_score, *args, scoring)] = unit
+
+        return self.search_results
+
+    def __generate_units(
+        self,
+        datasets: PandasDatasets,
+        order: List[int],
+        cv: int,
+        target: int | str,
+        encode_y: bool,
+        stratify: bool,
+        prefetch: int,
+    ) -> Generator[Tuple[Tuple[int, int, int], Tuple], None, None]:
+        dfs = datasets.iter_prefetch(prefetch, order)
+        for dataset_idx, df in zip(order, dfs):
+            search = self.searches[dataset_idx]
+            X, y = split_target(df, target)
+            search.split_plan = search._get_split_plan(X, y, cv, None, stratify)
+            folds = list(search.split_plan)
+            if encode_y:
+                y = search._encode_y(y.iloc[:, 0])
+
+            n_trials = len(self.fixed_grid)
+            self.__scores[dataset_idx] = np.empty((n_trials, cv))
+            self.__times[dataset_idx] = np.empty((n_trials, cv, 2))
+            self.__remaining[dataset_idx] = n_trials * cv
+
+            for trial_idx, hpo in enumerate(self.fixed_grid.configurations):
+                for fold_idx, fold in enumerate(folds):
+                    args = search._get_fold_args(hpo, X, y, fold)
+                    yield (dataset_idx, trial_idx, fold_idx), args
+
+    def __record(
+        self, unit: Tuple[int, int, int], result: Tuple[float, float, float]
+    ) -> None:
+        dataset_idx, trial_idx, fold_idx = unit
+        score, fit_time, predict_time = result
+        self.__scores[dataset_idx][trial_idx, fold_idx] = score
+        self.__times[dataset_idx][trial_idx, fold_idx] = fit_time, predict_time
+        self.__remaining[dataset_idx] -= 1
+
+        if self.__remaining[dataset_idx] == 0:
+            search_results = self.searches[dataset_idx]._search_results
+            search_results.reserve(len(self.fixed_grid))
+            scores = self.__scores.pop(dataset_idx)
+            times = self.__times.pop(dataset_idx).sum(axis=1)
+            for hpo, trial_scores, trial_times in zip(
+                self.fixed_grid.configurations, scores, times
+            ):
+                search_results.add("scores", trial_scores.tolist())
+                search_results.add("hpo", hpo)
+                search_results.add("mean_score", np.mean(trial_scores))
+                search_results.add("std_score", np.std(trial_scores))
+                search_results.add("fit_time", trial_times[0])
+                search_results.add("predict_time", trial_times[1])
@@ -0,0 +1,271 @@
+import os
+import sys
+import types
+import pickle
+import hashlib
+import tempfile
+import numpy as np
+import pandas as pd
+
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from meta_tuner.searchers.search_grid import get_hpo_key
+
+
+class TrialCache:
+    """
+    On-disk, content-addressed cache of fold results (score, fit time and
+    predict time). Each result is stored in separate file named by hash of
+    dataset fingerprint, model, hyperparameters, fold indices and scoring
+    function. Scoring function is identified by name or, if it cannot be
+    imported by name (e.g. lambda), by its code, defaults and closure. Files
+    are written to temporary file and atomically renamed, so the cache can
+    be shared by many processes. If the cache exceeds `max_size`, the least
+    recently used files are removed.
+    """
+
+    def __init__(self, directory: str | Path, max_size: Optional[int] = None) -> None:
+        """
+        Args:
+            directory (str | Path): directory of the cache. Created if missing.
+            max_size (Optional[int], optional): Maximal size of the cache in
+                bytes. If None, cache is not limited. Defaults to None.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.size: int = None
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def get_fingerprint(*frames: pd.DataFrame) -> str:
+        """
+        Fast fingerprint of dataset, based on hashes of rows, names and
+        types of columns.
+
+        Args:
+            *frames (pd.DataFrame): parts of dataset, e.g. X and y.
+
+        Returns:
+            str: hex digest.
+        """
+        digest = hashlib.blake2b()
+        for frame in frames:
+            frame = pd.DataFrame(frame)
+            digest.update(repr(list(zip(frame.columns, frame.dtypes))).encode())
+            digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+
+        return digest.hexdigest()
+
+    def get_key(
+        self,
+        fingerprint: str,
+        model: any,
+        hpo: Dict[str, any],
+        fold: Tuple[np.ndarray, np.ndarray],
+        scoring: Callable[..., float],
+    ) -> str:
+        """
+        Args:
+            fingerprint (str): fingerprint of dataset.
+            model (any): model before hyperparameters are set. Its class and
+                parameters (from `get_params`) are part of the key.
+            hpo (Dict[str, any]): hyperparameters.
+            fold (Tuple[np.ndarray, np.ndarray]): train and test positions.
+            scoring (Callable[..., float]): scoring function. It has to be
+                described by `describe_callable`.
+
+        Returns:
+            str: key of fold result.
+        """
+        scoring_description = self.describe_callable(scoring)
+        if scoring_description is None:
+            raise ValueError(
+                f"Scoring function {scoring!r} cannot be identified between runs."
+            )
+        digest = hashlib.blake2b(fingerprint.encode())
+        digest.update(self.__describe_model(model).encode())
+        digest.update(repr(get_hpo_key(hpo)).encode())
+        for idx in fold:
+            digest.update(np.ascontiguousarray(idx, dtype=np.int64).tobytes())
+            digest.update(b"|")
+        digest.update(scoring_description.encode())
+
+        return digest.hexdigest()
+
+    def __contains__(self, key: str) -> bool:
+        return self.__get_path(key).exists()
+
+    def get(self, key: str) -> Optional[Tuple[float, float, float]]:
+        """
+        Args:
+            key (str): key from `get_key`.
+
+        Returns:
+            Optional[Tuple[float, float, float]]: cached result or None.
+        """
+        path = self.__get_path(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        return result
+
+    def put(self, key: str, result: Tuple[float, float, float]) -> None:
+        """
+        Args:
+            key (str): key from `get_key`.
+            result (Tuple[float, float, float]): score, fit time and predict time.
+        """
+        path = self.__get_path(key)
+        path.parent.mkdir(exist_ok=True)
+        try:
+            old_size = path.stat().st_size
+        except FileNotFoundError:
+            old_size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f)
+        os.replace(tmp_path, path)
+
+        if self.max_size is not None:
+            if self.size is None:
+                self.size = self.__get_total_size()
+            else:
+                self.size += path.stat().st_size - old_size
+            if self.size > self.max_size:
+                self.__evict()
+
+    def __evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        self.size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self.size <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self.size -= size
+
+    def __get_total_size(self) -> int:
+        size = 0
+        for path in self.directory.glob("*/*.pkl"):
+            try:
+                size += path.stat().st_size
+            except FileNotFoundError:
+                pass
+        return size
+
+    def __get_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pkl"
+
+    @staticmethod
+    def __describe_model(model: any) -> str:
+        description = f"{type(model).__module__}.{type(model).__qualname__}"
+        if hasattr(model, "get_params"):
+            description += repr(get_hpo_key(model.get_params(deep=True)))
+
+        return description
+
+    @classmethod
+    def describe_callable(cls, func: Callable) -> Optional[str]:
+        """
+        Description of callable which is the same in every run. Functions
+        and classes importable by name are described by name, other functions (e.g.
+        lambdas) by code, defaults and values of closure, partials by function
+        and arguments, other objects by repr. Globals used by function are
+        described only by their names.
+
+        Args:
+            func (Callable): function, e.g. scoring function.
+
+        Returns:
+            Optional[str]: description, or None if callable cannot be described
+                (e.g. its repr contains memory address).
+        """
+        return cls.__describe_value(func, ())
+
+    @classmethod
+    def __describe_value(cls, value: any, seen: Tuple[int, ...]) -> Optional[str]:
+        if id(value) in seen:
+            # recursive function refers to itself in closure
+            return "<recursion>"
+        seen = (*seen, id(value))
+
+        if _is_importable(value):
+            return f"{value.__module__}.{value.__qualname__}"
+        elif isinstance(value, partial):
+            parts = [value.func, value.args, value.keywords]
+        elif isinstance(value, types.MethodType):
+            parts = [value.__func__, value.__self__]
+        elif isinstance(value, types.FunctionType):
+            closure = [_get_cell_contents(cell) for cell in value.__closure__ or ()]
+            parts = [
+                f"{value.__module__}.{value.__qualname__}",
+                value.__code__,
+                value.__defaults__,
+                value.__kwdefaults__,
+                closure,
+            ]
+        elif isinstance(value, types.CodeType):
+            parts = [value.co_code.hex(), value.co_names, value.co_consts]
+        elif isinstance(value, (tuple, list)):
+            parts = list(value)
+        elif isinstance(value, dict):
+            parts = [(repr(key), item) for key, item in sorted(value.items(), key=repr)]
+        elif isinstance(value, np.ndarray):
+            return f"{value.dtype}{value.shape}{hashlib.blake2b(value.tobytes()).hexdigest()}"
+        else:
+            description = repr(value)
+            if " at 0x" in description:
+                return None
+            return f"{type(value).__module__}.{type(value).__qualname__}:{description}"
+
+        descriptions = []
+        for part in parts:
+            description = (
+                part if isinstance(part, str) else cls.__describe_value(part, seen)
+            )
+            if description is None:
+                return None
+            descriptions.append(description)
+
+        return f"{type(value).__name__}({', '.join(descriptions)})"
+
+
+def _is_importable(value: any) -> bool:
+    module = getattr(value, "__module__", None)
+    qualname = getattr(value, "__qualname__", None)
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return False
+
+    target = sys.modules.get(module)
+    for name in qualname.split("."):
+        target = getattr(target, name, None)
+
+    return target is value
+
+
+def _get_cell_contents(cell: types.CellType) -> any:
+    try:
+        return cell.cell_contents
+    except ValueError:
+        # variable of closure was not assigned yet
+        return None
@@ -0,0 +1,39 @@
+import time
+import pandas as pd
+
+from typing import Callable, Tuple
+
+
+def fit_and_score(
+    model: any,
+    train_X: pd.DataFrame,
+    train_y: pd.DataFrame,
+    test_X: pd.DataFrame,
+    test_y: pd.DataFrame,
+    scoring: Callable[..., float],
+) -> Tuple[float, float, float]:
+    """
+    Fit model on train split and score it on test split. Defined on module
+    level, so it can be sent to worker processes.
+
+    Args:
+        model (any): model with already set hyperparameters.
+        train_X (pd.DataFrame): train features.
+        train_y (pd.DataFrame): train target.
+        test_X (pd.DataFrame): test features.
+        test_y (pd.DataFrame): test target.
+        scoring (Callable[..., float]): scoring function.
+
+    Returns:
+        Tuple[float, float, float]: score on test split, fit time and
+            predict time in seconds.
+    """
+    start_time = time.perf_counter()
+    model.fit(train_X, train_y)
+    fit_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    pred_y = model.predict(test_X)
+    predict_time = time.perf_counter() - start_time
+
+    return scoring(test_y, pred_y), fit_time, predict_time
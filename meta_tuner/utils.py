@@ -0,0 +1,40 @@
+import os
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Args:
+        n_jobs (int): Number of workers. If -1, all processors are used.
+
+    Returns:
+        int: positive number of workers.
+    """
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f'Arg "n_jobs" should be positive or -1. {n_jobs} provided')
+    return n_jobs
+
+
+def get_executor(backend: str, n_jobs: int) -> Executor:
+    """
+    Create executor running tasks concurrently, e.g. trials or datasets.
+
+    Args:
+        backend (str): Type of pool. Valid values: ("process", "thread").
+        n_jobs (int): Number of workers. If -1, all processors are used.
+
+    Returns:
+        Executor: executor with `n_jobs` workers.
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    if backend == "process":
+        return ProcessPoolExecutor(max_workers=n_jobs)
+    elif backend == "thread":
+        return ThreadPoolExecutor(max_workers=n_jobs)
+    else:
+        raise ValueError(
+            f'For arg "backend" only "process", "thread" are allowed. {backend} provided'
+        )
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 import pytest
 
 from pathlib import Path
 
 from meta_tuner.data.datasets import PandasDatasets, OpenmlPandasDatasets
+from meta_tuner.data.factory import PandasDatasetsFactory
 
 
 def test_pandas_datasets_get_int(pandas_datasets):
@@ -155,3 +157,139 @@ def test_lazy_datasets_wrong_indexes(lazy_datasets):
         lazy_datasets["not_exists"]
     with pytest.raises(IndexError) as e:
         lazy_datasets[99]
+
+
+def test_get_dataset_size(pandas_datasets, lazy_datasets):
+    assert pandas_datasets.get_dataset_size(0) > 0
+    assert lazy_datasets.get_dataset_size(0) > 0
+    assert lazy_datasets.datasets[0] is None
+
+
+@pytest.mark.parametrize("dataset_format", ["csv", "parquet", "feather", "arrow"])
+def test_to_dir_formats(pandas_datasets, new_dir, dataset_format):
+    pandas_datasets.to_dir(new_dir, dataset_format=dataset_format)
+    datasets = PandasDatasetsFactory.create_from_dir(new_dir)
+
+    assert len(datasets) == 4
+    for name in pandas_datasets.datasets_names:
+        assert datasets[name].shape == pandas_datasets[name].shape
+
+
+@pytest.mark.parametrize("dataset_format", ["parquet", "feather", "arrow"])
+def test_to_dir_keeps_dtypes(new_dir, dataset_format):
+    df = pd.DataFrame(
+        {
+            "num": [1.5, 2.5, None],
+            "int": [1, 2, 3],
+            "cat": pd.Categorical(["a", "b", "a"], categories=["b", "a"]),
+        },
+        index=[10, 11, 12],
+    )
+    PandasDatasets([df], ["df"]).to_dir(new_dir, dataset_format=dataset_format)
+    datasets = PandasDatasetsFactory.create_from_dir_lazy(new_dir)
+
+    pd.testing.assert_frame_equal(datasets["df"], df.reset_index(drop=True))
+
+
+def test_to_dir_wrong_format(pandas_datasets, new_dir):
+    with pytest.raises(ValueError):
+        pandas_datasets.to_dir(new_dir, dataset_format="xlsx")
+
+
+def test_lazy_datasets_memory_map(new_dir):
+    df = pd.DataFrame({"a": np.arange(100.0), "b": pd.Categorical(["x", "y"] * 50)})
+    PandasDatasets([df], ["df"]).to_dir(new_dir, dataset_format="arrow")
+    datasets = PandasDatasetsFactory.create_from_dir_lazy(
+        new_dir, download_datasets=False, memory_map=True
+    )
+
+    loaded = datasets["df"]
+    values = loaded["a"].to_numpy()
+
+    pd.testing.assert_frame_equal(loaded, df)
+    assert not values.flags.owndata
+    assert not values.flags.writeable
+
+
+def test_lazy_datasets_bounded_cache(lazy_datasets):
+    sizes = [int(df.memory_usage(deep=True).sum()) for df in lazy_datasets]
+    lazy_datasets.download_datasets = True
+    lazy_datasets.max_cache_size = sizes[0] + max(sizes[1], sizes[2])
+
+    lazy_datasets[0]
+    lazy_datasets[1]
+    lazy_datasets[0]
+    lazy_datasets[2]
+
+    assert lazy_datasets.datasets[0] is not None
+    assert lazy_datasets.datasets[1] is None
+    assert lazy_datasets.cache_hits == 1
+    assert lazy_datasets.cache_misses == 7
+    assert lazy_datasets.cache_evictions == 1
+    assert lazy_datasets.cache_size <= lazy_datasets.max_cache_size
+
+
+def test_lazy_datasets_prefetch(lazy_datasets):
+    lazy_datasets.prefetch([0, "kr-vs-kp"])
+
+    assert lazy_datasets.datasets[0] is not None
+    assert lazy_datasets.datasets[lazy_datasets.datasets_names.index("kr-vs-kp")] is not None
+
+    lazy_datasets[0]
+    assert lazy_datasets.cache_hits == 1
+
+    lazy_datasets.clear_cache()
+    assert lazy_datasets.cache_size == 0
+    assert lazy_datasets.datasets[0] is None
+
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def test_iter_prefetch(lazy_datasets, depth):
+    expected = list(lazy_datasets)
+    datasets = list(lazy_datasets.iter_prefetch(depth, indices=[3, 1, 0, 2]))
+
+    assert len(datasets) == 4
+    for df, i in zip(datasets, [3, 1, 0, 2]):
+        pd.testing.assert_frame_equal(df, expected[i])
+
+
+def test_iter_prefetch_close(lazy_datasets):
+    iterator = lazy_datasets.iter_prefetch(depth=2)
+    next(iterator)
+    iterator.close()
+
+    assert lazy_datasets.cache_misses <= 3
+
+
+def test_pandas_datasets_get_array(pandas_datasets):
+    positions = pandas_datasets[np.array([0, 2])]
+    names = pandas_datasets[np.array(pandas_datasets.datasets_names[:2])]
+    masked = pandas_datasets[np.array([True, False, True, False])]
+
+    assert positions[1] is pandas_datasets[2]
+    assert names[1] is pandas_datasets[1]
+    assert [df is pandas_datasets[i] for i, df in zip([0, 2], masked)] == [True] * 2
+
+    with pytest.raises(IndexError):
+        pandas_datasets[np.array([True, False])]
+
+
+def test_pandas_datasets_names_index_updated(pandas_datasets):
+    old_name = pandas_datasets.datasets_names[0]
+    pandas_datasets.datasets_names = ["a", "b", "c", "d"]
+
+    assert pandas_datasets["c"] is pandas_datasets[2]
+    with pytest.raises(IndexError):
+        pandas_datasets[old_name]
+
+
+def test_openml_indexing_array(openml_datasets):
+    assert openml_datasets.oml_loc[np.int64(102)] is openml_datasets[2]
+    assert openml_datasets.oml_loc[np.array([103, 100])][0] is openml_datasets[3]
+
+
+def test_lazy_datasets_get_mask(lazy_datasets):
+    datasets = lazy_datasets[np.array([False, True, False, True])]
+
+    assert len(datasets) == 2
+    assert datasets[0].equals(lazy_datasets[1])
@@ -1,3 +1,9 @@
+import pandas as pd
+import pytest
+
+from pathlib import Path
+from openml.exceptions import OpenMLServerException
+
 from meta_tuner.data.factory import PandasDatasetsFactory
 
 
@@ -29,3 +35,97 @@ def test_factory_from_dir_lazy(resource_path):
 
     assert not datasets.download_datasets
     assert len(datasets) == 4
+
+
+def local_openml_loader(resource_path, calls):
+    paths = sorted(Path(resource_path).glob("*.csv"))
+
+    def loader(dataset_id):
+        calls.append(dataset_id)
+        path = paths[dataset_id % len(paths)]
+        return pd.read_csv(path), path.stem, 1
+
+    return loader
+
+
+def test_openml_ingestion_cache(resource_path, new_dir):
+    calls = []
+    loader = local_openml_loader(resource_path, calls)
+
+    datasets = PandasDatasetsFactory.create_from_openml(
+        [0, 1, 2], n_jobs=2, cache_dir=new_dir, loader=loader
+    )
+    lazy_datasets = PandasDatasetsFactory.create_from_openml(
+        [0, 1, 2], cache_dir=new_dir, lazy=True, loader=loader
+    )
+
+    assert calls.count(0) == 1 and len(calls) == 3
+    assert datasets.openml_ids == [0, 1, 2]
+    assert lazy_datasets.datasets_names == datasets.datasets_names
+    assert len(list(Path(new_dir).glob("*.parquet"))) == 3
+    for i in range(3):
+        pd.testing.assert_frame_equal(lazy_datasets[i], datasets[i])
+
+
+def test_openml_ingestion_retry(resource_path):
+    calls = []
+    loader = local_openml_loader(resource_path, calls)
+
+    def flaky_loader(dataset_id):
+        if len(calls) < 2:
+            calls.append(None)
+            raise ConnectionError()
+        return loader(dataset_id)
+
+    datasets = PandasDatasetsFactory.create_from_openml(
+        0, loader=flaky_loader, backoff=0.0
+    )
+    assert len(datasets) == 1
+
+    calls.clear()
+    with pytest.raises(ConnectionError):
+        PandasDatasetsFactory.create_from_openml(
+            0, loader=flaky_loader, max_retries=1, backoff=0.0
+        )
+
+
+def test_openml_ingestion_no_retry_of_other_errors(resource_path):
+    calls = []
+
+    def failing_loader(dataset_id):
+        calls.append(dataset_id)
+        if dataset_id == 0:
+            raise OpenMLServerException("Unknown dataset", code=111)
+        raise KeyError(dataset_id)
+
+    for dataset_id, error in ((0, OpenMLServerException), (1, KeyError)):
+        calls.clear()
+        with pytest.raises(error):
+            PandasDatasetsFactory.create_from_openml(
+                dataset_id, loader=failing_loader, backoff=0.0
+            )
+        assert calls == [dataset_id]
+
+
+def test_openml_ingestion_versions(resource_path, new_dir):
+    calls = []
+    loader = local_openml_loader(resource_path, calls)
+
+    datasets = PandasDatasetsFactory.create_from_openml(
+        [0, 1], n_jobs=-1, cache_dir=new_dir, loader=loader
+    )
+    PandasDatasetsFactory.create_from_openml(
+        [0, 1], versions=1, cache_dir=new_dir, loader=loader
+    )
+    assert len(datasets) == 2 and len(calls) == 2
+
+    with pytest.raises(ValueError):
+        PandasDatasetsFactory.create_from_openml(
+            [0, 1], versions=[1, 2], cache_dir=new_dir, loader=loader
+        )
+    assert calls[2:] == [1]
+
+
+def test_openml_ingestion_lazy_without_cache():
+    with pytest.raises(ValueError):
+        PandasDatasetsFactory.create_from_openml(0, lazy=True)
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+from pathlib import Path
+
+from meta_tuner.data.utils import (
+    split_target,
+    get_dataset_format,
+    iter_dataset_chunks,
+    read_dataset,
+    write_dataset,
+)
+
+
+def test_split_target_by_position(test_datasets):
+    df = test_datasets[0]
+    X, y = split_target(df)
+
+    assert X.shape == (df.shape[0], df.shape[1] - 1)
+    assert list(y.columns) == [df.columns[-1]]
+
+
+def test_split_target_by_name(test_datasets):
+    df = test_datasets[0]
+    X, y = split_target(df, df.columns[0])
+
+    assert df.columns[0] not in X.columns
+    assert list(y.columns) == [df.columns[0]]
+
+    with pytest.raises(KeyError):
+        split_target(df, "notExists")
+
+
+def test_get_dataset_format():
+    assert get_dataset_format("a/b.csv") == "csv"
+    assert get_dataset_format("b.parquet") == "parquet"
+    assert get_dataset_format("b.feather") == "feather"
+    assert get_dataset_format("b.arrow") == "arrow"
+
+    with pytest.raises(ValueError):
+        get_dataset_format("b.txt")
+
+
+@pytest.mark.parametrize("dataset_format", ["csv", "parquet", "feather", "arrow"])
+def test_iter_dataset_chunks(test_datasets, new_dir, dataset_format):
+    df = test_datasets[0].copy()
+    df.iloc[150:, 0] = None
+    Path(new_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(new_dir) / f"data.{dataset_format}"
+    write_dataset(df, path)
+
+    chunks = list(iter_dataset_chunks(path, chunk_size=100))
+
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert all(list(chunk.dtypes) == list(chunks[0].dtypes) for chunk in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), read_dataset(path), check_dtype=False
+    )
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from meta_tuner.extractors.accumulators import MetaFeatureAccumulator
+from meta_tuner.extractors.engine import MetaFeatureEngine, depends_on
+from meta_tuner.extractors.utils import extended_meta_extractors
+
+
+@pytest.fixture(scope="function")
+def dataset():
+    rng = np.random.default_rng(0)
+    n = 1_000
+    X = pd.DataFrame(
+        {
+            "a": rng.normal(5, 2, n),
+            "b": rng.exponential(size=n),
+            "c": rng.choice(list("xyz"), n),
+        }
+    )
+    X.loc[rng.random(n) < 0.1, "a"] = np.nan
+    X.loc[rng.random(n) < 0.1, "c"] = None
+    # category present only in the last rows
+    X.loc[n - 10 :, "c"] = "w"
+    y = pd.Series(rng.choice([0, 1, 2], n))
+    return X, y
+
+
+def test_accumulator_matches_engine(dataset):
+    X, y = dataset
+    accumulator = MetaFeatureAccumulator()
+    for start in range(0, len(X), 150):
+        accumulator.update(X.iloc[start : start + 150], y.iloc[start : start + 150])
+
+    engine = MetaFeatureEngine(X, y)
+    chunked = MetaFeatureEngine(None, None, values=accumulator.get_values())
+
+    assert chunked.extract_all(extended_meta_extractors) == pytest.approx(
+        engine.extract_all(extended_meta_extractors), nan_ok=True
+    )
+
+
+def test_accumulator_merge(dataset):
+    X, y = dataset
+    first, second, empty = (
+        MetaFeatureAccumulator(),
+        MetaFeatureAccumulator(),
+        MetaFeatureAccumulator(),
+    )
+    first.update(X.iloc[:300], y.iloc[:300])
+    second.update(X.iloc[300:], y.iloc[300:])
+    first.merge(second)
+    first.merge(empty)
+
+    engine = MetaFeatureEngine(X, y)
+    moments = engine.extract(depends_on("moments")(lambda moments: moments))
+    values = first.get_values()
+
+    for merged, expected in zip(values["moments"], moments):
+        assert merged == pytest.approx(expected)
+    assert values["value_counts"][0].sum() == X["c"].notna().sum()
+    assert values["n_instances"] == len(X)
+
+
+def test_accumulator_errors(dataset):
+    X, y = dataset
+    accumulator = MetaFeatureAccumulator()
+
+    with pytest.raises(ValueError):
+        accumulator.get_values()
+
+    accumulator.update(X, y)
+    with pytest.raises(ValueError):
+        accumulator.update(X[["a", "b"]], y)
+    with pytest.raises(ValueError):
+        accumulator.update(X.astype({"a": str}), y)
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from meta_tuner.extractors.engine import MetaFeatureEngine
+from meta_tuner.extractors.utils import SampleSize, extended_meta_extractors
+
+
+@pytest.fixture(scope="function")
+def credit_g(resource_path):
+    df = pd.read_csv(resource_path / "credit-g.csv")
+    X, y = df.iloc[:, :-1].copy(), df.iloc[:, -1]
+    X.iloc[::7, 1] = np.nan
+    X.iloc[::5, 3] = None
+    return X, y
+
+
+def test_engine_matches_pandas(credit_g):
+    X, y = credit_g
+    engine = MetaFeatureEngine(X, y)
+    metadata = {
+        name: engine.extract(func) for name, func in extended_meta_extractors.items()
+    }
+    numeric = X.select_dtypes(include=np.number)
+    correlation = numeric.corr().abs().to_numpy()
+
+    assert metadata["NumberOfSymbolicFeatures"] == X.shape[1] - numeric.shape[1]
+    assert metadata["NumberOfMissingValues"] == X.isna().sum().sum()
+    assert metadata["NumberOfInstancesWithMissingValues"] == X.isna().any(axis=1).sum()
+    assert metadata["NumberOfClasses"] == y.nunique()
+    assert metadata["MajorityClassPercentage"] == pytest.approx(
+        100 * y.value_counts(normalize=True).max()
+    )
+    assert metadata["MeanMeansOfNumericAtts"] == pytest.approx(numeric.mean().mean())
+    assert metadata["MeanStdDevOfNumericAtts"] == pytest.approx(numeric.std().mean())
+    assert metadata["MeanSkewnessOfNumericAtts"] == pytest.approx(numeric.skew().mean())
+    assert metadata["MeanKurtosisOfNumericAtts"] == pytest.approx(numeric.kurt().mean())
+    assert metadata["MeanAbsoluteCorrelation"] == pytest.approx(
+        correlation[np.triu_indices_from(correlation, k=1)].mean()
+    )
+
+
+def test_engine_extractors_called_directly(credit_g):
+    X, y = credit_g
+    engine = MetaFeatureEngine(X, y)
+
+    for func in extended_meta_extractors.values():
+        assert func(X, y) == pytest.approx(engine.extract(func), nan_ok=True)
+
+
+def test_engine_entropy_and_mutual_information():
+    X = pd.DataFrame({"same": list("aabb"), "other": list("abab")})
+    y = pd.Series([0, 0, 1, 1])
+    engine = MetaFeatureEngine(X, y)
+
+    def extract(name):
+        return engine.extract(extended_meta_extractors[name])
+
+    assert extract("ClassEntropy") == pytest.approx(1.0)
+    assert extract("MeanAttributeEntropy") == pytest.approx(1.0)
+    assert extract("MeanMutualInformation") == pytest.approx(0.5)
+
+
+def test_engine_regression_target():
+    X = pd.DataFrame({"a": [1.0, 2.0, 3.0]})
+    engine = MetaFeatureEngine(X, pd.Series([0.5, 1.5, 2.5]))
+
+    assert np.isnan(engine.extract(extended_meta_extractors["NumberOfClasses"]))
+    assert np.isnan(engine.extract(extended_meta_extractors["MeanAttributeEntropy"]))
+
+
+def test_engine_custom_extractor():
+    X = pd.DataFrame({"a": [1.0, 2.0]})
+    engine = MetaFeatureEngine(X, pd.DataFrame({"y": [0, 1]}))
+
+    assert engine.extract(lambda X, y: len(y)) == 2
+
+
+def test_engine_approximate():
+    rng = np.random.default_rng(0)
+    n = 100_000
+    X = pd.DataFrame(
+        {
+            "numeric": rng.normal(size=n),
+            "nominal": rng.choice([f"v{i}" for i in range(300)], n),
+        }
+    )
+    X.loc[rng.random(n) < 0.1, "numeric"] = np.nan
+    y = pd.Series(rng.choice(["a", "b"], n, p=[0.8, 0.2]))
+
+    exact_engine = MetaFeatureEngine(X, y)
+    approximate_engine = MetaFeatureEngine.approximate(
+        X, y, max_error=0.02, random_state=0
+    )
+    exact = exact_engine.extract_all(extended_meta_extractors)
+    approximate = approximate_engine.extract_all(extended_meta_extractors)
+
+    assert approximate_engine.extract(SampleSize) == 4612
+    assert exact_engine.extract(SampleSize) == n
+    assert approximate["NumberOfInstances"] == exact["NumberOfInstances"] == n
+    assert approximate["PercentageOfMissingValues"] == pytest.approx(
+        exact["PercentageOfMissingValues"], abs=2
+    )
+    assert approximate["NumberOfMissingValues"] == pytest.approx(
+        exact["NumberOfMissingValues"], rel=0.2
+    )
+    for name in [
+        "MajorityClassPercentage",
+        "ClassEntropy",
+        "MeanAttributeEntropy",
+        "MeanMutualInformation",
+        "MeanNominalAttDistinctValues",
+    ]:
+        assert approximate[name] == pytest.approx(exact[name])
+
+
+def test_engine_approximate_high_cardinality():
+    rng = np.random.default_rng(0)
+    n = 50_000
+    X = pd.DataFrame({"nominal": rng.integers(0, 5000, n).astype(str)})
+    y = pd.DataFrame({"target": rng.choice(["a", "b"], n)})
+
+    exact = MetaFeatureEngine(X, y).extract_all(extended_meta_extractors)
+    approximate = MetaFeatureEngine.approximate(
+        X, y, max_error=0.02, random_state=0
+    ).extract_all(extended_meta_extractors)
+
+    # plug-in estimates from 4612 sampled rows would be biased by over 0.5 bit
+    assert approximate["MeanAttributeEntropy"] == pytest.approx(
+        exact["MeanAttributeEntropy"]
+    )
+    assert approximate["MeanMutualInformation"] == pytest.approx(
+        exact["MeanMutualInformation"]
+    )
+
+
+def test_engine_approximate_small_dataset(credit_g):
+    X, y = credit_g
+    engine = MetaFeatureEngine.approximate(X, y)
+
+    assert engine.extract(SampleSize) == X.shape[0]
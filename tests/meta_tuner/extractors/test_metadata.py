@@ -1,6 +1,11 @@
+import weakref
+import numpy as np
 import pandas as pd
 import pytest
 
+from pathlib import Path
+
+from meta_tuner.data.utils import split_target, write_dataset
 from meta_tuner.extractors.metadata import MetaDataExtractor
 
 
@@ -26,7 +31,20 @@ def test_get_metadata(resource_path):
     extractor = MetaDataExtractor()
     metadata = extractor.get_metadata(X, y)
 
+    assert list(metadata) == [
+        "NumberOfFeatures",
+        "NumberOfInstances",
+        "NumberOfNumericFeatures",
+    ]
+    for value in metadata.values():
+        assert value is not None
+        assert isinstance(value, (float, int))
+
+    extractor = MetaDataExtractor(load_extended=True)
+    metadata = extractor.get_metadata(X, y)
+
     assert isinstance(metadata, dict)
+    assert len(metadata) > 3
     for value in metadata.values():
         assert value is not None
         assert isinstance(value, (float, int))
@@ -75,3 +93,162 @@ def test_add_new_extractor(resource_path):
     assert len(list(extractor.meta_extractors.keys())) == 1
     assert hasattr(extractor.meta_extractors["new_extractor"], "__call__")
     assert metadata["new_extractor"] == 999
+
+
+def test_add_extractor_does_not_change_defaults():
+    extractor = MetaDataExtractor()
+    extractor.add_extractor("new_extractor", lambda X, y: 999)
+
+    assert "new_extractor" not in MetaDataExtractor().meta_extractors
+
+
+def test_extractors_share_intermediates(resource_path):
+    df = pd.read_csv(resource_path / "credit-g.csv")
+    X, y = df.iloc[:, :-1], df.iloc[:, -1]
+    calls = []
+
+    def class_probabilities(target_counts):
+        calls.append("class_probabilities")
+        return target_counts / target_counts.sum()
+
+    extractor = MetaDataExtractor(load_default=False)
+    extractor.add_intermediate(
+        "class_probabilities", class_probabilities, requires=["target_counts"]
+    )
+    extractor.add_extractor("max_p", max, requires=["class_probabilities"])
+    extractor.add_extractor("min_p", min, requires=["class_probabilities"])
+    metadata = extractor.get_metadata(X, y)
+
+    assert calls == ["class_probabilities"]
+    assert metadata["max_p"] == pytest.approx(0.7)
+    assert metadata["min_p"] == pytest.approx(0.3)
+
+
+def test_intermediates_released_after_last_use():
+    X, y = pd.DataFrame({"a": [1.0, 2.0]}), pd.Series([0, 1])
+    references = []
+
+    class Matrix:
+        pass
+
+    def create_matrix(X):
+        matrix = Matrix()
+        references.append(weakref.ref(matrix))
+        return matrix
+
+    extractor = MetaDataExtractor(load_default=False)
+    extractor.add_intermediate("matrix", create_matrix, requires=["X"])
+    extractor.add_extractor("uses_matrix", lambda matrix: 1, requires=["matrix"])
+    extractor.add_extractor(
+        "after_matrix", lambda X: references[0]() is None, requires=["X"]
+    )
+
+    assert extractor.get_metadata(X, y)["after_matrix"]
+
+
+def test_intermediates_wrong_graph():
+    X, y = pd.DataFrame({"a": [1.0, 2.0]}), pd.Series([0, 1])
+
+    extractor = MetaDataExtractor(load_default=False)
+    extractor.add_intermediate("a", lambda b: b, requires=["b"])
+    extractor.add_intermediate("b", lambda a: a, requires=["a"])
+    extractor.add_extractor("cycle", lambda a: a, requires=["a"])
+    with pytest.raises(ValueError):
+        extractor.get_metadata(X, y)
+
+    extractor = MetaDataExtractor(load_default=False)
+    extractor.add_extractor("missing", lambda a: a, requires=["notExists"])
+    with pytest.raises(ValueError):
+        extractor.get_metadata(X, y)
+
+    with pytest.raises(ValueError):
+        extractor.add_intermediate("X", lambda X, y: X)
+
+
+@pytest.mark.parametrize("n_jobs,backend", [(1, "thread"), (2, "thread"), (2, "process")])
+def test_get_datasets_metadata(lazy_datasets, n_jobs, backend):
+    extractor = MetaDataExtractor()
+    extractor.add_extractor("NumberOfClassesMax", np.max, requires=["target_counts"])
+
+    metadata = extractor.get_datasets_metadata(
+        lazy_datasets, n_jobs=n_jobs, backend=backend
+    )
+
+    assert list(metadata.index) == lazy_datasets.datasets_names
+    assert list(metadata.columns) == list(extractor.meta_extractors)
+    for i, df in enumerate(lazy_datasets):
+        X, y = df.iloc[:, :-1], df.iloc[:, -1]
+        expected = extractor.get_metadata(X, y)
+        assert metadata.iloc[i].to_dict() == pytest.approx(expected, nan_ok=True)
+
+
+def test_get_datasets_metadata_target(pandas_datasets):
+    extractor = MetaDataExtractor()
+    targets = [0] * len(pandas_datasets)
+
+    metadata = extractor.get_datasets_metadata(pandas_datasets, targets, n_jobs=1)
+    X, y = split_target(pandas_datasets[0], 0)
+
+    assert metadata.iloc[0].to_dict() == pytest.approx(
+        extractor.get_metadata(X, y), nan_ok=True
+    )
+
+    with pytest.raises(ValueError):
+        extractor.get_datasets_metadata(pandas_datasets, [0], n_jobs=1)
+
+
+def test_get_metadata_approximate(resource_path):
+    df = pd.read_csv(resource_path / "credit-g.csv")
+    X, y = df.iloc[:, :-1], df.iloc[:, -1]
+
+    extractor = MetaDataExtractor(load_extended=True)
+    metadata = extractor.get_metadata(X, y, approximate=True, max_error=0.1)
+
+    assert metadata["SampleSize"] == 185
+    assert metadata["NumberOfInstances"] == 1000
+    assert "SampleSize" not in extractor.get_metadata(X, y)
+
+
+def test_get_datasets_metadata_approximate(pandas_datasets):
+    extractor = MetaDataExtractor()
+    metadata = extractor.get_datasets_metadata(
+        pandas_datasets, n_jobs=1, approximate=True, max_error=0.1
+    )
+
+    assert list(metadata.columns) == [*extractor.meta_extractors, "SampleSize"]
+    assert (metadata["SampleSize"] <= metadata["NumberOfInstances"]).all()
+    exact = extractor.get_datasets_metadata(pandas_datasets, n_jobs=1)
+    assert "SampleSize" not in exact.columns
+
+
+@pytest.mark.parametrize("dataset_format", ["csv", "parquet", "arrow"])
+def test_get_metadata_from_file(resource_path, new_dir, dataset_format):
+    df = pd.read_csv(resource_path / "credit-g.csv")
+    Path(new_dir).mkdir(parents=True, exist_ok=True)
+    path = Path(new_dir) / f"credit-g.{dataset_format}"
+    write_dataset(df, path)
+
+    extractor = MetaDataExtractor(load_extended=True)
+    metadata = extractor.get_metadata_from_file(path, chunk_size=128)
+
+    X, y = df.iloc[:, :-1], df.iloc[:, -1]
+    assert metadata == pytest.approx(extractor.get_metadata(X, y), nan_ok=True)
+
+
+def test_get_metadata_from_file_requires_x(resource_path):
+    extractor = MetaDataExtractor(load_default=False)
+    extractor.add_extractor("new_extractor", lambda X, y: 999)
+
+    with pytest.raises(ValueError):
+        extractor.get_metadata_from_file(resource_path / "credit-g.csv")
+
+
+def test_get_datasets_metadata_chunked(lazy_datasets, pandas_datasets):
+    extractor = MetaDataExtractor(load_extended=True)
+    metadata = extractor.get_datasets_metadata(lazy_datasets, n_jobs=1)
+    chunked = extractor.get_datasets_metadata(lazy_datasets, n_jobs=2, chunk_size=500)
+
+    pd.testing.assert_frame_equal(metadata, chunked, check_dtype=False)
+
+    with pytest.raises(ValueError):
+        extractor.get_datasets_metadata(pandas_datasets, chunk_size=500)
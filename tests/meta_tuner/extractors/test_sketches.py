@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from meta_tuner.extractors.sketches import ReservoirSample, hoeffding_sample_size
+
+
+def test_hoeffding_sample_size():
+    assert hoeffding_sample_size(0.01, 0.95) == 18445
+    assert hoeffding_sample_size(0.1, 0.95) < hoeffding_sample_size(0.1, 0.99)
+
+    with pytest.raises(ValueError):
+        hoeffding_sample_size(0, 0.95)
+
+
+def test_reservoir_sample():
+    sample, other = ReservoirSample(100, random_state=0), ReservoirSample(100, 1)
+    sample.update(np.arange(5_000))
+    other.update(np.arange(5_000, 10_000))
+    sample.merge(other)
+
+    assert sample.n_seen == 10_000
+    assert len(np.unique(sample.sample)) == 100
+    assert np.any(sample.sample >= 5_000) and np.any(sample.sample < 5_000)
+
+    small = ReservoirSample(100)
+    small.update(np.arange(10))
+    assert sorted(small.sample) == list(range(10))
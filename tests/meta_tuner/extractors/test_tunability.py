@@ -1,6 +1,14 @@
+import pandas as pd
 import pytest
 
+from sklearn.metrics import accuracy_score
+from sklearn.tree import DecisionTreeClassifier
+
 from meta_tuner.extractors.tunability import TunabilityExtractor
+from meta_tuner.searchers.hpo_searchers import SuccessiveHalvingSearch
+from meta_tuner.searchers.preprocessors import wrap_model_with_preprocessing
+from meta_tuner.searchers.search_grid import FixedGrid
+from meta_tuner.searchers.splits import CVSplitPlan
 
 
 def test_wrong_init():
@@ -46,3 +54,63 @@ def test_raise_error_when_default_not_set(search_result):
     extractor = TunabilityExtractor(search_result, lowest_best=True)
     with pytest.raises(ValueError):
         _ = extractor.extract_gains()
+
+
+def test_wrong_init_not_aligned_hpo(search_result):
+    search_result[1]["hpo"] = [{"a": 2}, {"a": 1}]
+
+    with pytest.raises(ValueError):
+        _ = TunabilityExtractor(search_result, lowest_best=True)
+
+
+def test_select_budget(search_result):
+    for search_result_ in search_result:
+        search_result_["hpo"].append({"a": 3})
+        search_result_["mean_score"].append(-100)
+        search_result_["budget"] = [1.0, 1.0, 0.5]
+
+    extractor = TunabilityExtractor(search_result, lowest_best=True, budget=1.0)
+    best_hpo = extractor.extract_default_hpo()
+
+    assert best_hpo["a"] == 2
+    assert len(extractor.search_results[0]["hpo"]) == 2
+
+
+def test_select_budget_not_aligned(search_result):
+    for search_result_, hpo in zip(search_result, ({"a": 1}, {"a": 3}, {"a": 1})):
+        search_result_["hpo"].append(hpo)
+        search_result_["mean_score"].append(0)
+        search_result_["budget"] = [0.5, 0.5, 1.0]
+
+    extractor = TunabilityExtractor(search_result[::2], lowest_best=True, budget=1.0)
+    assert extractor.search_results[0]["hpo"] == [{"a": 1}]
+
+    with pytest.raises(ValueError):
+        _ = TunabilityExtractor(search_result, lowest_best=True, budget=1.0)
+
+
+def test_successive_halving_results(resource_path):
+    configurations = [{"model__max_depth": depth} for depth in range(1, 10)]
+    search_results = []
+    for name in ("credit-g", "kr-vs-kp"):
+        dataset = pd.read_csv(resource_path / f"{name}.csv")
+        X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+        search = SuccessiveHalvingSearch(
+            wrap_model_with_preprocessing(DecisionTreeClassifier(random_state=0)),
+            FixedGrid(configurations),
+        )
+        split_plan = CVSplitPlan.create(X.shape[0], cv=3, seed=1)
+        search.search(X, y, accuracy_score, n_iter=9, eta=3, split_plan=split_plan)
+        search_results.append(search.search_results)
+
+    with pytest.warns(UserWarning, match="every dataset"):
+        extractor = TunabilityExtractor(search_results, lowest_best=False, budget=1.0)
+    default_hpo = extractor.extract_default_hpo()
+    gains = extractor.extract_gains()
+
+    # three configurations reach full budget on each dataset, two of them on both
+    common_hpos = extractor.search_results[0]["hpo"]
+    assert common_hpos == [{"model__max_depth": 7}, {"model__max_depth": 8}]
+    assert extractor.search_results[1]["hpo"] == common_hpos
+    assert default_hpo in common_hpos
+    assert len(gains) == 2 and (gains >= 0).all()
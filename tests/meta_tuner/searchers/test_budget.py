@@ -0,0 +1,38 @@
+import time
+
+from meta_tuner.searchers.budget import SearchBudget
+
+
+def test_budget_max_fits():
+    budget = SearchBudget(max_fits=10)
+    for _ in range(2):
+        assert budget.can_start(5)
+        budget.start_trial(5)
+
+    assert not budget.can_start(5)
+
+
+def test_budget_cpu_time_prediction():
+    budget = SearchBudget(max_cpu_time=10)
+    budget.start_trial(1)
+    budget.finish_trial(4.0)
+
+    assert budget.can_start(1)
+    budget.start_trial(1)
+    assert not budget.can_start(1)
+
+    budget.finish_trial(4.0)
+    assert not budget.can_start(1)
+    assert not budget.is_exhausted()
+
+
+def test_budget_time():
+    budget = SearchBudget(max_time=0.05)
+    assert budget.can_start(1)
+    time.sleep(0.06)
+
+    assert budget.is_exhausted()
+    assert not budget.can_start(1)
+
+    budget.start()
+    assert not budget.is_exhausted()
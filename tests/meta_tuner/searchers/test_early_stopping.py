@@ -1,9 +1,12 @@
 import pytest
+import time
 from copy import copy
 
 from meta_tuner.searchers.early_stopping import (
     DummyEarlyStopping,
     NoImprovementEarlyStopping,
+    RelativeImprovementEarlyStopping,
+    TimeBudgetEarlyStopping,
 )
 
 
@@ -29,3 +32,40 @@ def test_not_improvement_not_enough_data():
     scores_imp = [i for i in range(6)]
     stopper = NoImprovementEarlyStopping(n_iteration=100, lowest_best=False)
     assert not stopper.is_stop({"mean_score": scores_imp})
+
+
+def test_not_improvement_lowest_best():
+    stopper = NoImprovementEarlyStopping(n_iteration=3, lowest_best=True)
+    assert not stopper.is_stop({"mean_score": [3, 2, 1]})
+    assert not stopper.is_stop({"mean_score": [3, 2, 1, 2]})
+    assert stopper.is_stop({"mean_score": [3, 2, 1, 2, 2]})
+
+
+def test_not_improvement_incremental():
+    scores = []
+    stopper = NoImprovementEarlyStopping(n_iteration=3, lowest_best=False)
+    results = []
+    for score in [1, 2, 3, 3, 2, 1]:
+        scores.append(score)
+        results.append(stopper.is_stop({"mean_score": scores}))
+
+    assert results == [False, False, False, False, False, True]
+    assert stopper.best_iter == 3
+    assert stopper.n_seen == 6
+
+
+def test_relative_improvement():
+    stopper = RelativeImprovementEarlyStopping(
+        n_iteration=3, lowest_best=False, min_delta=0.1
+    )
+    assert not stopper.is_stop({"mean_score": [1.0, 1.2]})
+    assert stopper.is_stop({"mean_score": [1.0, 1.2, 1.25, 1.3]})
+    assert not stopper.is_stop({"mean_score": [1.0, 1.2, 1.25, 1.5]})
+
+
+def test_time_budget():
+    stopper = TimeBudgetEarlyStopping(max_time=0.05)
+    stopper.reset()
+    assert not stopper.is_stop({"mean_score": [1.0]})
+    time.sleep(0.06)
+    assert stopper.is_stop({"mean_score": [1.0]})
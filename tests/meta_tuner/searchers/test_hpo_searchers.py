@@ -5,30 +5,23 @@ from copy import deepcopy
 from sklearn.linear_model import LogisticRegression
 from sklearn.metrics import accuracy_score
 
-from meta_tuner.searchers.hpo_searchers import RandomSearch
+from meta_tuner.searchers.hpo_searchers import (
+    RandomSearch,
+    SuccessiveHalvingSearch,
+    HyperbandSearch,
+)
 from meta_tuner.searchers.preprocessors import wrap_model_with_preprocessing
-from meta_tuner.searchers.early_stopping import NoImprovementEarlyStopping
+from meta_tuner.searchers.early_stopping import (
+    NoImprovementEarlyStopping,
+    TimeBudgetEarlyStopping,
+)
+from meta_tuner.searchers.search_grid import CubeGrid, QuasiRandomGrid
+from meta_tuner.searchers.splits import CVSplitPlan
+from meta_tuner.searchers.budget import SearchBudget
+from meta_tuner.searchers.checkpoint import SearchCheckpoint
 from sklearn.metrics import accuracy_score
 
 
-def test_get_cv_func():
-    search = RandomSearch("model_obj", "grid")
-    size: int = 100
-    folds = search._get_cv_indexes(size, 5)
-
-    chosen_idx = np.empty(0)
-
-    for fold in folds:
-        chosen_idx = np.concatenate([chosen_idx, fold[0]])
-        total_idx = np.concatenate([fold[0], fold[1]])
-
-        assert np.unique(total_idx).shape[0] == size
-        assert (fold[0].shape[0] + fold[1].shape[0]) // fold[0].shape[0] == 5
-
-    assert chosen_idx.shape[0] == np.unique(chosen_idx).shape[0]
-    assert len(folds) == 5
-
-
 def test_override_model_hpo():
     class _Model:
         def __init__(self, a) -> None:
@@ -56,3 +49,307 @@ def test_random_search_search(test_datasets, logistic_grid):
     search.search(X, y, accuracy_score, n_iter=10)
 
     assert len(search.search_results["mean_score"]) == 10
+
+
+@pytest.mark.parametrize("backend", ["thread", "process"])
+def test_random_search_parallel_same_as_serial(test_datasets, logistic_grid, backend):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression(random_state=0))
+
+    serial_search = RandomSearch(model_wrapper, logistic_grid)
+    np.random.seed(123)
+    serial_search.search(X, y, accuracy_score, n_iter=4, cv=3)
+
+    logistic_grid.reset_seed()
+    parallel_search = RandomSearch(model_wrapper, logistic_grid)
+    np.random.seed(123)
+    parallel_search.search(
+        X, y, accuracy_score, n_iter=4, cv=3, n_jobs=2, backend=backend
+    )
+
+    assert serial_search.search_results["hpo"] == parallel_search.search_results["hpo"]
+    assert np.array_equal(
+        serial_search._search_results.to_numpy("scores"),
+        parallel_search._search_results.to_numpy("scores"),
+    )
+
+
+def test_random_search_parallel_early_stopping(test_datasets):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, [-1]]
+    early_stopping = NoImprovementEarlyStopping(n_iteration=2, lowest_best=False)
+    grid = CubeGrid(init_seed=123)
+    grid.add("C", [0.0001, 1], space="real", distribution="loguniform")
+
+    search = RandomSearch(LogisticRegression(), grid, early_stopping)
+
+    with pytest.warns(UserWarning):
+        search.search(
+            X, y, accuracy_score, n_iter=20, cv=2, n_jobs=2, backend="thread"
+        )
+
+    assert len(search.search_results["mean_score"]) < 20
+
+
+def test_random_search_wrong_backend(test_datasets, naive_logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    search = RandomSearch(LogisticRegression(), naive_logistic_grid)
+
+    with pytest.raises(ValueError):
+        search.search(X, y, accuracy_score, n_iter=2, n_jobs=2, backend="notExists")
+
+
+def test_random_search_with_quasi_random_grid(test_datasets):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+    grid = QuasiRandomGrid(init_seed=123, sampler="sobol")
+    grid.add("C", [0.001, 100], space="real", distribution="loguniform")
+
+    search = RandomSearch(model_wrapper, grid)
+    search.search(X, y, accuracy_score, n_iter=4, cv=2)
+
+    assert len(search.search_results["mean_score"]) == 4
+
+
+def test_successive_halving_folds(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = SuccessiveHalvingSearch(model_wrapper, logistic_grid)
+    search.search(X, y, accuracy_score, n_iter=9, cv=3, eta=3)
+    results = search.search_results
+
+    assert list(results["budget"]) == [1 / 3] * 9 + [1.0] * 3
+    assert all(len(scores) == 1 for scores in results["scores"][:9])
+    assert all(len(scores) == 3 for scores in results["scores"][9:])
+
+    best_partial = np.argsort(results["mean_score"][:9], kind="stable")[::-1][:3]
+    survivors = [results["hpo"][i] for i in sorted(best_partial)]
+    assert results["hpo"][9:] == survivors
+    for i, hpo_idx in enumerate(sorted(best_partial)):
+        assert results["scores"][9 + i][0] == results["scores"][hpo_idx][0]
+
+
+def test_successive_halving_samples(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = SuccessiveHalvingSearch(model_wrapper, logistic_grid)
+    search.search(
+        X, y, accuracy_score, n_iter=9, cv=2, resource="samples", n_jobs=2, backend="thread"
+    )
+    budgets = search.search_results["budget"]
+
+    assert list(budgets) == [1 / 9] * 9 + [1 / 3] * 3 + [1.0]
+    assert all(len(scores) == 2 for scores in search.search_results["scores"])
+
+
+def test_successive_halving_wrong_resource(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    search = SuccessiveHalvingSearch(LogisticRegression(), logistic_grid)
+
+    with pytest.raises(ValueError):
+        search.search(X, y, accuracy_score, n_iter=9, resource="notExists")
+
+
+def test_hyperband(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = HyperbandSearch(model_wrapper, logistic_grid)
+    search.search(X, y, accuracy_score, cv=3, eta=3)
+
+    assert list(search.search_results["budget"]) == [1 / 3] * 3 + [1.0] + [1.0] * 2
+
+
+def test_successive_halving_early_stopping(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = SuccessiveHalvingSearch(
+        model_wrapper, logistic_grid, early_stopping=TimeBudgetEarlyStopping(0)
+    )
+    with pytest.warns(UserWarning, match="early stopping"):
+        search.search(X, y, accuracy_score, n_iter=9, cv=3, eta=3)
+    assert list(search.search_results["budget"]) == [1 / 3] * 9
+
+    search = HyperbandSearch(
+        model_wrapper, logistic_grid, early_stopping=TimeBudgetEarlyStopping(0)
+    )
+    with pytest.warns(UserWarning, match="early stopping"):
+        search.search(X, y, accuracy_score, cv=3, eta=3)
+    assert list(search.search_results["budget"]) == [1 / 3] * 3
+
+
+def test_hyperband_brackets_from_min_budget(test_datasets, naive_logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = HyperbandSearch(model_wrapper, naive_logistic_grid)
+    search.search(X, y, accuracy_score, cv=9, eta=3)
+    budgets = search.search_results["budget"]
+
+    # brackets start from budgets 1/9, 1/3 and 1
+    assert list(budgets[:13]) == [1 / 9] * 9 + [1 / 3] * 3 + [1.0]
+    assert list(budgets[13:]) == [1 / 3] * 5 + [1.0] + [1.0] * 3
+
+
+def test_random_search_cache_preprocessing(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = RandomSearch(model_wrapper, logistic_grid)
+    search.search(X, y, accuracy_score, n_iter=5, cv=3, cache_preprocessing=True)
+
+    assert len(search.search_results["mean_score"]) == 5
+    assert len(search._preprocessing_cache) == 3
+
+
+def test_random_search_split_plan(test_datasets, naive_logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+    plan = CVSplitPlan.create(X.shape[0], cv=3, y=y, seed=123)
+
+    search = RandomSearch(model_wrapper, naive_logistic_grid)
+    search.search(X, y, accuracy_score, n_iter=2, split_plan=plan)
+
+    assert search.split_plan is plan
+    assert all(len(scores) == 3 for scores in search.search_results["scores"])
+
+    with pytest.raises(ValueError):
+        search.search(X.iloc[:10], y.iloc[:10], accuracy_score, split_plan=plan)
+
+
+def test_override_model_hpo_nested():
+    class _Model:
+        def __init__(self, a) -> None:
+            self.a = a
+
+    class _Wrapper:
+        def __init__(self, model) -> None:
+            self.model = model
+
+    search = RandomSearch(_Wrapper(_Model(1)), "grid")
+    model_new = search._override_model_hpo({"model__a": 2})
+
+    assert model_new.model.a == 2
+    assert search.model.model.a == 1
+
+    pipeline = wrap_model_with_preprocessing(LogisticRegression())
+    search = RandomSearch(pipeline, "grid", model_init="clone")
+    model_new = search._override_model_hpo({"model__C": 0.5})
+
+    assert model_new.named_steps["model"].C == 0.5
+    assert pipeline.named_steps["model"].C == 1.0
+
+
+def test_override_model_hpo_clone_skips_fitted_state(test_datasets):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, -1]
+    model = LogisticRegression().fit(X, y)
+
+    search = RandomSearch(model, "grid", model_init="clone")
+    model_new = search._override_model_hpo({"C": 0.5})
+
+    assert model_new.C == 0.5
+    assert not hasattr(model_new, "coef_")
+
+
+def test_override_model_hpo_factory():
+    search = RandomSearch(
+        lambda: wrap_model_with_preprocessing(LogisticRegression()),
+        "grid",
+        model_init="factory",
+    )
+    model_1 = search._override_model_hpo({"model__C": 0.5})
+    model_2 = search._override_model_hpo({"model__C": 2.0})
+
+    assert model_1.named_steps["model"].C == 0.5
+    assert model_2.named_steps["model"].C == 2.0
+
+
+def test_wrong_model_init():
+    with pytest.raises(ValueError):
+        RandomSearch(LogisticRegression(), "grid", model_init="notExists")
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_random_search_max_fits_budget(test_datasets, logistic_grid, n_jobs):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+    budget = SearchBudget(max_fits=10)
+
+    search = RandomSearch(model_wrapper, deepcopy(logistic_grid))
+    search.search(
+        X, y, accuracy_score, n_iter=10, cv=3, n_jobs=n_jobs, backend="thread", budget=budget
+    )
+
+    assert len(search.search_results["mean_score"]) == 3
+    assert budget.n_started_fits == 9
+    assert (search._search_results.to_numpy("fit_time") > 0).all()
+    assert (search._search_results.to_numpy("predict_time") > 0).all()
+
+
+def test_random_search_time_budget(test_datasets, logistic_grid):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    model_wrapper = wrap_model_with_preprocessing(LogisticRegression())
+
+    search = RandomSearch(model_wrapper, deepcopy(logistic_grid))
+    search.search(X, y, accuracy_score, n_iter=1000, cv=2, budget=SearchBudget(max_time=0.5))
+
+    assert 0 < len(search.search_results["mean_score"]) < 1000
+
+
+def test_random_search_resume(test_datasets, tmp_path):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, [-1]]
+    grid = CubeGrid(init_seed=1)
+    grid.add("C", [0.01, 10.0], "real", "loguniform")
+    path = tmp_path / "search.ckpt"
+
+    full_search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    full_search.search(
+        X,
+        y,
+        accuracy_score,
+        n_iter=6,
+        cv=3,
+        split_plan=CVSplitPlan.create(X.shape[0], 3, seed=1),
+    )
+
+    interrupted_search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    interrupted_search.search(
+        X,
+        y,
+        accuracy_score,
+        n_iter=4,
+        cv=3,
+        split_plan=CVSplitPlan.create(X.shape[0], 3, seed=1),
+        checkpoint=path,
+        checkpoint_every=2,
+    )
+    with open(path, "ab") as f:
+        f.write(b"\x80\x04torn")
+
+    resumed_search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    resumed_search.resume(X, y, accuracy_score, path, n_iter=6, n_jobs=2, backend="thread")
+
+    assert resumed_search.search_results["hpo"] == full_search.search_results["hpo"]
+    assert np.array_equal(
+        resumed_search._search_results.to_numpy("scores"),
+        full_search._search_results.to_numpy("scores"),
+    )
+    assert len(SearchCheckpoint(path).load()[2]) == 6
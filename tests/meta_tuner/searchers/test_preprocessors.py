@@ -0,0 +1,47 @@
+import numpy as np
+
+from sklearn.linear_model import LogisticRegression
+
+from meta_tuner.searchers.preprocessors import (
+    PreprocessingCache,
+    get_generic_preprocessing,
+    wrap_model_with_preprocessing,
+)
+
+
+def test_preprocessing_cache_fit_once(test_datasets):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1], dataset.iloc[:, [-1]]
+    train_idx, test_idx = np.arange(0, 500), np.arange(500, X.shape[0])
+    cache = PreprocessingCache()
+
+    train_X, test_X = cache.fit_transform(
+        get_generic_preprocessing(), X, y, train_idx, test_idx
+    )
+    train_X_, test_X_ = cache.fit_transform(
+        get_generic_preprocessing(), X, y, train_idx, test_idx
+    )
+
+    assert len(cache) == 1
+    assert train_X is train_X_ and test_X is test_X_
+
+    expected = get_generic_preprocessing().fit(X.iloc[train_idx], y.iloc[train_idx])
+    assert np.allclose(test_X, expected.transform(X.iloc[test_idx]))
+
+    cache.fit_transform(get_generic_preprocessing(), X, y, test_idx, train_idx)
+    assert len(cache) == 2
+
+
+def test_preprocessing_cache_is_cacheable():
+    model = wrap_model_with_preprocessing(LogisticRegression())
+
+    assert PreprocessingCache.is_cacheable(model, {"model__C": 1.0})
+    assert not PreprocessingCache.is_cacheable(model, {"preprocessing__memory": None})
+    assert not PreprocessingCache.is_cacheable(LogisticRegression(), {"C": 1.0})
+
+
+def test_wrap_model_with_preprocessing_not_shared():
+    pipeline_1 = wrap_model_with_preprocessing(LogisticRegression())
+    pipeline_2 = wrap_model_with_preprocessing(LogisticRegression())
+
+    assert pipeline_1[0] is not pipeline_2[0]
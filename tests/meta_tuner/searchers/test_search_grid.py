@@ -1,8 +1,16 @@
 import pytest
 import numpy as np
-
-from meta_tuner.searchers.search_grid import CubeGrid, ConditionalGrid
+import pandas as pd
+
+from meta_tuner.searchers.search_grid import (
+    CubeGrid,
+    ConditionalGrid,
+    FixedGrid,
+    QuasiRandomGrid,
+    get_hpo_key,
+)
 from collections import Counter
+from copy import deepcopy
 
 
 def test_cube_grid_pass_int():
@@ -175,3 +183,257 @@ def test_cond_grind_wrong_condition():
 
     with pytest.raises(KeyError) as e:
         cond_grid.pick()
+
+
+def test_hpo_key():
+    assert get_hpo_key({"a": 1, "b": "x"}) == get_hpo_key({"b": "x", "a": np.int64(1)})
+    assert get_hpo_key({"a": 1}) != get_hpo_key({"a": 2})
+    assert hash(get_hpo_key({"a": [1, 2]}))
+
+
+def test_fixed_grid_pick_and_reset():
+    grid = FixedGrid([{"a": 1}, {"a": 2}])
+
+    assert grid.pick() == {"a": 1}
+    assert grid.pick() == {"a": 2}
+    with pytest.raises(IndexError):
+        grid.pick()
+
+    grid.reset_seed()
+    assert grid.pick() == {"a": 1}
+
+
+def test_fixed_grid_from_grid():
+    cube = CubeGrid(init_seed=123)
+    cube.add("param", [0, 1], space="real")
+
+    grid = FixedGrid.from_grid(cube, 10)
+
+    assert len(grid) == 10
+    assert len(set(map(get_hpo_key, grid.configurations))) == 10
+
+
+def test_fixed_grid_from_grid_deduplicate():
+    cube = CubeGrid(init_seed=123)
+    cube.add("param", ("a", "b"), space="cat")
+
+    with pytest.warns(UserWarning):
+        grid = FixedGrid.from_grid(cube, 5)
+
+    assert len(grid) == 2
+    assert len(FixedGrid.from_grid(cube, 5, deduplicate=False)) == 5
+
+
+def test_cube_grid_pick_batch():
+    n = 10_000
+    grid = CubeGrid(init_seed=123)
+    grid.add("real", [0, 1], space="real")
+    grid.add("log", [1, 2], space="real", distribution="loguniform")
+    grid.add("int", [0, 2], space="int")
+    grid.add("cat", ("a", "b"), space="cat")
+    grid.add("fixed", "c", space="cat")
+
+    batch = grid.pick_batch(n)
+
+    assert batch.shape == (n, 5)
+    assert batch["real"].between(0, 1).all()
+    assert np.abs(batch["real"].mean() - 0.5) < 1e-2
+    assert np.abs(batch["log"].mean() - 1 / np.log(2)) < 1e-1
+    assert set(batch["int"]) == {0, 1, 2}
+    assert set(batch["cat"]) == {"a", "b"}
+    assert (batch["fixed"] == "c").all()
+
+
+def test_cube_grid_copy_has_own_rng():
+    grid = CubeGrid(init_seed=123)
+    grid.add("param", [0, 1], space="real")
+    grid_copy = deepcopy(grid)
+
+    assert grid.pick() == grid_copy.pick()
+    assert grid.pick_batch(5).equals(grid_copy.pick_batch(5))
+
+
+def test_cond_grid_pick_batch(logistic_grid):
+    batch = logistic_grid.pick_batch(1000)
+
+    is_liblinear = batch["solver"] == "liblinear"
+    assert (batch.loc[is_liblinear, "penalty"] == "l1").all()
+    assert (batch.loc[~is_liblinear, "penalty"] == "l2").all()
+    assert batch["C"].between(0.001, 100).all()
+
+
+def test_cond_grid_pick_batch_missing_values():
+    grid_1 = CubeGrid()
+    grid_1.add("param_1", [0, 1], space="real")
+
+    grid_2 = CubeGrid()
+    grid_2.add("param_2", [1, 2], space="int")
+
+    cond_grid = ConditionalGrid()
+    cond_grid.add_cube(grid_1)
+    cond_grid.add_cube(grid_2, lambda hpo: hpo["param_1"] > 0.5)
+    cond_grid.add_cube(
+        grid_2, lambda hpo: hpo["param_1"] > 0.9 and hpo["param_2"] == 1
+    )
+
+    batch = cond_grid.pick_batch(1000)
+
+    assert batch["param_2"].isna().equals(batch["param_1"] <= 0.5)
+    assert batch["param_2"].dropna().isin([1, 2]).all()
+
+
+def test_cond_grid_pick_batch_wrong_condition():
+    grid_1 = CubeGrid()
+    grid_1.add("param_1", [0, 1], space="real")
+
+    cond_grid = ConditionalGrid(init_seed=123)
+    cond_grid.add_cube(grid_1, lambda hpo: hpo["notExists"] > 0.5)
+
+    with pytest.raises(KeyError):
+        cond_grid.pick_batch(10)
+
+
+def test_cond_grid_pick_batch_key_presence_condition():
+    grid_1 = CubeGrid()
+    grid_1.add("kernel", ("rbf", "linear"), space="cat")
+    grid_2 = CubeGrid()
+    grid_2.add("gamma", [0, 1], space="real")
+    grid_3 = CubeGrid()
+    grid_3.add("coef", 1, space="int")
+
+    cond_grid = ConditionalGrid(init_seed=123)
+    cond_grid.add_cube(grid_1)
+    cond_grid.add_cube(grid_2, lambda hpo: hpo["kernel"] == "rbf")
+    cond_grid.add_cube(grid_3, lambda hpo: "gamma" in hpo)
+
+    def get_keys(hpo):
+        return hpo["kernel"], frozenset(hpo)
+
+    picks = {get_keys(cond_grid.pick()) for _ in range(100)}
+    batch = cond_grid.pick_batch(100)
+    batch_picks = {
+        get_keys({key: value for key, value in row.items() if not pd.isna(value)})
+        for row in batch.to_dict("records")
+    }
+
+    assert batch_picks == picks == {
+        ("rbf", frozenset({"kernel", "gamma", "coef"})),
+        ("linear", frozenset({"kernel"})),
+    }
+
+
+def test_fixed_grid_pick_batch():
+    grid = FixedGrid([{"a": 1}, {"a": 2}, {"a": 3}])
+
+    assert list(grid.pick_batch(2)["a"]) == [1, 2]
+    with pytest.raises(IndexError):
+        grid.pick_batch(2)
+
+
+@pytest.mark.parametrize("sampler", ["sobol", "halton", "lhs"])
+def test_quasi_random_grid(sampler):
+    grid = QuasiRandomGrid(init_seed=123, sampler=sampler)
+    grid.add("real", [0, 1], space="real")
+    grid.add("log", [1, 2], space="real", distribution="loguniform")
+    grid.add("int", [0, 3], space="int")
+    grid.add("cat", ("a", "b"), space="cat")
+    grid.add("fixed", 7, space="int")
+
+    batch = grid.pick_batch(256)
+
+    assert batch["real"].between(0, 1).all()
+    assert batch["log"].between(1, 2).all()
+    # sobol (of 2 ** k points) and lhs are stratified in each dimension, halton
+    # with base of dimension other than 2 only approximately
+    tolerance = 2 if sampler == "halton" else 0
+    int_counts = Counter(batch["int"])
+    cat_counts = Counter(batch["cat"])
+    assert set(int_counts) == {0, 1, 2, 3} and set(cat_counts) == {"a", "b"}
+    assert all(abs(count - 64) <= tolerance for count in int_counts.values())
+    assert all(abs(count - 128) <= tolerance for count in cat_counts.values())
+    assert (batch["fixed"] == 7).all()
+
+    pick = grid.pick()
+    assert set(pick.keys()) == {"real", "log", "int", "cat", "fixed"}
+
+
+def test_quasi_random_grid_more_even_than_random():
+    n = 128
+    quasi_grid = QuasiRandomGrid(init_seed=123)
+    quasi_grid.add("param", [0, 1], space="real")
+    random_grid = CubeGrid(init_seed=123)
+    random_grid.add("param", [0, 1], space="real")
+
+    def max_gap(values):
+        return np.max(np.diff(np.sort(np.concatenate([[0], values, [1]]))))
+
+    quasi_values = np.array([quasi_grid.pick()["param"] for _ in range(n)])
+    random_values = np.array([random_grid.pick()["param"] for _ in range(n)])
+
+    assert max_gap(quasi_values) < 2 / n
+    assert max_gap(quasi_values) < max_gap(random_values)
+
+
+def test_quasi_random_grid_reset_seed():
+    grid = QuasiRandomGrid(init_seed=123, sampler="lhs")
+    grid.add("param_1", [0, 1], space="real")
+    grid.add("param_2", ("a", "b", "c"), space="cat")
+
+    values = [grid.pick() for _ in range(5)]
+    grid.reset_seed()
+
+    assert values == [grid.pick() for _ in range(5)]
+
+
+def test_quasi_random_grid_in_conditional_grid():
+    grid_1 = QuasiRandomGrid(sampler="halton")
+    grid_1.add("param_1", [0, 1], space="real")
+
+    grid_2 = QuasiRandomGrid(sampler="halton")
+    grid_2.add("param_2", 1, space="int")
+
+    cond_grid = ConditionalGrid(init_seed=123)
+    cond_grid.add_cube(grid_1)
+    cond_grid.add_cube(grid_2, lambda hpo: hpo["param_1"] > 0.5)
+
+    for _ in range(10):
+        pick = cond_grid.pick()
+        assert ("param_2" in pick) == (pick["param_1"] > 0.5)
+
+
+def test_quasi_random_grid_wrong_sampler():
+    with pytest.raises(ValueError):
+        QuasiRandomGrid(sampler="notExists")
+
+
+@pytest.mark.parametrize("sampler", ["sobol", "lhs"])
+def test_grid_state(sampler):
+    cube = CubeGrid(init_seed=1)
+    cube.add("a", [0.0, 1.0], "real")
+    quasi = QuasiRandomGrid(init_seed=1, sampler=sampler, block_size=4)
+    quasi.add("a", [0.0, 1.0], "real")
+    conditional = ConditionalGrid(init_seed=1)
+    conditional.add_cube(deepcopy(cube))
+
+    for grid in (cube, quasi, conditional):
+        grid.pick()
+        state = grid.get_state()
+        expected = [grid.pick() for _ in range(6)]
+        grid.set_state(state)
+
+        assert [grid.pick() for _ in range(6)] == expected
+
+
+@pytest.mark.parametrize("sampler", ["sobol", "halton", "lhs"])
+def test_quasi_random_grid_copy_before_first_pick(sampler):
+    grid = QuasiRandomGrid(init_seed=1, sampler=sampler, block_size=4)
+    grid.add("a", [0.0, 10.0], "real")
+    grid_copies = [deepcopy(grid), deepcopy(grid)]
+    state = grid.get_state()
+
+    expected = [grid.pick()["a"] for _ in range(10)]
+    grid.set_state(state)
+
+    assert [grid.pick()["a"] for _ in range(10)] == expected
+    for grid_copy in grid_copies:
+        assert [grid_copy.pick()["a"] for _ in range(10)] == expected
@@ -0,0 +1,109 @@
+import numpy as np
+
+from meta_tuner.searchers.search_results import _SearchResults
+
+
+def test_search_results_get_results():
+    results = _SearchResults(capacity=2)
+    for i in range(5):
+        results.add("scores", [i, i + 1])
+        results.add("hpo", {"C": 0.1 * i, "penalty": "l2"})
+        results.add("mean_score", i + 0.5)
+
+    view = results.get_results()
+
+    assert len(results) == 5
+    assert set(view.keys()) == {"scores", "hpo", "mean_score"}
+    assert list(view["mean_score"]) == [0.5, 1.5, 2.5, 3.5, 4.5]
+    assert list(view["scores"][2]) == [2, 3]
+    assert view["hpo"][3] == {"C": 0.1 * 3, "penalty": "l2"}
+    assert isinstance(view["hpo"][3]["C"], float)
+
+
+def test_search_results_view_is_live():
+    results = _SearchResults()
+    view = results.get_results()
+    results.add("mean_score", 1.0)
+    results.add("mean_score", 2.0)
+
+    assert len(view["mean_score"]) == 2
+
+
+def test_search_results_ragged_scores():
+    results = _SearchResults()
+    results.add("scores", [1.0])
+    results.add("scores", [1.0, 2.0, 3.0])
+
+    arr = results.to_numpy("scores")
+
+    assert arr.shape == (2, 3)
+    assert np.isnan(arr[0, 1:]).all()
+    assert [len(scores) for scores in results.get_results()["scores"]] == [1, 3]
+
+
+def test_search_results_missing_hpo():
+    results = _SearchResults()
+    results.add("hpo", {"C": 1.0})
+    results.add("hpo", {"C": 2.0, "l1_ratio": 0.5})
+    results.add("hpo", {"C": 3.0})
+
+    columns = results.to_numpy("hpo")
+
+    assert results.get_results()["hpo"] == [
+        {"C": 1.0},
+        {"C": 2.0, "l1_ratio": 0.5},
+        {"C": 3.0},
+    ]
+    assert list(columns["l1_ratio"].mask) == [True, False, True]
+    assert columns["C"].dtype == np.float64
+
+
+def test_search_results_mixed_types():
+    results = _SearchResults()
+    results.add("hpo", {"x": 1})
+    results.add("hpo", {"x": "a"})
+    results.add("hpo", {"x": (1, 2)})
+
+    assert [hpo["x"] for hpo in results.get_results()["hpo"]] == [1, "a", (1, 2)]
+
+
+def test_search_results_numeric_promotion():
+    results = _SearchResults()
+    results.add("hpo", {"C": 1})
+    results.add("hpo", {"C": 0.5})
+    results.add("mean_score", 1)
+    results.add("mean_score", 0.5)
+
+    assert results.to_numpy("hpo")["C"].dtype == np.float64
+    assert results.to_frame()["C"].dtype == np.float64
+    assert results.to_numpy("mean_score").dtype == np.float64
+    assert list(results.to_numpy("mean_score")) == [1.0, 0.5]
+
+
+def test_search_results_zero_copy():
+    results = _SearchResults()
+    results.reserve(10)
+    for i in range(10):
+        results.add("mean_score", float(i))
+
+    arr_1 = results.to_numpy("mean_score")
+    arr_2 = results.to_numpy("mean_score")
+
+    assert np.shares_memory(arr_1, arr_2)
+
+
+def test_search_results_to_frame():
+    results = _SearchResults()
+    results.add("scores", [1.0, 2.0])
+    results.add("hpo", {"C": 1.0})
+    results.add("mean_score", 1.5)
+    results.add("scores", [3.0, 4.0])
+    results.add("hpo", {"C": 2.0, "l1_ratio": 0.5})
+    results.add("mean_score", 3.5)
+
+    df = results.to_frame()
+
+    assert list(df.columns) == ["scores_0", "scores_1", "C", "l1_ratio", "mean_score"]
+    assert df.shape == (2, 5)
+    assert np.isnan(df["l1_ratio"].iloc[0])
+    assert df["scores_1"].iloc[1] == 4.0
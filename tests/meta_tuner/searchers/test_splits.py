@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from meta_tuner.searchers.splits import CVSplitPlan
+
+
+def test_split_plan_partition():
+    size = 103
+    plan = CVSplitPlan.create(size, cv=5, seed=123)
+    tests = np.concatenate([test for _, test in plan])
+
+    assert len(plan) == 5
+    assert np.array_equal(np.sort(tests), np.arange(size))
+    for train, test in plan:
+        assert np.intersect1d(train, test).shape[0] == 0
+        assert train.shape[0] + test.shape[0] == size
+        assert test.shape[0] in (20, 21)
+
+
+def test_split_plan_seed():
+    plan_1 = CVSplitPlan.create(100, seed=123)
+    plan_2 = CVSplitPlan.create(100, seed=123)
+
+    assert np.array_equal(plan_1.order, plan_2.order)
+    assert plan_1.order.dtype == np.int32
+
+
+def test_split_plan_stratified():
+    y = pd.Series(["a"] * 80 + ["b"] * 20)
+    plan = CVSplitPlan.create(100, cv=4, y=y, seed=123)
+
+    for _, test in plan:
+        assert (y.iloc[test] == "b").sum() == 5
+
+
+def test_split_plan_save_load(new_dir):
+    new_dir.mkdir()
+    path = new_dir / "plan.npy"
+    plan = CVSplitPlan.create(50, cv=3, seed=123)
+    plan.save(path)
+
+    loaded_plan = CVSplitPlan.load(path)
+
+    assert isinstance(loaded_plan.order, np.memmap)
+    for (train, test), (train_, test_) in zip(plan, loaded_plan):
+        assert np.array_equal(train, train_)
+        assert np.array_equal(test, test_)
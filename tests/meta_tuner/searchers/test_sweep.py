@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score
+
+from meta_tuner.data.datasets import PandasDatasets
+from meta_tuner.extractors.tunability import TunabilityExtractor
+from meta_tuner.searchers.preprocessors import wrap_model_with_preprocessing
+from meta_tuner.searchers.search_grid import FixedGrid
+from meta_tuner.searchers.sweep import TunabilitySweep
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_sweep_run(pandas_datasets, naive_logistic_grid, n_jobs):
+    datasets = PandasDatasets(pandas_datasets[0:2], pandas_datasets.datasets_names[:2])
+    model = wrap_model_with_preprocessing(LogisticRegression())
+
+    sweep = TunabilitySweep(model, naive_logistic_grid)
+    search_results = sweep.run(
+        datasets, accuracy_score, n_iter=2, cv=2, n_jobs=n_jobs, backend="thread"
+    )
+
+    assert len(search_results) == 2
+    for search_result in search_results:
+        assert len(search_result["mean_score"]) == 2
+        assert all(len(scores) == 2 for scores in search_result["scores"])
+        assert search_result["hpo"] == search_results[0]["hpo"]
+        assert np.isclose(search_result["mean_score"][0], np.mean(search_result["scores"][0]))
+
+
+def test_sweep_results_consumed_by_tunability(lazy_datasets, naive_logistic_grid):
+    model = wrap_model_with_preprocessing(LogisticRegression())
+
+    sweep = TunabilitySweep(model, naive_logistic_grid)
+    sweep.run(lazy_datasets, accuracy_score, n_iter=2, cv=2, n_jobs=2)
+
+    extractor = TunabilityExtractor(sweep.search_results, lowest_best=False)
+    extractor.extract_default_hpo()
+
+    assert len(extractor.extract_gains()) == len(lazy_datasets)
+
+
+def test_sweep_with_fixed_grid(pandas_datasets):
+    datasets = PandasDatasets(pandas_datasets[0:2], pandas_datasets.datasets_names[:2])
+    model = wrap_model_with_preprocessing(LogisticRegression())
+    grid = FixedGrid([{"solver": "liblinear"}, {"solver": "lbfgs"}])
+
+    sweep = TunabilitySweep(model, grid)
+    search_results = sweep.run(datasets, accuracy_score, cv=2, n_jobs=1)
+
+    for search_result in search_results:
+        assert search_result["hpo"] == grid.configurations
@@ -0,0 +1,200 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+
+from copy import deepcopy
+from functools import partial
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, f1_score
+
+from meta_tuner.searchers.trial_cache import TrialCache
+from meta_tuner.searchers.hpo_searchers import RandomSearch
+from meta_tuner.searchers.search_grid import CubeGrid
+from meta_tuner.searchers.splits import CVSplitPlan
+from meta_tuner.searchers.budget import SearchBudget
+
+
+def test_trial_cache_put_get(tmp_path):
+    cache = TrialCache(tmp_path)
+    fold = (np.arange(5), np.arange(5, 8))
+    fingerprint = cache.get_fingerprint(pd.DataFrame({"a": [1, 2, 3]}))
+    key = cache.get_key(fingerprint, LogisticRegression(), {"C": 1.0}, fold, accuracy_score)
+
+    assert cache.get(key) is None
+    cache.put(key, (0.5, 1.0, 0.1))
+
+    assert cache.get(key) == (0.5, 1.0, 0.1)
+    assert cache.hits == 1 and cache.misses == 1
+
+
+def test_trial_cache_key(tmp_path):
+    cache = TrialCache(tmp_path)
+    fold = (np.arange(5), np.arange(5, 8))
+    model = LogisticRegression()
+    key = cache.get_key("abc", model, {"C": 1.0}, fold, accuracy_score)
+
+    assert key == cache.get_key("abc", model, {"C": np.float64(1.0)}, fold, accuracy_score)
+    assert key != cache.get_key("abd", model, {"C": 1.0}, fold, accuracy_score)
+    assert key != cache.get_key("abc", LogisticRegression(tol=1), {"C": 1.0}, fold, accuracy_score)
+    assert key != cache.get_key("abc", model, {"C": 2.0}, fold, accuracy_score)
+    assert key != cache.get_key("abc", model, {"C": 1.0}, fold[::-1], accuracy_score)
+
+
+def test_trial_cache_fingerprint():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df_changed = df.copy()
+    df_changed.loc[1, "a"] = 4
+
+    assert TrialCache.get_fingerprint(df) == TrialCache.get_fingerprint(df.copy())
+    assert TrialCache.get_fingerprint(df) != TrialCache.get_fingerprint(df_changed)
+
+
+def test_trial_cache_lru_eviction(tmp_path):
+    cache = TrialCache(tmp_path)
+    for i in range(3):
+        cache.put(f"{i:064x}", (float(i), 0.0, 0.0))
+    entry_size = next(tmp_path.glob("*/*.pkl")).stat().st_size
+
+    for i in range(3):
+        path = next(tmp_path.glob(f"*/{i:064x}.pkl"))
+        os.utime(path, (i, i))
+    os.utime(next(tmp_path.glob(f"*/{0:064x}.pkl")), (10, 10))
+
+    cache = TrialCache(tmp_path, max_size=3 * entry_size)
+    cache.put(f"{3:064x}", (3.0, 0.0, 0.0))
+
+    assert cache.get(f"{1:064x}") is None
+    assert cache.get(f"{0:064x}") == (0.0, 0.0, 0.0)
+    assert cache.get(f"{3:064x}") == (3.0, 0.0, 0.0)
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 3
+
+
+def test_random_search_trial_cache(test_datasets, tmp_path):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, [-1]]
+    grid = CubeGrid(init_seed=1)
+    grid.add("C", [0.01, 10.0], "real", "loguniform")
+    plan = CVSplitPlan.create(X.shape[0], 3, seed=1)
+
+    search_1 = RandomSearch(LogisticRegression(), deepcopy(grid))
+    search_1.search(
+        X, y, accuracy_score, n_iter=3, split_plan=plan, trial_cache=TrialCache(tmp_path)
+    )
+    cache = TrialCache(tmp_path)
+    search_2 = RandomSearch(LogisticRegression(), deepcopy(grid))
+    search_2.search(
+        X,
+        y,
+        accuracy_score,
+        n_iter=3,
+        split_plan=plan,
+        n_jobs=2,
+        backend="thread",
+        trial_cache=cache,
+    )
+
+    assert cache.hits == 9 and cache.misses == 0
+    assert np.array_equal(
+        search_1._search_results.to_numpy("scores"),
+        search_2._search_results.to_numpy("scores"),
+    )
+
+
+def test_trial_cache_key_scoring(tmp_path):
+    cache = TrialCache(tmp_path)
+    fold = (np.arange(5), np.arange(5, 8))
+    model = LogisticRegression()
+
+    def get_key(scoring):
+        return cache.get_key("abc", model, {"C": 1.0}, fold, scoring)
+
+    def get_threshold_scoring(threshold):
+        return lambda y, y_hat: accuracy_score(y, y_hat) > threshold
+
+    assert get_key(lambda y, y_hat: accuracy_score(y, y_hat)) != get_key(
+        lambda y, y_hat: 1 - accuracy_score(y, y_hat)
+    )
+    assert get_key(get_threshold_scoring(0.5)) == get_key(get_threshold_scoring(0.5))
+    assert get_key(get_threshold_scoring(0.5)) != get_key(get_threshold_scoring(0.6))
+    assert get_key(partial(f1_score, average="macro")) == get_key(
+        partial(f1_score, average="macro")
+    )
+    assert get_key(partial(f1_score, average="macro")) != get_key(
+        partial(f1_score, average="micro")
+    )
+
+    class _Scoring:
+        def __call__(self, y, y_hat):
+            return 0.0
+
+    assert cache.describe_callable(_Scoring()) is None
+    with pytest.raises(ValueError):
+        get_key(_Scoring())
+
+
+def test_trial_cache_overwrite_size(tmp_path):
+    cache = TrialCache(tmp_path, max_size=10**6)
+    for i in range(3):
+        cache.put(f"{0:064x}", (float(i), 0.0, 0.0))
+        cache.put(f"{1:064x}", (float(i), 0.0, 0.0))
+
+    assert cache.size == sum(path.stat().st_size for path in tmp_path.glob("*/*.pkl"))
+
+
+def test_random_search_trial_cache_lambda_scoring(test_datasets, tmp_path):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, [-1]]
+    grid = CubeGrid(init_seed=1)
+    grid.add("C", [0.01, 10.0], "real", "loguniform")
+    plan = CVSplitPlan.create(X.shape[0], 3, seed=1)
+
+    scores = []
+    for scoring in (
+        lambda y, y_hat: accuracy_score(y, y_hat),
+        lambda y, y_hat: 1 - accuracy_score(y, y_hat),
+    ):
+        search = RandomSearch(LogisticRegression(), deepcopy(grid))
+        search.search(
+            X, y, scoring, n_iter=2, split_plan=plan, trial_cache=TrialCache(tmp_path)
+        )
+        scores.append(search._search_results.to_numpy("mean_score"))
+
+    assert np.allclose(scores[0], 1 - scores[1])
+    assert len(list(tmp_path.glob("*/*.pkl"))) == 12
+
+    class _Scoring:
+        def __call__(self, y, y_hat):
+            return accuracy_score(y, y_hat)
+
+    cache = TrialCache(tmp_path)
+    search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    with pytest.warns(UserWarning, match="trial cache is not used"):
+        search.search(X, y, _Scoring(), n_iter=2, split_plan=plan, trial_cache=cache)
+    assert cache.hits == 0 and cache.misses == 0
+
+
+def test_random_search_trial_cache_budget(test_datasets, tmp_path):
+    dataset = test_datasets[0]
+    X, y = dataset.iloc[:, :-1].select_dtypes("number"), dataset.iloc[:, [-1]]
+    grid = CubeGrid(init_seed=1)
+    grid.add("C", [0.01, 10.0], "real", "loguniform")
+    plan = CVSplitPlan.create(X.shape[0], 3, seed=1)
+
+    search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    search.search(
+        X, y, accuracy_score, n_iter=3, split_plan=plan, trial_cache=TrialCache(tmp_path)
+    )
+    search = RandomSearch(LogisticRegression(), deepcopy(grid))
+    search.search(
+        X,
+        y,
+        accuracy_score,
+        n_iter=5,
+        split_plan=plan,
+        budget=SearchBudget(max_fits=3),
+        trial_cache=TrialCache(tmp_path),
+    )
+
+    # three cached trials and one trial with three fits
+    assert len(search.search_results["mean_score"]) == 4